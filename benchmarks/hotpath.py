@@ -0,0 +1,458 @@
+# benchmarks/hotpath.py
+# KLAVA — Keystroke hot-path benchmarks
+#
+# გამოყენება:
+#   python -m benchmarks.hotpath                 — გაშვება და baseline-თან შედარება
+#   python -m benchmarks.hotpath --save          — შედეგის შენახვა baseline-ად
+#   python -m benchmarks.hotpath --full          — კორპუსები 10M ხაზამდე
+#   python -m benchmarks.hotpath -k canvas       — მხოლოდ სახელით გაფილტრული
+#
+# exit code 1 — თუ რომელიმე შედეგი baseline-ზე `--threshold`-ზე მეტად გაუარესდა.
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from exercises.passage import PassageExercise
+from exercises.typing import TypingExercise
+from logic.compiled_corpus import CompiledCorpus, compile_corpus
+from logic.engine import TypingEngine
+from logic.layouts import DEFAULT_LAYOUT, load_layout
+from logic.scoring import EditScorer
+from ui.canvas import Canvas
+from ui.headless import (
+    HeadlessCanvas,
+    HeadlessEvent,
+    HeadlessMenu,
+    HeadlessPhotoImage,
+    HeadlessRoot,
+)
+from ui.keyboard import KEYBOARD, Keyboard
+from ui.sprites import SpriteAtlas
+
+BENCH_DIR: str = os.path.dirname(os.path.abspath(__file__))
+BASELINE_FILE: str = os.path.join(BENCH_DIR, "baseline.json")
+
+CORPUS_SIZES: Tuple[int, ...] = (1_000, 10_000, 100_000)
+CORPUS_SIZES_FULL: Tuple[int, ...] = (1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+SHORT_LINE: str = "THE QUICK BROWN FOX"
+LONG_LINE: str = " ".join(["PACK MY BOX WITH FIVE DOZEN LIQUOR JUGS"] * 125)  # ~5000
+PASSAGE: str = " ".join(["PACK MY BOX WITH FIVE DOZEN LIQUOR JUGS"] * 5000)  # ~200000
+PASSAGE_PERIOD: int = 40
+
+# სახელი → (ფუნქცია, ოპერაციების რაოდენობა ერთ გამოძახებაში)
+Bench = Callable[[], None]
+_REGISTRY: Dict[str, Callable[[], Tuple[Bench, int]]] = {}
+
+
+def bench(name: str):
+    """ბენჩმარკის რეგისტრაცია. ფუნქცია აბრუნებს (გასაზომი callable, ops)."""
+
+    def wrap(factory: Callable[[], Tuple[Bench, int]]):
+        _REGISTRY[name] = factory
+        return factory
+
+    return wrap
+
+
+# ======================================================
+#   FIXTURES
+# ======================================================
+def _headless_ui(sprites: bool = False) -> Tuple[HeadlessCanvas, Canvas, Keyboard]:
+    canvas = HeadlessCanvas()
+    root = HeadlessRoot(canvas.loop)
+    ui = Canvas(root, canvas=canvas)  # type: ignore[arg-type]
+    atlas = SpriteAtlas(factory=HeadlessPhotoImage) if sprites else None
+    keyboard = Keyboard(canvas, ui.width, ui.height, render=ui.render, atlas=atlas)  # type: ignore[arg-type]
+    keyboard.animator.clock = lambda: canvas.loop.now_ms / 1000.0
+    return canvas, ui, keyboard
+
+
+def _events_for(line: str) -> List[HeadlessEvent]:
+    return [HeadlessEvent("space" if ch == " " else ch.lower()) for ch in line]
+
+
+# ======================================================
+#   TypingEngine
+# ======================================================
+@bench("engine.hit")
+def _engine_hit():
+    line = SHORT_LINE
+
+    engine = TypingEngine(line)
+
+    def run() -> None:
+        engine.reset(line)
+        for ch in line:
+            engine.hit(ch)
+
+    return run, len(line)
+
+
+@bench("engine.feed")
+def _engine_feed():
+    # ყოველ მეხუთე სიმბოლოზე ჯერ არასწორი კლავიში — ციკლის გზა, არა startswith
+    line = SHORT_LINE
+    keys = []
+    for i, ch in enumerate(line):
+        if i % 5 == 0:
+            keys.append("#")
+        keys.append(ch)
+    engine = TypingEngine(line)
+
+    def run() -> None:
+        engine.reset(line)
+        engine.feed(keys)
+
+    return run, len(keys)
+
+
+@bench("engine.current_char")
+def _engine_current_char():
+    engine = TypingEngine(SHORT_LINE)
+    n = 1000
+
+    def run() -> None:
+        current = engine.current_char
+        for _ in range(n):
+            current()
+
+    return run, n
+
+
+# ======================================================
+#   EditScorer (free typing)
+# ======================================================
+@bench("scoring.type")
+def _scoring_type():
+    scorer = EditScorer()
+    # ~5% შეცდომა: ყოველი მე-20 სიმბოლო — არასწორი + backspace
+    keys = list(LONG_LINE[:80])
+
+    def run() -> None:
+        scorer.reset(LONG_LINE[:80])
+        for i, ch in enumerate(keys):
+            if i % 20 == 19:
+                scorer.type("Q")
+                scorer.backspace()
+            scorer.type(ch)
+
+    return run, len(keys) + 2 * (len(keys) // 20)
+
+
+# ======================================================
+#   TypingExercise.on_key (keysym → განლაგების ცხრილი)
+# ======================================================
+@bench("exercise.on_key.correct")
+def _exercise_correct():
+    canvas, ui, keyboard = _headless_ui()
+    exercise = TypingExercise(ui, keyboard, SHORT_LINE)
+    events = _events_for(SHORT_LINE)
+
+    def run() -> None:
+        exercise.reset(SHORT_LINE)
+        exercise.start()
+        for e in events:
+            exercise.on_key(e)
+        ui.render.flush()
+
+    return run, len(events)
+
+
+@bench("exercise.on_key.wrong")
+def _exercise_wrong():
+    canvas, ui, keyboard = _headless_ui()
+    exercise = TypingExercise(ui, keyboard, SHORT_LINE)
+    exercise.start()
+    events = [HeadlessEvent("z")] * 100
+
+    def run() -> None:
+        for e in events:
+            exercise.on_key(e)
+        ui.render.flush()
+        canvas.loop.advance(1000)
+
+    return run, len(events)
+
+
+@bench("exercise.on_key.ignored")
+def _exercise_ignored():
+    canvas, ui, keyboard = _headless_ui()
+    exercise = TypingExercise(ui, keyboard, SHORT_LINE)
+    exercise.start()
+    events = [HeadlessEvent("Shift_L")] * 100
+
+    def run() -> None:
+        for e in events:
+            exercise.on_key(e)
+
+    return run, len(events)
+
+
+@bench("exercise.passage.on_key")
+def _exercise_passage():
+    canvas, ui, keyboard = _headless_ui()
+    exercise = PassageExercise(ui, keyboard, PASSAGE)
+    exercise.start()
+    # ტექსტი პერიოდულია — ერთი პერიოდის event-ები ყველა პოზიციას ფარავს
+    events = _events_for(PASSAGE[:PASSAGE_PERIOD])
+    n = 100
+
+    def run() -> None:
+        if exercise.pos + n >= len(exercise.text):
+            exercise.reset(PASSAGE)
+            exercise.start()
+        for _ in range(n):
+            exercise.on_key(events[exercise.pos % PASSAGE_PERIOD])
+        ui.render.flush()
+
+    return run, n
+
+
+# ======================================================
+#   Keyboard
+# ======================================================
+@bench("keyboard.set_target")
+def _keyboard_set_target():
+    canvas, ui, keyboard = _headless_ui()
+    keys = [ch for row in KEYBOARD for ch in row]
+
+    def run() -> None:
+        for k in keys:
+            keyboard.set_target(k)
+        ui.render.flush()
+
+    return run, len(keys)
+
+
+def _highlight(sprites: bool):
+    canvas, ui, keyboard = _headless_ui(sprites)
+    keys = [ch for row in KEYBOARD for ch in row]
+
+    def run() -> None:
+        for k in keys:
+            keyboard.highlight_correct(k)
+            keyboard.highlight_wrong(k)
+        ui.render.flush()
+        canvas.loop.advance(1000)
+
+    return run, 2 * len(keys)
+
+
+@bench("keyboard.highlight")
+def _keyboard_highlight():
+    return _highlight(False)
+
+
+@bench("keyboard.highlight.sprite")
+def _keyboard_highlight_sprite():
+    return _highlight(True)
+
+
+@bench("sprites.rasterize")
+def _sprites_rasterize():
+    atlas = SpriteAtlas(factory=lambda w, h: _NullImage())
+    n = 0
+
+    def run() -> None:
+        nonlocal n
+        n += 1
+        atlas.begin(n)
+        atlas.get(137, 98, 18, "#fff3c4", "#fdd835")
+
+    return run, 1
+
+
+class _NullImage:
+    """PhotoImage, რომელიც put-ს უგულებელყოფს (იზომება მხოლოდ rasterize)."""
+
+    def put(self, data: str, to: Tuple[int, ...] = (0, 0)) -> None:
+        pass
+
+
+# ======================================================
+#   Canvas.draw_sentence
+# ======================================================
+def _draw_sentence(line: str):
+    canvas, ui, keyboard = _headless_ui()
+    other = line[::-1]
+    state = [False]
+
+    def run() -> None:
+        state[0] = not state[0]
+        ui.draw_sentence(line if state[0] else other)
+        ui.render.flush()
+
+    return run, 1
+
+
+@bench("canvas.draw_sentence.short")
+def _draw_short():
+    return _draw_sentence(SHORT_LINE)
+
+
+@bench("canvas.draw_sentence.long")
+def _draw_long():
+    return _draw_sentence(LONG_LINE)
+
+
+# ======================================================
+#   Trainer._load_sentences
+# ======================================================
+def _corpus_file(lines: int) -> str:
+    """სინთეზური კორპუსი (ქეშირდება დროებით დირექტორიაში) + კომპილაცია."""
+    directory = os.path.join(tempfile.gettempdir(), "klava-bench")
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"corpus-{lines}.txt")
+
+    if not os.path.exists(path):
+        rng = random.Random(lines)
+        words = SHORT_LINE.split() + LONG_LINE.split()[:8]
+        tmp = path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for _ in range(lines):
+                f.write(" ".join(rng.choice(words) for _ in range(5)) + "\n")
+        os.replace(tmp, path)
+
+    layout = load_layout(DEFAULT_LAYOUT)
+    if CompiledCorpus.open_for(path, layout) is None:
+        compile_corpus(path, layout)
+    return path
+
+
+def _load_sentences(lines: int):
+    from diagnostics.replay import HeadlessTrainer
+
+    trainer = HeadlessTrainer()
+    trainer.sentence_file = _corpus_file(lines)
+
+    def run() -> None:
+        corpus = trainer.corpus
+        if corpus is not None:
+            corpus.close()
+            trainer.corpus = None
+        sentences = trainer._load_sentences()
+        sentences[len(sentences) - 1]
+
+    return run, 1
+
+
+def _register_corpus_benches(sizes: Sequence[int]) -> None:
+    for n in sizes:
+        _REGISTRY[f"trainer.load_sentences.{n}"] = (lambda n=n: _load_sentences(n))
+
+
+# ======================================================
+#   RUNNER
+# ======================================================
+def measure(factory: Callable[[], Tuple[Bench, int]], min_time: float = 0.2, repeat: int = 5) -> Dict[str, float]:
+    """
+    აბრუნებს ns/op-ს: `repeat` გაზომვიდან საუკეთესო, თითოეული ≥ min_time/repeat.
+    """
+    run, ops = factory()
+    run()  # warm-up
+
+    loops = 1
+    while True:
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            run()
+        dt = time.perf_counter() - t0
+        if dt >= min_time / repeat or loops >= 1 << 20:
+            break
+        loops *= 2
+
+    best = dt
+    for _ in range(repeat - 1):
+        t0 = time.perf_counter()
+        for _ in range(loops):
+            run()
+        best = min(best, time.perf_counter() - t0)
+
+    return {"ns_per_op": round(best / (loops * ops) * 1e9, 1), "loops": loops, "ops": ops}
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> List[str]:
+    """აბრუნებს რეგრესიების აღწერებს."""
+    regressions = []
+    for name, res in results.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+        ratio = res["ns_per_op"] / base["ns_per_op"] if base["ns_per_op"] else 1.0
+        res["vs_baseline"] = round(ratio, 3)
+        if ratio > 1.0 + threshold:
+            regressions.append(
+                f"{name}: {res['ns_per_op']} ns/op vs {base['ns_per_op']} (x{ratio:.2f})"
+            )
+    return regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KLAVA hot-path benchmarks")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--save", action="store_true", help="შედეგის შენახვა baseline-ად")
+    parser.add_argument("--threshold", type=float, default=0.25, help="დასაშვები გაუარესება (0.25 = 25%%)")
+    parser.add_argument("--full", action="store_true", help="კორპუსები 10M ხაზამდე")
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("-k", dest="pattern", default="", help="სახელის ფილტრი")
+    args = parser.parse_args(argv)
+
+    _register_corpus_benches(CORPUS_SIZES_FULL if args.full else CORPUS_SIZES)
+
+    results: Dict[str, Dict[str, float]] = {}
+    for name, factory in _REGISTRY.items():
+        if args.pattern and args.pattern not in name:
+            continue
+        results[name] = measure(factory, args.min_time)
+        print(f"{name:<36} {results[name]['ns_per_op']:>14,.1f} ns/op")
+
+    baseline: Dict[str, Dict[str, float]] = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f).get("results", {})
+
+    regressions = compare(results, baseline, args.threshold)
+
+    if args.save:
+        merged = {**baseline, **results}
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "meta": {
+                        "python": platform.python_version(),
+                        "machine": platform.machine(),
+                        "node": platform.node(),
+                        "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                    },
+                    "results": merged,
+                },
+                f,
+                indent=2,
+                ensure_ascii=False,
+            )
+        print(f"baseline შენახულია: {args.baseline}")
+
+    if regressions:
+        print("\nREGRESSIONS:", file=sys.stderr)
+        for r in regressions:
+            print("  " + r, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
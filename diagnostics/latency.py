@@ -0,0 +1,206 @@
+# diagnostics/latency.py
+# KLAVA — Keystroke latency instrumentation (opt-in)
+# Tk event → TypingExercise → Keyboard → Canvas → შემდეგი idle/paint
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from logic.quantiles import QuantileSketch
+
+# ── ეტაპები (კლავიშის გზის მიხედვით) ────────────────
+STAGES: Tuple[str, ...] = (
+    "queue",  # Tk event → შეყვანის რიგიდან ამოღება (batch კადრში)
+    "trainer",  # Trainer.on_key → TypingExercise.on_key
+    "exercise",  # შეფასების ლოგიკა
+    "keyboard",  # Keyboard.highlight_correct / highlight_wrong
+    "canvas",  # Canvas.mark_letter
+    "handled",  # დანარჩენი on_key (მაგ. ახალი სტრიქონის ჩატვირთვა)
+    "paint",  # on_key-ის დასრულება → შემდეგი idle (Tk redraw)
+    "total",  # Tk event → paint
+)
+
+
+class LatencyHistogram(QuantileSketch):
+    """
+    დაყოვნების histogram — QuantileSketch მილიწამიანი ანგარიშით.
+
+    ფიქსირებული მეხსიერება; p50/p95/p99 ~2.5% ფარდობითი ცდომილებით.
+    """
+
+    __slots__ = ()
+
+    def __init__(self) -> None:
+        super().__init__(alpha=0.025, max_bins=1024, min_value=1e-6)
+
+    def percentile(self, q: float) -> float:
+        """
+        აბრუნებს q-ურ პერცენტილს მილიწამებში (q ∈ [0, 100]).
+        """
+        return self.quantile(q / 100.0) * 1000.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(max(self.max, 0.0) * 1000.0, 3),
+        }
+
+
+class LatencyProbe:
+    """
+    კლავიშის დაყოვნების გამზომი.
+
+    გამორთულ მდგომარეობაში ყველა მეთოდი მაშინვე ბრუნდება,
+    ამიტომ hot path-ში მისი გამოძახება პრაქტიკულად უფასოა.
+
+    გამოყენება:
+        t = probe.stamp()      — Tk event-ის მიღებისას (რიგში ჩადებამდე)
+        probe.begin(t)         — რიგიდან ამოღებისას
+        probe.mark("stage")    — ყოველი ეტაპის ბოლოს
+        probe.end(after_idle)  — on_key-ის ბოლოს; paint იზომება idle-ზე
+        probe.dump()           — სესიის ბოლოს (JSON ხაზი ფაილში)
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.path: Optional[str] = None
+        self.clock: Callable[[], float] = time.perf_counter
+
+        self.histograms: Dict[str, LatencyHistogram] = {
+            s: LatencyHistogram() for s in STAGES
+        }
+
+        self._t0: Optional[float] = None
+        self._last: float = 0.0
+        self._pending: List[Tuple[str, float]] = []
+
+    # ======================================================
+    #   ჩართვა / გამორთვა
+    # ======================================================
+    def enable(self, path: str) -> None:
+        """ჩართვა; შედეგები დაემატება `path` ფაილს (JSON lines)."""
+        self.enabled = True
+        self.path = path
+        self.reset()
+
+    def disable(self) -> None:
+        self.enabled = False
+        self._t0 = None
+
+    def reset(self) -> None:
+        for h in self.histograms.values():
+            h.__init__()
+        self._t0 = None
+        self._pending.clear()
+
+    # ======================================================
+    #   HOT PATH
+    # ======================================================
+    def stamp(self) -> float:
+        """event-ის მიღების დრო probe-ის საათით (გამორთულზე — 0.0)."""
+        return self.clock() if self.enabled else 0.0
+
+    def begin(self, t0: Optional[float] = None) -> None:
+        """
+        ახალი კლავიშის აღრიცხვის დაწყება.
+
+        :param t0: event-ის მიღების დრო (`stamp()`); მოცემულისას იზომება "queue"
+        """
+        if not self.enabled:
+            return
+        now = self.clock()
+        self._pending.clear()
+        if t0:
+            self._t0 = t0
+            self._last = t0
+            self.mark("queue")
+        else:
+            self._t0 = now
+            self._last = now
+
+    def mark(self, stage: str) -> None:
+        """ეტაპის დასრულება — ინახება დრო წინა mark-იდან."""
+        if self._t0 is None:
+            return
+        now = self.clock()
+        self._pending.append((stage, now - self._last))
+        self._last = now
+
+    def end(self, after_idle: Callable[[Callable[[], None]], object]) -> None:
+        """
+        on_key-ის დასრულება.
+
+        აღირიცხება მხოლოდ ის კლავიშები, რომლებიც სავარჯიშომ შეაფასა.
+        paint-ის დრო იზომება ორმაგი `after_idle`-ით: პირველ idle-ზე
+        RenderScheduler აგზავნის itemconfig-ებს და Tk გეგმავს redraw-ს,
+        მეორე idle სრულდება უკვე redraw-ის შემდეგ.
+        """
+        t0 = self._t0
+        if t0 is None:
+            return
+
+        if not any(stage == "exercise" for stage, _ in self._pending):
+            self._t0 = None
+            self._pending.clear()
+            return
+
+        self.mark("handled")
+        self._t0 = None
+        for stage, dt in self._pending:
+            self.histograms[stage].add(dt)
+        self._pending.clear()
+
+        handled = self._last
+
+        def _painted() -> None:
+            now = self.clock()
+            self.histograms["paint"].add(now - handled)
+            self.histograms["total"].add(now - t0)
+
+        after_idle(lambda: after_idle(_painted))
+
+    # ======================================================
+    #   DUMP
+    # ======================================================
+    def report(self) -> Dict[str, object]:
+        return {
+            "host": socket.gethostname(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "stages": {
+                s: h.summary() for s, h in self.histograms.items() if h.count
+            },
+        }
+
+    def dump(self) -> None:
+        """
+        სესიის შედეგის ჩაწერა ფაილში (ერთი JSON ხაზი) და histogram-ების განულება.
+        ჩაწერის შეცდომა (OSError) იბეჭდება stderr-ში და არ ვრცელდება —
+        დიაგნოსტიკამ სესიის დასრულება არ უნდა შეაჩეროს.
+        """
+        if not self.enabled or self.path is None:
+            return
+        if not any(h.count for h in self.histograms.values()):
+            return
+
+        line = json.dumps(self.report(), ensure_ascii=False) + "\n"
+        self.reset()
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            print(f"KLAVA: latency log ვერ ჩაიწერა ({self.path}): {e}", file=sys.stderr)
+
+
+# მთელი აპლიკაციისთვის ერთი probe
+probe = LatencyProbe()
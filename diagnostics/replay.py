@@ -0,0 +1,229 @@
+# diagnostics/replay.py
+# KLAVA — Headless replay driver for the whole Trainer stack
+#
+# გამოყენება:
+#   python -m diagnostics.replay --sessions 200
+#   python -m diagnostics.replay --record keys.jsonl --max-ops-per-key 12
+#
+# ჩანაწერის ფორმატი (JSON lines): {"keysym": "a", "char": "a", "dt": 120}
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from collections import Counter
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from logic.layouts import keysyms_for
+from trainer import Trainer
+from ui.headless import HeadlessCanvas, HeadlessEvent, HeadlessLoop, HeadlessMenu, HeadlessRoot
+
+# კლავიშებს შორის ვირტუალური ინტერვალი (ms)
+KEY_INTERVAL_MS: int = 120
+
+# (keysym, char, dt_ms)
+KeyStroke = Tuple[str, str, int]
+
+
+def keysym_for(ch: str) -> str:
+    """სიმბოლო → Tk keysym (ლათინური ასოები პატარა ასოთი, როგორც X11-ში)."""
+    return keysyms_for(ch)[0]
+
+
+class HeadlessTrainer(Trainer):
+    """
+    Trainer ეკრანის გარეშე: HeadlessRoot + HeadlessCanvas + ვირტუალური დრო.
+
+    :param sentences: სესიის სტრიქონები; None — ჩვეულებრივი კორპუსი
+    """
+
+    def __init__(self, sentences: Optional[Sequence[str]] = None) -> None:
+        self.loop = HeadlessLoop()
+        self.headless_root = HeadlessRoot(self.loop)
+        self.headless_canvas = HeadlessCanvas(self.loop)
+        self._fixed_sentences = sentences
+
+        super().__init__(
+            self.headless_root,  # type: ignore[arg-type]
+            canvas=self.headless_canvas,  # type: ignore[arg-type]
+            menu=HeadlessMenu(),  # type: ignore[arg-type]
+        )
+        # ეფექტების ვადები ვირტუალურ დროში
+        self.keyboard.animator.clock = lambda: self.loop.now_ms / 1000.0
+        self.loop.run_idle()
+
+    def _load_sentences(self) -> Sequence[str]:
+        if self._fixed_sentences is not None:
+            return self._fixed_sentences
+        return super()._load_sentences()
+
+    def press(self, keysym: str, char: str = "", dt_ms: int = KEY_INTERVAL_MS) -> None:
+        """ერთი კლავიში: on_key → idle (flush) → დროის წაწევა."""
+        self.on_key(HeadlessEvent(keysym, char, time=self.loop.now_ms))  # type: ignore[arg-type]
+        self.loop.run_idle()
+        self.loop.advance(dt_ms)
+
+
+# ======================================================
+#   კლავიშების წყაროები
+# ======================================================
+def synthetic_keys(
+    trainer: Trainer,
+    error_rate: float = 0.0,
+    rng: Optional[random.Random] = None,
+    interval_ms: int = KEY_INTERVAL_MS,
+) -> Iterator[KeyStroke]:
+    """
+    სინთეზური მბეჭდავი: ყოველთვის კრეფს მიმდინარე target-ს,
+    `error_rate` ალბათობით ჯერ არასწორ კლავიშს.
+    """
+    rng = rng or random.Random(0)
+    keys = [k for k in trainer.keyboard.key_boxes if len(k) == 1]
+    while trainer.training_active and trainer.exercise is not None:
+        target = trainer.exercise.current_target()
+        if target is None:
+            return
+        if error_rate and rng.random() < error_rate:
+            wrong = rng.choice(keys)
+            if wrong != target:
+                yield keysym_for(wrong), wrong.lower(), interval_ms
+        yield keysym_for(target), target.lower(), interval_ms
+
+
+def load_recording(path: str) -> List[KeyStroke]:
+    """ჩაწერილი კლავიშების წაკითხვა (JSON lines)."""
+    strokes: List[KeyStroke] = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            rec = json.loads(line)
+            strokes.append(
+                (rec["keysym"], rec.get("char", ""), int(rec.get("dt", KEY_INTERVAL_MS)))
+            )
+    return strokes
+
+
+# ======================================================
+#   REPLAY
+# ======================================================
+class ReplayReport:
+    """replay-ის შედეგი: სესიები, კლავიშები, canvas ოპერაციები."""
+
+    def __init__(self) -> None:
+        self.sessions: int = 0
+        self.keys: int = 0
+        self.seconds: float = 0.0
+        self.ops: Counter[str] = Counter()
+        self.cost: float = 0.0
+        # სესიები, რომელთა ბოლოს cover ყველა item-ს არ ფარავდა (z-order)
+        self.cover_errors: int = 0
+
+    @property
+    def ops_per_key(self) -> float:
+        return sum(self.ops.values()) / self.keys if self.keys else 0.0
+
+    @property
+    def cost_per_key(self) -> float:
+        return self.cost / self.keys if self.keys else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "sessions": self.sessions,
+            "keys": self.keys,
+            "seconds": round(self.seconds, 4),
+            "sessions_per_sec": round(self.sessions / self.seconds, 1) if self.seconds else 0.0,
+            "keys_per_sec": round(self.keys / self.seconds, 1) if self.seconds else 0.0,
+            "ops_per_key": round(self.ops_per_key, 3),
+            "cover_errors": self.cover_errors,
+            "cost_per_key": round(self.cost_per_key, 3),
+            "ops": dict(sorted(self.ops.items())),
+        }
+
+
+def replay(
+    trainer: HeadlessTrainer,
+    sessions: int = 1,
+    recording: Optional[Sequence[KeyStroke]] = None,
+    error_rate: float = 0.0,
+    seed: int = 0,
+) -> ReplayReport:
+    """
+    `sessions`-ჯერ: start_training → კლავიშები → finish_training.
+
+    იზომება მხოლოდ კლავიშების ფაზა (სესიის დაწყება/დასრულება არა).
+    """
+    report = ReplayReport()
+    rng = random.Random(seed)
+    canvas = trainer.headless_canvas
+
+    for _ in range(sessions):
+        trainer.start_training()
+        trainer.loop.run_idle()
+        if not trainer.training_active:
+            break
+
+        strokes: Iterable[KeyStroke]
+        if recording is not None:
+            strokes = recording
+        else:
+            strokes = synthetic_keys(trainer, error_rate, rng)
+
+        before = canvas.ops.copy()
+        cost = canvas.cost
+        t0 = time.perf_counter()
+        for keysym, char, dt in strokes:
+            if not trainer.training_active:
+                break
+            trainer.press(keysym, char, dt)
+            report.keys += 1
+        report.seconds += time.perf_counter() - t0
+        report.ops.update(canvas.ops - before)
+        report.cost += canvas.cost - cost
+
+        if trainer.training_active:
+            trainer.finish_training()
+        trainer.loop.run_idle()
+        if not canvas.on_top("cover"):
+            report.cover_errors += 1
+        report.sessions += 1
+
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KLAVA headless replay")
+    parser.add_argument("--sessions", type=int, default=100)
+    parser.add_argument("--lines", type=int, default=0, help="სტრიქონები სესიაში (0 — ყველა)")
+    parser.add_argument("--record", help="ჩაწერილი კლავიშები (JSON lines)")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-ops-per-key", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    trainer = HeadlessTrainer()
+    if args.lines:
+        trainer._fixed_sentences = list(trainer._load_sentences()[: args.lines])
+
+    recording = load_recording(args.record) if args.record else None
+    report = replay(trainer, args.sessions, recording, args.error_rate, args.seed)
+
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
+    if report.cover_errors:
+        print(f"REGRESSION: cover არ ფარავს კლავიატურას ({report.cover_errors} სესია)", file=sys.stderr)
+        return 1
+    if args.max_ops_per_key and report.ops_per_key > args.max_ops_per_key:
+        print(
+            f"REGRESSION: ops/key {report.ops_per_key:.2f} > {args.max_ops_per_key}",
+            file=sys.stderr,
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,204 @@
+# diagnostics/soak.py
+# KLAVA — Long-run soak test: memory, canvas items, pending callbacks
+#
+# გამოყენება:
+#   python -m diagnostics.soak --sessions 2000
+#   python -m diagnostics.soak --sessions 500 --every 10 --wpm 200 --error-scale 3
+#
+# სესია = start_training → ყველა სტრიქონი (სინთეზური მბეჭდავი) → finish_training.
+# ყოველ `every` სესიაზე იზომება tracemalloc, canvas.find_all() და
+# დაგეგმილი after/after_idle callback-ები; თუ რომელიმე იზრდება — exit 1.
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from diagnostics.replay import HeadlessTrainer
+from diagnostics.typist import SyntheticTypist, run_headless
+
+# გაზომვები, რომლებიც არ უნდა იზრდებოდეს, და მათი დასაშვები რხევა
+TOLERANCE: Dict[str, float] = {
+    "memory": 256 * 1024,  # ბაიტი (GC, შიდა cache-ები)
+    "items": 0,
+    "pending": 0,
+    "timers": 0,
+}
+
+# tracemalloc-ის კადრები (traceback სიღრმე) შედარებისთვის
+TRACE_FRAMES: int = 1
+
+# ყველაზე მეტად გაზრდილი ადგილები ანგარიშში
+TOP_ALLOCATIONS: int = 10
+
+
+class SoakSample(NamedTuple):
+    session: int
+    memory: int  # tracemalloc: მიმდინარე გამოყოფილი ბაიტები
+    items: int  # canvas.find_all()
+    pending: int  # დაგეგმილი after/after_idle callback-ები
+    timers: int  # ტაიმერების heap (გაუქმებულების ჩათვლით)
+
+
+def unbounded(values: Sequence[float], tolerance: float = 0.0) -> bool:
+    """
+    ზრდა საზღვრის გარეშე: მეორე ნახევრის მინიმუმი აღემატება პირველი
+    ნახევრის მაქსიმუმს და ბოლო მეოთხედის მედიანა პირველისას —
+    `tolerance`-ზე მეტით. შეზღუდული რხევა (cache, GC) ამას არ
+    აკმაყოფილებს, წრფივი ან საფეხურებრივი გაჟონვა — კი.
+    """
+    n = len(values)
+    half = n // 2
+    if half < 2:
+        return False
+    q = max(1, n // 4)
+    rise = sorted(values[-q:])[q // 2] - sorted(values[:q])[q // 2]
+    return min(values[half:]) > max(values[:half]) and rise > tolerance
+
+
+class SoakReport:
+    """soak-ის შედეგი: ნიმუშები, ზრდადი გაზომვები, tracemalloc-ის სხვაობა."""
+
+    def __init__(self) -> None:
+        self.sessions: int = 0
+        self.keys: int = 0
+        self.seconds: float = 0.0
+        self.samples: List[SoakSample] = []
+        self.grown: List[str] = []
+        self.top: List[str] = []
+
+    @property
+    def ok(self) -> bool:
+        return not self.grown
+
+    def check(self, tolerance: Dict[str, float] = TOLERANCE) -> List[str]:
+        self.grown = [
+            name
+            for name, tol in tolerance.items()
+            if unbounded([getattr(s, name) for s in self.samples], tol)
+        ]
+        return self.grown
+
+    def to_dict(self) -> Dict[str, object]:
+        first = self.samples[0] if self.samples else None
+        last = self.samples[-1] if self.samples else None
+        return {
+            "ok": self.ok,
+            "sessions": self.sessions,
+            "keys": self.keys,
+            "seconds": round(self.seconds, 2),
+            "samples": len(self.samples),
+            "first": first._asdict() if first else None,
+            "last": last._asdict() if last else None,
+            "max": {
+                name: max(getattr(s, name) for s in self.samples) for name in TOLERANCE
+            } if self.samples else None,
+            "grown": self.grown,
+            "top_allocations": self.top,
+        }
+
+
+def sample(trainer: HeadlessTrainer, session: int) -> SoakSample:
+    return SoakSample(
+        session=session,
+        memory=tracemalloc.get_traced_memory()[0],
+        items=len(trainer.headless_canvas.find_all()),
+        pending=trainer.loop.pending,
+        timers=trainer.loop.timers,
+    )
+
+
+def _snapshot() -> tracemalloc.Snapshot:
+    return tracemalloc.take_snapshot().filter_traces(
+        (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, __file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+    )
+
+
+def soak(
+    trainer: HeadlessTrainer,
+    typist: SyntheticTypist,
+    sessions: int = 2000,
+    every: int = 50,
+    warmup: int = 20,
+) -> SoakReport:
+    """
+    `sessions` სესია სინთეზური შეყვანით; პირველი `warmup` სესია
+    (cache-ები, pool-ები, პირველი გამოყოფები) ნიმუშებში არ შედის.
+    tracemalloc-ის snapshot — warmup-ის შემდეგ და ბოლოს; სხვაობა
+    (ყველაზე გაზრდილი ხაზები) ანგარიშში ხვდება.
+    """
+    report = SoakReport()
+    started = not tracemalloc.is_tracing()
+    if started:
+        tracemalloc.start(TRACE_FRAMES)
+
+    t0 = time.perf_counter()
+    try:
+        for _ in range(warmup):
+            report.keys += run_headless(trainer, typist).keys_handled
+        baseline = _snapshot()
+        report.samples.append(sample(trainer, 0))
+
+        done = 0
+        while done < sessions:
+            step = min(every, sessions - done)
+            result = run_headless(trainer, typist, step)
+            report.keys += result.keys_handled
+            if result.sessions < step:
+                # start_training ვერ დაიწყო (მაგ. დავალების ფაილი)
+                done += result.sessions
+                break
+            done += step
+            report.samples.append(sample(trainer, done))
+
+        report.sessions = done
+        top = _snapshot().compare_to(baseline, "lineno")[:TOP_ALLOCATIONS]
+        report.top = [str(stat) for stat in top if stat.size_diff > 0]
+    finally:
+        if started:
+            tracemalloc.stop()
+        report.seconds = time.perf_counter() - t0
+
+    report.check()
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KLAVA soak test")
+    parser.add_argument("--sessions", type=int, default=2000)
+    parser.add_argument("--every", type=int, default=50, help="ნიმუში ყოველ N სესიაზე")
+    parser.add_argument("--warmup", type=int, default=20)
+    parser.add_argument("--lines", type=int, default=0, help="სტრიქონები სესიაში (0 — ყველა)")
+    parser.add_argument("--wpm", type=float, default=120.0)
+    parser.add_argument("--error-scale", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    # tracemalloc — Trainer-ის შექმნამდე, რომ მისი გამოყოფებიც ჩანდეს
+    tracemalloc.start(TRACE_FRAMES)
+
+    trainer = HeadlessTrainer()
+    if args.lines:
+        trainer._fixed_sentences = list(trainer._load_sentences()[: args.lines])
+
+    typist = SyntheticTypist(trainer.layout, args.wpm, error_scale=args.error_scale, seed=args.seed)
+    report = soak(trainer, typist, args.sessions, args.every, args.warmup)
+
+    print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
+    if not report.ok:
+        print(f"LEAK: {', '.join(report.grown)} გაიზარდა", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+# diagnostics/startup.py
+# KLAVA — Cold-start phase timing (opt-in)
+# main.py → import → Tk → Canvas → cover-ის პირველი paint → კლავიატურა (idle)
+
+from __future__ import annotations
+
+import json
+import os
+import socket
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class StartupProfile:
+    """
+    გაშვების ფაზების ხანგრძლივობა (wall time).
+
+    გამორთულ მდგომარეობაში ყველა მეთოდი მაშინვე ბრუნდება.
+
+    გამოყენება:
+        startup.enable(path, t0)     — t0: პროცესის დასაწყისი (main.py-ის პირველი ხაზი)
+        startup.mark("import")       — ფაზა: წინა mark-იდან აქამდე
+        with startup.phase("name"):  — ფაზა: ბლოკის ხანგრძლივობა
+        startup.dump()               — ერთი JSON ხაზი ფაილში ("-" — stderr)
+    """
+
+    def __init__(self) -> None:
+        self.enabled: bool = False
+        self.path: Optional[str] = None
+        self.clock: Callable[[], float] = time.perf_counter
+
+        # (ფაზა, დასაწყისი t0-დან, ხანგრძლივობა) — წამებში
+        self.phases: List[Tuple[str, float, float]] = []
+
+        self._t0: float = 0.0
+        self._last: float = 0.0
+
+    def enable(self, path: str, t0: Optional[float] = None) -> None:
+        self.enabled = True
+        self.path = path
+        self.phases.clear()
+        self._t0 = self._last = self.clock() if t0 is None else t0
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    # ======================================================
+    #   ფაზები
+    # ======================================================
+    def mark(self, name: str) -> None:
+        """ფაზის დასრულება — ხანგრძლივობა წინა mark-იდან (ან phase-ის ბოლოდან)."""
+        if not self.enabled:
+            return
+        now = self.clock()
+        self.phases.append((name, self._last - self._t0, now - self._last))
+        self._last = now
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """ბლოკის ხანგრძლივობა; ჩადგმული ფაზები ცალკე აღირიცხება."""
+        if not self.enabled:
+            yield
+            return
+        start = self.clock()
+        try:
+            yield
+        finally:
+            now = self.clock()
+            self.phases.append((name, start - self._t0, now - start))
+            self._last = now
+
+    # ======================================================
+    #   DUMP
+    # ======================================================
+    def report(self) -> Dict[str, object]:
+        return {
+            "host": socket.gethostname(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "total_ms": round((self._last - self._t0) * 1000.0, 3),
+            "phases": [
+                {"name": name, "at_ms": round(at * 1000.0, 3), "ms": round(dt * 1000.0, 3)}
+                for name, at, dt in self.phases
+            ],
+        }
+
+    def dump(self) -> None:
+        """
+        შედეგის ჩაწერა (ერთი JSON ხაზი) და გამორთვა — გაშვება ერთხელ ხდება.
+        ჩაწერის შეცდომა (OSError) იბეჭდება stderr-ში და არ ვრცელდება.
+        """
+        if not self.enabled or self.path is None:
+            return
+        line = json.dumps(self.report(), ensure_ascii=False) + "\n"
+        self.enabled = False
+
+        if self.path == "-":
+            sys.stderr.write(line)
+            return
+        try:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            sys.stderr.write(f"KLAVA: startup profile ვერ ჩაიწერა ({self.path}): {e}\n")
+
+
+# მთელი აპლიკაციისთვის ერთი პროფილი
+startup = StartupProfile()
@@ -0,0 +1,511 @@
+# diagnostics/typist.py
+# KLAVA — Synthetic typist (load generator): WPM, jitter, per-finger errors
+#
+# გამოყენება:
+#   python -m diagnostics.typist --wpm 80                      (headless Trainer)
+#   python -m diagnostics.typist --mode engine --sweep 60,120,240,480
+#   python -m diagnostics.typist --mode live --sweep 60,120,180 --jitter lognormal
+#
+# შედეგი — JSON (sweep-ისას ერთი ხაზი თითო WPM-ზე): მიღწეული WPM,
+# კლავიშები/წმ, დაკარგული კლავიშები და დაყოვნება (live — event → handled,
+# headless — დამუშავების დრო; engine — მხოლოდ გამტარობა, კლავიში/წმ).
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+import sys
+import time
+import tkinter as tk
+from collections import deque
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from diagnostics.latency import LatencyHistogram
+from diagnostics.replay import HeadlessTrainer, keysym_for
+from exercises.passage import PassageExercise
+from logic.engine import TypingEngine
+from logic.layouts import SPACE, Layout
+from trainer import Trainer
+
+# სიტყვა = 5 სიმბოლო (WPM-ის სტანდარტული განმარტება)
+CHARS_PER_WORD: int = 5
+
+# შეცდომის ალბათობა თითის მიხედვით (error_scale = 1.0)
+FINGER_ERROR_RATE: Dict[str, float] = {
+    "left_pinky": 0.05,
+    "left_ring": 0.04,
+    "left_middle": 0.025,
+    "left_index": 0.02,
+    "right_index": 0.02,
+    "right_middle": 0.025,
+    "right_ring": 0.04,
+    "right_pinky": 0.05,
+    "thumb": 0.01,
+}
+DEFAULT_ERROR_RATE: float = 0.03
+
+# კლავიშებს შორის ინტერვალის განაწილება
+JITTERS: Tuple[str, ...] = ("none", "normal", "lognormal")
+
+# ყველაზე მოკლე ინტერვალი (ms) — normal განაწილების კუდი 0-ს არ სცდება
+MIN_INTERVAL_MS: float = 1.0
+
+# live რეჟიმი: ბოლო კლავიშის შემდეგ ლოდინი, სანამ Trainer დაამუშავებს
+LIVE_FLUSH_MS: int = 250
+
+# (სიმბოლო, სწორია, ინტერვალი წინა კლავიშიდან ms)
+Step = Tuple[str, bool, float]
+
+
+def key_neighbours(layout: Layout) -> Dict[str, List[str]]:
+    """
+    კლავიში → მეზობელი კლავიშები (იგივე რიგი ±1 და ზედა/ქვედა რიგი
+    სტანდარტული წანაცვლებით: A-ს მეზობლებია Q, W, S, Z).
+    SPACE-ის მეზობლები — ქვედა რიგის შუა კლავიშები.
+    """
+    at = {pos: key for key, pos in layout.position.items()}
+    out: Dict[str, List[str]] = {}
+    for key, (r, c) in layout.position.items():
+        around = ((r, c - 1), (r, c + 1), (r - 1, c), (r - 1, c + 1), (r + 1, c - 1), (r + 1, c))
+        out[key] = [at[p] for p in around if p in at]
+
+    bottom = len(layout.rows) - 1
+    out[SPACE] = [k for k, (r, c) in layout.position.items() if r == bottom and 2 <= c <= 6]
+    return out
+
+
+class SyntheticTypist:
+    """
+    სინთეზური მბეჭდავი: კრეფს ტექსტს მოცემული სიჩქარით.
+
+    - ინტერვალის საშუალო — 60000 / (wpm · 5) ms; `jitter` — განაწილება
+      (`none`, `normal`, `lognormal` — ორივე საშუალოს ინარჩუნებს)
+    - ყოველ სიმბოლოზე, თითის შეცდომის ალბათობით (FINGER_ERROR_RATE ·
+      error_scale), ჯერ იკრიფება მეზობელი კლავიში, შემდეგ სწორი
+    - თესლი (seed) ფიქსირებულია — იგივე პარამეტრები, იგივე მიმდევრობა
+    """
+
+    def __init__(
+        self,
+        layout: Layout,
+        wpm: float = 60.0,
+        jitter: str = "lognormal",
+        sigma: float = 0.3,
+        error_scale: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        if wpm <= 0:
+            raise ValueError("wpm უნდა იყოს დადებითი")
+        if jitter not in JITTERS:
+            raise ValueError(f"უცნობი jitter: {jitter!r} (დასაშვებია: {', '.join(JITTERS)})")
+
+        self.layout = layout
+        self.wpm = wpm
+        self.jitter = jitter
+        self.sigma = sigma
+        self.error_scale = error_scale
+        self.rng = random.Random(seed)
+
+        self.mean_ms: float = 60000.0 / (wpm * CHARS_PER_WORD)
+        self.neighbours: Dict[str, List[str]] = key_neighbours(layout)
+
+    # ======================================================
+    #   მოდელი
+    # ======================================================
+    def interval_ms(self) -> float:
+        """ინტერვალი წინა კლავიშიდან."""
+        mean = self.mean_ms
+        if self.jitter == "normal":
+            return max(MIN_INTERVAL_MS, self.rng.gauss(mean, self.sigma * mean))
+        if self.jitter == "lognormal":
+            mu = math.log(mean) - self.sigma**2 / 2
+            return max(MIN_INTERVAL_MS, self.rng.lognormvariate(mu, self.sigma))
+        return mean
+
+    def error_rate(self, ch: str) -> float:
+        finger = self.layout.finger_of.get(ch, "thumb" if ch == SPACE else "")
+        return FINGER_ERROR_RATE.get(finger, DEFAULT_ERROR_RATE) * self.error_scale
+
+    def wrong_key(self, ch: str) -> Optional[str]:
+        """მეზობელი კლავიში (შემთხვევითი); None — მეზობელი არ არსებობს."""
+        key = self.layout.key_of.get(ch, ch)
+        choices = [k for k in self.neighbours.get(key, ()) if k != ch]
+        return self.rng.choice(choices) if choices else None
+
+    # ======================================================
+    #   მიმდევრობა
+    # ======================================================
+    def plan(self, texts: Iterable[str]) -> Iterator[Step]:
+        """
+        კლავიშების მიმდევრობა ტექსტებისთვის (სტრიქონები ზედიზედ).
+
+        არასწორი კლავიში სამიზნეს არ ემთხვევა და პოზიციას არ ცვლის,
+        ამიტომ მიმდევრობა Trainer-ს ზუსტად მიჰყვება — ეკრანის
+        წაკითხვა (current_target) არ სჭირდება და შეიძლება წინ უსწრებდეს.
+        """
+        rng = self.rng
+        for text in texts:
+            for ch in text:
+                if rng.random() < self.error_rate(ch):
+                    wrong = self.wrong_key(ch)
+                    if wrong is not None:
+                        yield wrong, False, self.interval_ms()
+                yield ch, True, self.interval_ms()
+
+
+def session_texts(trainer: Trainer) -> List[str]:
+    """მიმდინარე სესიის დარჩენილი ტექსტი (ისე, როგორც სავარჯიშო ხედავს)."""
+    exercise = trainer.exercise
+    if isinstance(exercise, PassageExercise):
+        return [exercise.text]
+    normalize = trainer.layout.normalize
+    return [normalize(s) for s in trainer.sentences[trainer.current_index :]]
+
+
+# ======================================================
+#   გაზომვა
+# ======================================================
+class LagMeter:
+    """
+    event → handled დაყოვნება: `send()` — event_generate-ის წინ,
+    დამუშავება — Trainer._handle_key-ის დასრულება. event-ები რიგით
+    მუშავდება, ამიტომ გაგზავნის დროები FIFO-თი ეწყობა.
+    """
+
+    def __init__(self, trainer: Trainer, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.trainer = trainer
+        self.clock = clock
+        self.lag = LatencyHistogram()
+        self.handled: int = 0
+        self.last_handled: float = 0.0
+        self._sent: Deque[float] = deque()
+
+    def attach(self) -> None:
+        handle = self.trainer._handle_key
+        sent = self._sent
+        clock = self.clock
+
+        def _handle_key(event: tk.Event, t: Optional[float] = None) -> None:
+            try:
+                handle(event, t)
+            finally:
+                now = clock()
+                if sent:
+                    self.lag.add(now - sent.popleft())
+                self.handled += 1
+                self.last_handled = now
+
+        self.trainer._handle_key = _handle_key  # type: ignore[method-assign]
+
+    def detach(self) -> None:
+        vars(self.trainer).pop("_handle_key", None)
+
+    def send(self) -> None:
+        self._sent.append(self.clock())
+
+
+class TypistReport:
+    """
+    დატვირთვის შედეგი.
+
+    - `seconds` — ბეჭდვის ხანგრძლივობა (headless — ვირტუალური დრო,
+      live — რეალური; engine-ში ბეჭდვის ტემპი არ არსებობს); აქედან
+      `achieved_wpm`
+    - `busy_seconds` — რეალური დრო, რაც დამუშავებას დასჭირდა; აქედან
+      `capacity_keys_per_sec` — რამდენ კლავიშს ამუშავებს ეს მანქანა
+    - `lag` (live) — event_generate → დამუშავება, Tk-ის რიგის ჩათვლით;
+      `processing` (headless) — მხოლოდ სინქრონული დამუშავების დრო
+    """
+
+    def __init__(self, mode: str, typist: SyntheticTypist) -> None:
+        self.mode = mode
+        self.target_wpm = typist.wpm
+        self.jitter = typist.jitter
+        self.sessions: int = 0
+        self.keys_sent: int = 0
+        self.keys_handled: int = 0
+        self.correct: int = 0
+        self.errors: int = 0
+        self.seconds: float = 0.0
+        self.busy_seconds: float = 0.0
+        self.lag: Optional[LatencyHistogram] = None
+        self.processing: Optional[LatencyHistogram] = None
+        self.late: Optional[LatencyHistogram] = None
+
+    def count(self, correct: bool) -> None:
+        self.keys_sent += 1
+        if correct:
+            self.correct += 1
+        else:
+            self.errors += 1
+
+    @property
+    def achieved_wpm(self) -> float:
+        if self.seconds <= 0:
+            return 0.0
+        return self.correct / CHARS_PER_WORD / (self.seconds / 60.0)
+
+    @property
+    def capacity_keys_per_sec(self) -> float:
+        return self.keys_handled / self.busy_seconds if self.busy_seconds > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        out: Dict[str, object] = {
+            "mode": self.mode,
+            "target_wpm": self.target_wpm,
+            "jitter": self.jitter,
+            "sessions": self.sessions,
+            "keys_sent": self.keys_sent,
+            "keys_handled": self.keys_handled,
+            "dropped": self.keys_sent - self.keys_handled,
+            "errors": self.errors,
+        }
+        if self.seconds:
+            out["seconds"] = round(self.seconds, 4)
+            out["achieved_wpm"] = round(self.achieved_wpm, 1)
+            out["keys_per_sec"] = round(self.keys_handled / self.seconds, 1)
+        if self.busy_seconds:
+            out["busy_seconds"] = round(self.busy_seconds, 4)
+            out["capacity_keys_per_sec"] = round(self.capacity_keys_per_sec)
+        if self.lag is not None:
+            out["lag"] = self.lag.summary()
+        if self.processing is not None:
+            out["processing"] = self.processing.summary()
+        if self.late is not None:
+            out["late"] = self.late.summary()
+        return out
+
+
+# ======================================================
+#   DRIVERS
+# ======================================================
+def run_engine(texts: Sequence[str], typist: SyntheticTypist, sessions: int = 1) -> TypistReport:
+    """
+    მხოლოდ TypingEngine (UI-ს გარეშე): თითო სტრიქონი — ერთი `feed`.
+    ზომავს ლოგიკის გამტარობას (კლავიში/წმ); ბეჭდვის ტემპი და
+    დაყოვნება აქ არ არსებობს, ამიტომ WPM არ ითვლება.
+    """
+    report = TypistReport("engine", typist)
+    engine: Optional[TypingEngine] = None
+    clock = time.perf_counter
+
+    for text in list(texts) * sessions:
+        keys: List[str] = []
+        for ch, correct, _ in typist.plan((text,)):
+            keys.append(ch)
+            report.count(correct)
+
+        t0 = clock()
+        if engine is None:
+            engine = TypingEngine(text)
+        else:
+            engine.reset(text)
+        result = engine.feed(keys)
+        report.busy_seconds += clock() - t0
+        report.keys_handled += result.hits + result.misses
+
+    report.sessions = sessions
+    return report
+
+
+def run_headless(trainer: HeadlessTrainer, typist: SyntheticTypist, sessions: int = 1) -> TypistReport:
+    """
+    მთელი Trainer-ის stack ეკრანის გარეშე: event_generate → on_key →
+    idle (drain) → ვირტუალური დროის წაწევა ინტერვალით (ტაიმერები,
+    HUD, ანიმაციები ამ დროში სრულდება).
+    """
+    report = TypistReport("headless", typist)
+    meter = LagMeter(trainer)
+    root, loop = trainer.headless_root, trainer.loop
+    clock = time.perf_counter
+
+    meter.attach()
+    try:
+        for _ in range(sessions):
+            trainer.start_training()
+            loop.run_idle()
+            if not trainer.training_active:
+                break
+
+            start_ms = loop.now_ms
+            virtual = 0.0
+            t0 = clock()
+            for ch, correct, dt in typist.plan(session_texts(trainer)):
+                if not trainer.training_active:
+                    break
+                meter.send()
+                root.event_generate("<Key>", keysym=keysym_for(ch), char=ch.lower())
+                loop.run_idle()
+                report.count(correct)
+
+                virtual += dt
+                loop.advance(int(virtual) - (loop.now_ms - start_ms))
+            report.busy_seconds += clock() - t0
+            report.seconds += (loop.now_ms - start_ms) / 1000.0
+
+            if trainer.training_active:
+                trainer.finish_training()
+            loop.run_idle()
+            report.sessions += 1
+    finally:
+        meter.detach()
+
+    report.keys_handled = meter.handled
+    report.processing = meter.lag
+    return report
+
+
+class LiveDriver:
+    """
+    რეალური Tk Trainer: კლავიშები იგზავნება `event_generate`-ით
+    (`when="tail"` — Tk-ის რიგის ბოლოს, როგორც ნამდვილი კლავიატურიდან)
+    `after` ტაიმერებით, აბსოლუტური ვადებით. თუ loop დაკავებულია,
+    ტაიმერი გვიანდება (`late`) და მიღწეული WPM სამიზნეს ჩამორჩება.
+    """
+
+    def __init__(self, trainer: Trainer, typist: SyntheticTypist, sessions: int = 1) -> None:
+        self.trainer = trainer
+        self.root = trainer.root
+        self.typist = typist
+        self.sessions_left = sessions
+        self.clock: Callable[[], float] = time.perf_counter
+
+        self.report = TypistReport("live", typist)
+        self.report.late = LatencyHistogram()
+        self.meter = LagMeter(trainer, self.clock)
+
+        self._plan: Iterator[Step] = iter(())
+        self._next: Optional[Step] = None
+        self._due: float = 0.0
+        self._session_t0: float = 0.0
+
+    def run(self) -> TypistReport:
+        """ბლოკავს, სანამ ყველა სესია არ დასრულდება (root.mainloop)."""
+        self.meter.attach()
+        try:
+            self.root.after_idle(self._begin_session)
+            self.root.mainloop()
+        finally:
+            self.meter.detach()
+
+        report = self.report
+        report.keys_handled = self.meter.handled
+        report.lag = self.meter.lag
+        return report
+
+    def _begin_session(self) -> None:
+        trainer = self.trainer
+        if self.sessions_left <= 0:
+            self.root.quit()
+            return
+        self.sessions_left -= 1
+
+        trainer.start_training()
+        if not trainer.training_active:
+            self.root.quit()
+            return
+
+        self.root.focus_force()
+        self._plan = self.typist.plan(session_texts(trainer))
+        self._session_t0 = self._due = self.clock()
+        self._schedule()
+
+    def _schedule(self) -> None:
+        step = next(self._plan, None)
+        if step is None:
+            self.root.after(LIVE_FLUSH_MS, self._end_session)
+            return
+        self._next = step
+        self._due += step[2] / 1000.0
+        delay = max(0, int((self._due - self.clock()) * 1000.0))
+        self.root.after(delay, self._send)
+
+    def _send(self) -> None:
+        assert self._next is not None and self.report.late is not None
+        ch, correct, _ = self._next
+        self.report.late.add(max(0.0, self.clock() - self._due))
+
+        if not self.trainer.training_active:
+            self._end_session()
+            return
+
+        self.meter.send()
+        self.root.event_generate("<Key>", keysym=keysym_for(ch), when="tail")
+        self.report.count(correct)
+        self._schedule()
+
+    def _end_session(self) -> None:
+        trainer = self.trainer
+        end = self.meter.last_handled if self.meter.last_handled > self._session_t0 else self.clock()
+        self.report.seconds += end - self._session_t0
+        if trainer.training_active:
+            trainer.finish_training()
+        self.report.sessions += 1
+        self.root.after_idle(self._begin_session)
+
+
+def run_live(trainer: Trainer, typist: SyntheticTypist, sessions: int = 1) -> TypistReport:
+    return LiveDriver(trainer, typist, sessions).run()
+
+
+# ======================================================
+#   CLI
+# ======================================================
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KLAVA synthetic typist")
+    parser.add_argument("--mode", choices=("headless", "engine", "live"), default="headless")
+    parser.add_argument("--wpm", type=float, default=60.0)
+    parser.add_argument("--sweep", help="WPM-ების სია მძიმით (capacity chart), მაგ. 60,120,240")
+    parser.add_argument("--jitter", choices=JITTERS, default="lognormal")
+    parser.add_argument("--sigma", type=float, default=0.3, help="jitter-ის ფარდობითი გაბნევა")
+    parser.add_argument("--error-scale", type=float, default=1.0, help="FINGER_ERROR_RATE-ის მამრავლი")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--lines", type=int, default=0, help="სტრიქონები სესიაში (0 — ყველა)")
+    parser.add_argument("--layout", help="განლაგება (data/layouts/<name>.json)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    speeds = [float(s) for s in args.sweep.split(",")] if args.sweep else [args.wpm]
+
+    root: Optional[tk.Tk] = None
+    trainer: Trainer
+    if args.mode == "live":
+        root = tk.Tk()
+        trainer = Trainer(root)
+    else:
+        trainer = HeadlessTrainer()
+
+    if args.layout and not trainer.set_layout(args.layout):
+        print(f"განლაგება ვერ შეიცვალა: {args.layout}", file=sys.stderr)
+        return 2
+    if args.lines:
+        lines = list(trainer._load_sentences()[: args.lines])
+        trainer._load_sentences = lambda: lines  # type: ignore[method-assign]
+
+    for wpm in speeds:
+        typist = SyntheticTypist(
+            trainer.layout, wpm, args.jitter, args.sigma, args.error_scale, args.seed
+        )
+        if args.mode == "engine":
+            normalize = trainer.layout.normalize
+            texts = [normalize(s) for s in trainer._load_sentences()]
+            report = run_engine(texts, typist, args.sessions)
+        elif args.mode == "live":
+            report = run_live(trainer, typist, args.sessions)
+        else:
+            report = run_headless(trainer, typist, args.sessions)  # type: ignore[arg-type]
+
+        if args.sweep:
+            print(json.dumps(report.to_dict(), ensure_ascii=False), flush=True)
+        else:
+            print(json.dumps(report.to_dict(), ensure_ascii=False, indent=2))
+
+    if root is not None:
+        root.destroy()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
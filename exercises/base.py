@@ -27,10 +27,12 @@ class Exercise:
         """
         raise NotImplementedError("stop() არ არის იმპლემენტირებული")
 
-    def on_key(self, event):
+    def on_key(self, event, t=None):
         """
         კლავიატურის event-ის დამუშავება.
-        Trainer პირდაპირ გადასცემს event-ს.
+        Trainer გადასცემს event-ს შეყვანის რიგიდან, მიმდევრობის დაცვით.
+
+        :param t: event-ის მიღების დრო (time.monotonic); None — ახლა
         """
         raise NotImplementedError("on_key() არ არის იმპლემენტირებული")
 
@@ -0,0 +1,193 @@
+# exercises/passage.py
+# KLAVA — Passage Exercise (long text, windowed view)
+
+from __future__ import annotations
+
+import time
+import tkinter as tk
+from typing import Optional
+
+from diagnostics.latency import probe
+from exercises.base import Exercise
+from logic.journal import KeystrokeJournal
+from logic.passage import PassageWindow, normalize_passage
+from logic.progress import SessionStats
+from logic.quantiles import ReactionSketches
+
+
+class PassageExercise(Exercise):
+    """
+    გრძელი ტექსტის (ათასობით — ასობით ათასი სიმბოლო) ბეჭდვის სავარჯიშო.
+
+    პასუხისმგებლობა:
+    - ტექსტის ნორმალიზაცია მიმდინარე განლაგებაზე
+    - wrap მხოლოდ ხილული სტრიქონებისთვის (PassageWindow)
+    - სწორი/არასწორი დაჭერის შეფასება, როგორც TypingExercise-ში
+
+    კლავიშის ღირებულება და canvas item-ების რაოდენობა ტექსტის
+    სიგრძეზე არ არის დამოკიდებული: სტრიქონზე გადასვლისას PassageView
+    იგივე item-ებს ხელახლა წერს.
+    """
+
+    # აკრეფილი სტრიქონები, რომლებიც კურსორის ზემოთ ჩანს
+    LINES_ABOVE: int = 1
+
+    def __init__(self, ui, keyboard, text: str) -> None:
+        self.ui = ui
+        self.keyboard = keyboard
+        self.view = ui.passage_view()
+
+        self.text: str = ""
+        self.pos: int = 0  # მიმდინარე სიმბოლო მთელ ტექსტში
+        self.col: int = 0  # მიმდინარე სიმბოლო სტრიქონში
+        self._line: str = ""
+        self._finished: bool = False
+        self.window: PassageWindow = PassageWindow("", 1, 1)
+
+        # კლავიშების ჟურნალი და სესიის სტატისტიკა (Trainer აყენებს)
+        self.journal: Optional[KeystrokeJournal] = None
+        self.stats: Optional[SessionStats] = None
+        self.reaction: Optional[ReactionSketches] = None
+        self.keycode_fallback: bool = False
+
+        self.reset(text)
+
+    def reset(self, text: str) -> None:
+        """ახალი ტექსტი (ნორმალიზაცია O(n) — ერთხელ, არა კლავიშზე)."""
+        layout = self.keyboard.layout
+        self.text = normalize_passage(layout.normalize(text), layout.key_of)
+        self.pos = 0
+        self.col = 0
+        self._finished = not self.text
+        self.window = PassageWindow(
+            self.text, self.view.cols, self.view.lines, self.LINES_ABOVE
+        )
+        self._line = self._current_line()
+
+    @property
+    def finished(self) -> bool:
+        return self._finished
+
+    # ======================================================
+    #   LIFECYCLE
+    # ======================================================
+    def start(self) -> None:
+        """ტექსტის ფანჯრის ჩვენება და პირველი target."""
+        if self.reaction is not None:
+            self.reaction.restart()
+
+        self.ui.clear_sentence()
+        self.view.show()
+        self._draw()
+        self._set_target()
+
+    def stop(self) -> None:
+        self._finished = True
+
+    def relayout(self) -> None:
+        """ფანჯრის ახალი სიგანე: wrap მიმდინარე სტრიქონიდან თავიდან."""
+        window = self.window
+        if window.cols == self.view.cols:
+            return
+        window.cols = self.view.cols
+        window.rewrap(window.current[0])
+
+        # კურსორი შეიძლება ახალ (ვიწრო) სტრიქონს გასცდეს
+        line_start, line_end = window.current
+        while self.pos >= line_end and window.advance():
+            line_start, line_end = window.current
+        self.col = self.pos - line_start
+        self._line = self._current_line()
+        self._draw()
+
+    # ======================================================
+    #   INPUT
+    # ======================================================
+    def on_key(self, event: tk.Event, t: Optional[float] = None) -> None:
+        """
+        იღებს Tkinter key event-ს (იხ. TypingExercise.on_key).
+
+        :param t: event-ის მიღების დრო (time.monotonic)
+        """
+        probe.mark("trainer")
+        if self._finished:
+            return
+
+        key = self.keyboard.layout.translate(
+            event.keysym,
+            event.char,
+            event.keycode if self.keycode_fallback else None,
+        )
+        if key is None:
+            return
+
+        target = self.current_target()
+        if target is None:
+            return
+
+        probe.mark("exercise")
+
+        journal = self.journal
+        stats = self.stats
+        now = time.monotonic() if t is None else t
+
+        # არასწორი
+        if key != target:
+            if journal is not None:
+                journal.key(target, key, False, now)
+            if stats is not None:
+                stats.record(target, False, now)
+            self.keyboard.highlight_wrong(key)
+            probe.mark("keyboard")
+            return
+
+        # სწორი
+        if journal is not None:
+            journal.key(target, key, True, now)
+        if stats is not None:
+            stats.record(target, True, now)
+        if self.reaction is not None:
+            self.reaction.hit(target, now)
+        self.keyboard.highlight_correct(key)
+        probe.mark("keyboard")
+
+        self.pos += 1
+        self.col += 1
+        if self.col < len(self._line):
+            self.view.set_cursor(self._line, self.col)
+        elif self.window.advance():
+            # შემდეგი სტრიქონი — ფანჯარა ერთით ქვემოთ
+            self.col = 0
+            self._line = self._current_line()
+            self._draw()
+        else:
+            self.view.set_cursor(self._line, self.col)
+            self._finished = True
+            probe.mark("canvas")
+            return
+        probe.mark("canvas")
+
+        self._set_target()
+
+    # ======================================================
+    #   HELPERS
+    # ======================================================
+    def current_target(self) -> str | None:
+        """მიმდინარე სამიზნე სიმბოლო, ან None თუ ტექსტი დასრულდა."""
+        if self._finished or self.pos >= len(self.text):
+            return None
+        return self.text[self.pos]
+
+    def _current_line(self) -> str:
+        start, end = self.window.current
+        return self.text[start:end]
+
+    def _draw(self) -> None:
+        text = self.text
+        lines = [text[start:end] for start, end in self.window.lines]
+        self.view.draw(lines, self.window.row, self.col)
+
+    def _set_target(self) -> None:
+        target = self.current_target()
+        if target is not None:
+            self.keyboard.set_target(target)
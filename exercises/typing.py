@@ -3,7 +3,15 @@
 
 from __future__ import annotations
 
+import time
 import tkinter as tk
+from typing import Optional
+
+from diagnostics.latency import probe
+from logic.engine import TypingEngine
+from logic.journal import KeystrokeJournal
+from logic.progress import SessionStats
+from logic.quantiles import ReactionSketches
 
 
 class TypingExercise:
@@ -17,17 +25,46 @@ class TypingExercise:
 
     შენიშვნა:
     - ეს კლასი არ ქმნის Canvas/Keyboard-ს — ის მხოლოდ იღებს მათ და იყენებს.
+    - სტრიქონი, პოზიცია და დასრულება ინახება მხოლოდ `self.engine`-ში
+      (TypingEngine); `sentence`/`letters`/`pos`/`finished` მისი ხედებია.
     """
 
     def __init__(self, ui, keyboard, sentence: str) -> None:
         self.ui = ui
         self.keyboard = keyboard
 
-        self.sentence: str = sentence.upper()
-        self.letters: list[str] = list(self.sentence)
+        self.engine = TypingEngine(self.keyboard.layout.normalize(sentence))
+
+        # კლავიშების ჟურნალი და სესიის სტატისტიკა (Trainer აყენებს)
+        self.journal: Optional[KeystrokeJournal] = None
+        self.stats: Optional[SessionStats] = None
+        self.reaction: Optional[ReactionSketches] = None
+
+        # X11 keycode-ით თარგმნა, როცა OS-ის განლაგება სავარჯიშოსას არ ემთხვევა
+        self.keycode_fallback: bool = False
+
+    def reset(self, sentence: str) -> None:
+        """
+        იგივე ობიექტის ახალ სტრიქონზე გადართვა (ახალი სავარჯიშოს შექმნის გარეშე).
+        `str` თავად ინდექსირებადია, ამიტომ ასოების სია არ იქმნება.
+        """
+        self.engine.reset(self.keyboard.layout.normalize(sentence))
+
+    @property
+    def sentence(self) -> str:
+        return self.engine.line
+
+    @property
+    def letters(self) -> str:
+        return self.engine.line
 
-        self.pos: int = 0
-        self.finished: bool = False
+    @property
+    def pos(self) -> int:
+        return self.engine.pos
+
+    @property
+    def finished(self) -> bool:
+        return self.engine.finished
 
     # ======================================================
     #   LIFECYCLE
@@ -38,56 +75,82 @@ class TypingExercise:
         - ტექსტის დახატვა
         - პირველი target-ის დაყენება
         """
-        self.finished = False
-        self.pos = 0
+        self.engine.rewind()
+
+        # რეაქციის დრო ითვლება სტრიქონის პირველი სწორი კლავიშიდან
+        if self.reaction is not None:
+            self.reaction.restart()
 
-        # ტექსტი თავიდან დახატე (თუ Canvas-ში ძველი რამ დარჩა)
-        self.ui.clear_sentence()
-        self.ui.draw_sentence(self.letters)
+        # ტექსტი დახატე (Canvas არსებულ item-ებს ხელახლა იყენებს)
+        self.ui.draw_sentence(self.engine.line)
 
         # პირველი target
         self._set_target()
 
     def stop(self) -> None:
         """სავარჯიშოს შეჩერება."""
-        self.finished = True
+        self.engine.stop()
 
     # ======================================================
     #   INPUT
     # ======================================================
-    def on_key(self, event: tk.Event) -> None:
+    def on_key(self, event: tk.Event, t: Optional[float] = None) -> None:
         """
         იღებს Tkinter key event-ს და ამუშავებს მხოლოდ მისაღებ ღილაკებს.
+
+        :param t: event-ის მიღების დრო (time.monotonic); batch-ში დამუშავებისას
+                  სტატისტიკა ამ დროს იყენებს და არა დამუშავების მომენტს
         """
-        if self.finished:
+        probe.mark("trainer")
+        engine = self.engine
+        if engine.finished:
             return
 
-        key = str(event.keysym).upper()
-        if key == "SPACE":
-            key = " "
-
-        # ჩვენთვის მისაღებია მხოლოდ ის კლავიშები, რაც კლავიატურაზეა
-        if key not in self.keyboard.key_boxes:
+        # keysym → სიმბოლო განლაგების ცხრილით; მისაღებია მხოლოდ მისი სიმბოლოები
+        key = self.keyboard.layout.translate(
+            event.keysym,
+            event.char,
+            event.keycode if self.keycode_fallback else None,
+        )
+        if key is None:
             return
 
-        target = self.current_target()
-        if target is None:
+        target = engine.current_char()
+        if not target:
             return
 
+        probe.mark("exercise")
+
+        journal = self.journal
+        stats = self.stats
+        now = time.monotonic() if t is None else t
+
         # არასწორი
         if key != target:
+            if journal is not None:
+                journal.key(target, key, False, now)
+            if stats is not None:
+                stats.record(target, False, now)
             self.keyboard.highlight_wrong(key)
+            probe.mark("keyboard")
             return
 
         # სწორი
+        if journal is not None:
+            journal.key(target, key, True, now)
+        if stats is not None:
+            stats.record(target, True, now)
+        if self.reaction is not None:
+            self.reaction.hit(target, now)
         self.keyboard.highlight_correct(key)
+        probe.mark("keyboard")
 
         # ტექსტში მონიშვნა (სწორი სიმბოლო გამუქდეს)
-        self.ui.mark_letter(self.pos)
+        self.ui.mark_letter(engine.pos)
+        probe.mark("canvas")
 
-        self.pos += 1
-        if self.pos >= len(self.letters):
-            self.finished = True
+        engine.hit(key)
+        if engine.finished:
             return
 
         # შემდეგი target
@@ -98,9 +161,7 @@ class TypingExercise:
     # ======================================================
     def current_target(self) -> str | None:
         """აბრუნებს მიმდინარე სამიზნე სიმბოლოს, ან None თუ დასრულებულია."""
-        if self.pos >= len(self.letters):
-            return None
-        return self.letters[self.pos]
+        return self.engine.current_char() or None
 
     def _set_target(self) -> None:
         """
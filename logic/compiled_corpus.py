@@ -0,0 +1,507 @@
+# logic/compiled_corpus.py
+# KLAVA — Compiled binary corpus (.klc) with per-line statistics
+#
+# გამოყენება:
+#   python -m logic.compiled_corpus data/sentences.txt             (→ data/sentences.qwerty.klc)
+#   python -m logic.compiled_corpus data/sentences_ka.txt --layout georgian_phonetic
+
+from __future__ import annotations
+
+import argparse
+import bisect
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from typing import Dict, Iterator, List, Mapping, NamedTuple, Optional, Sequence
+
+from logic.layouts import DEFAULT_LAYOUT, SPACE, Layout, load_layout
+
+# ── ფორმატი ────────────────────────────────────────
+# ფაილი თითო (კორპუსი, განლაგება) წყვილზე: <src>.<layout>.klc
+# header
+# keys (utf-8) | finger names (utf-8, ","-ით) — განლაგების სიმბოლოები და თითები
+# records:  count × RECORD   — ფიქსირებული ზომა, O(1) წვდომა
+# order:    count × uint32   — ხაზების id-ები სირთულის ზრდადობით
+# terms:    TERMS × POSTING  — inverted index-ის ცხრილი (offset, რაოდენობა)
+# postings: uint32 id-ები    — თითო term-ზე ზრდადობით დალაგებული
+# text:     ნორმალიზებული ხაზები (utf-8), ერთმანეთის მიყოლებით
+COMPILED_MAGIC: bytes = b"KLCC"
+COMPILED_VERSION: int = 4
+COMPILED_SUFFIX: str = ".klc"
+
+_HEADER = struct.Struct("<4sHHH2xQqQQQQQ")
+_POSTING = struct.Struct("<QI")
+
+# სირთულის წონები: თითი (საჩვენებელი → ნეკა) და რიგი (ზედა/შუა/ქვედა)
+_FINGER_COST: Dict[str, float] = {
+    "pinky": 2.0,
+    "ring": 1.6,
+    "middle": 1.2,
+    "index": 1.0,
+}
+_ROW_COST: tuple[float, ...] = (0.4, 0.0, 0.6)
+_SAME_FINGER_COST: float = 1.0
+
+_SPACES = re.compile(r" +")
+
+
+class LineStats(NamedTuple):
+    """ერთი ხაზის წინასწარ გამოთვლილი მეტამონაცემები."""
+
+    length: int  # utf-8 ბაიტებში (ქართული ასო — 3 ბაიტი)
+    histogram: tuple[int, ...]  # CorpusKeys.keys-ის მიმდევრობით (255-ზე იჭრება)
+    fingers: tuple[int, ...]  # CorpusKeys.fingers-ის მიმდევრობით (65535-ზე იჭრება)
+    difficulty: float
+
+
+# ჩანაწერის თავი: ტექსტის offset, სიგრძე (uint32 — გრძელი ხაზებისთვისაც), სირთულე
+_PREFIX = struct.Struct("<QIf")
+
+
+class CorpusKeys:
+    """
+    `.klc`-ის კლავიშების ცხრილები ერთი განლაგებისთვის: სიმბოლოები
+    (histogram-ის და inverted index-ის ნუმერაცია), თითები, რიგები.
+
+    კომპილაციისას იქმნება Layout-იდან (`for_layout`); წაკითხვისას —
+    ფაილის header-იდან (მხოლოდ სიმბოლოები და თითების სახელები).
+    """
+
+    def __init__(
+        self,
+        keys: str,
+        fingers: Sequence[str],
+        finger_of: Mapping[str, str] = {},
+        row_of: Mapping[str, int] = {},
+        upper: bool = False,
+    ) -> None:
+        self.keys: str = keys
+        self.fingers: tuple[str, ...] = tuple(fingers)
+        self.upper: bool = upper
+
+        self.index: Dict[str, int] = {ch: i for i, ch in enumerate(keys)}
+        finger_index = {f: i for i, f in enumerate(self.fingers)}
+        self.finger: Dict[str, int] = {
+            ch: finger_index[f] for ch, f in finger_of.items() if ch in self.index
+        }
+        self.row: Dict[str, int] = dict(row_of)
+
+        # inverted index-ის term-ები: ჯერ ცალკეული კლავიშები, შემდეგ ბიგრამები
+        self.term_count: int = len(keys) + len(keys) ** 2
+        self.record = struct.Struct(f"<QIf{len(keys)}B{len(self.fingers)}H")
+
+    @classmethod
+    def for_layout(cls, layout: Layout) -> "CorpusKeys":
+        """განლაგების ყველა საბეჭდი სიმბოლო (Shift ფენის ჩათვლით), SPACE — ბოლოს."""
+        chars = [ch for ch in layout.chars if ch != SPACE]
+        return cls(
+            "".join(chars) + SPACE,
+            tuple(layout.fingers),
+            layout.finger_of,
+            {ch: layout.position[layout.key_of[ch]][0] for ch in chars},
+            layout.upper,
+        )
+
+    def term_id(self, term: str) -> int:
+        """
+        კლავიშის ან ბიგრამის ნომერი inverted index-ში.
+
+        აგდებს:
+            KeyError: თუ სიმბოლო განლაგებაში არ არის.
+            ValueError: თუ term არც ერთი და არც ორი სიმბოლოა.
+        """
+        if len(term) == 1:
+            return self.index[term]
+        if len(term) == 2:
+            k = len(self.keys)
+            return k + self.index[term[0]] * k + self.index[term[1]]
+        raise ValueError(f"term უნდა იყოს 1 ან 2 სიმბოლო: {term!r}")
+
+    def line_terms(self, line: str) -> set[int]:
+        """ნორმალიზებული ხაზის ყველა განსხვავებული term."""
+        terms = {self.index[ch] for ch in line}
+        terms.update(self.term_id(line[i : i + 2]) for i in range(len(line) - 1))
+        return terms
+
+    # ======================================================
+    #   ნორმალიზაცია და სტატისტიკა
+    # ======================================================
+    def normalize(self, line: str) -> str:
+        """
+        განლაგების ფორმა (QWERTY — UPPERCASE), მხოლოდ მისი სიმბოლოები,
+        ზედმეტი სივრცეების გარეშე.
+        """
+        if self.upper:
+            line = line.upper()
+        kept = "".join(ch for ch in line if ch in self.index)
+        return _SPACES.sub(" ", kept).strip()
+
+    def line_stats(self, line: str) -> LineStats:
+        """ნორმალიზებული ხაზის სტატისტიკა."""
+        hist = [0] * len(self.keys)
+        fingers = [0] * len(self.fingers)
+
+        cost = 0.0
+        letters = 0
+        prev_finger = -1
+        last_row = len(_ROW_COST) - 1
+        for ch in line:
+            hist[self.index[ch]] += 1
+            f = self.finger.get(ch, -1)
+            if f < 0:
+                prev_finger = -1
+                continue
+
+            fingers[f] += 1
+            letters += 1
+            cost += _FINGER_COST[self.fingers[f].split("_")[1]]
+            cost += _ROW_COST[min(self.row.get(ch, 1), last_row)]
+            if f == prev_finger:
+                cost += _SAME_FINGER_COST
+            prev_finger = f
+
+        difficulty = cost / letters if letters else 0.0
+        return LineStats(
+            length=len(line.encode("utf-8")),
+            histogram=tuple(min(c, 255) for c in hist),
+            fingers=tuple(min(c, 65535) for c in fingers),
+            difficulty=difficulty,
+        )
+
+
+# ======================================================
+#   COMPILE
+# ======================================================
+def compiled_path_for(src: str, layout: str = DEFAULT_LAYOUT) -> str:
+    """`.klc` განლაგების სახელით: data/sentences_ka.txt → data/sentences_ka.georgian_phonetic.klc"""
+    return f"{os.path.splitext(src)[0]}.{layout}{COMPILED_SUFFIX}"
+
+
+def compile_corpus(src: str, layout: Layout, dst: Optional[str] = None) -> str:
+    """
+    ტექსტური კორპუსის კომპილაცია `.klc` ფორმატში `layout`-ის
+    სიმბოლოებით და თითებით (ხაზები მის ფორმაზე ნორმალიზდება).
+
+    :return: შედეგის ფაილის გზა
+    """
+    dst = dst or compiled_path_for(src, layout.name)
+    st = os.stat(src)
+    ck = CorpusKeys.for_layout(layout)
+
+    offsets: List[int] = []
+    stats: List[LineStats] = []
+    postings: List[array] = [array("I") for _ in range(ck.term_count)]
+    text = bytearray()
+
+    with open(src, encoding="utf-8") as f:
+        for raw in f:
+            line = ck.normalize(raw)
+            if not line:
+                continue
+            line_id = len(stats)
+            offsets.append(len(text))
+            text += line.encode("utf-8")
+            stats.append(ck.line_stats(line))
+            for t in ck.line_terms(line):
+                postings[t].append(line_id)
+
+    count = len(stats)
+    keys_b = ck.keys.encode("utf-8")
+    fingers_b = ",".join(ck.fingers).encode("utf-8")
+
+    records_off = _HEADER.size + len(keys_b) + len(fingers_b)
+    order_off = records_off + count * ck.record.size
+    terms_off = order_off + count * 4
+    postings_off = terms_off + ck.term_count * _POSTING.size
+    text_off = postings_off + 4 * sum(len(p) for p in postings)
+
+    order = sorted(range(count), key=lambda i: stats[i].difficulty)
+
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, "wb") as out:
+            out.write(
+                _HEADER.pack(
+                    COMPILED_MAGIC,
+                    COMPILED_VERSION,
+                    len(keys_b),
+                    len(fingers_b),
+                    st.st_size,
+                    st.st_mtime_ns,
+                    count,
+                    records_off,
+                    order_off,
+                    terms_off,
+                    text_off,
+                )
+            )
+            out.write(keys_b)
+            out.write(fingers_b)
+            for off, s in zip(offsets, stats):
+                out.write(
+                    ck.record.pack(off, s.length, s.difficulty, *s.histogram, *s.fingers)
+                )
+            out.write(array("I", order).tobytes())
+            pos = postings_off
+            for p in postings:
+                out.write(_POSTING.pack(pos, len(p)))
+                pos += 4 * len(p)
+            for p in postings:
+                out.write(p.tobytes())
+            out.write(text)
+        os.replace(tmp, dst)
+    except OSError:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+    return dst
+
+
+# ======================================================
+#   LOAD
+# ======================================================
+class CompiledCorpus(Sequence[str]):
+    """
+    კომპილირებული კორპუსი — იხსნება O(1) დროში (header + mmap).
+
+    - `corpus[i]`            — ნორმალიზებული ხაზი
+    - `corpus.stats(i)`      — LineStats ტექსტის წაკითხვის გარეშე
+    - `corpus.by_difficulty` — ხაზების შერჩევა სირთულით (O(log n))
+    - `corpus.keyset`        — სიმბოლოების/თითების ცხრილი (header-იდან)
+    """
+
+    def __init__(
+        self, path: str, source: Optional[str] = None, layout: Optional[Layout] = None
+    ) -> None:
+        """
+        :param layout: თუ მოცემულია — ფაილი ამ განლაგებით უნდა იყოს
+                       კომპილირებული (სხვა შემთხვევაში ValueError)
+        """
+        self.path: str = path
+        self.source: Optional[str] = source
+        self._file = open(path, "rb")
+        try:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._read_header(layout)
+        except (ValueError, OSError, struct.error) as e:
+            self._file.close()
+            raise ValueError(f"არასწორი კომპილირებული კორპუსი: {path}") from e
+
+    def _read_header(self, layout: Optional[Layout]) -> None:
+        (
+            magic,
+            version,
+            keys_len,
+            fingers_len,
+            self.source_size,
+            self.source_mtime_ns,
+            self.count,
+            self._records_off,
+            self._order_off,
+            self._terms_off,
+            self._text_off,
+        ) = _HEADER.unpack_from(self._mm, 0)
+
+        if magic != COMPILED_MAGIC or version != COMPILED_VERSION:
+            raise ValueError("magic/version")
+
+        pos = _HEADER.size
+        keys = self._mm[pos : pos + keys_len].decode("utf-8")
+        fingers = self._mm[pos + keys_len : pos + keys_len + fingers_len].decode("utf-8")
+        self.keyset = CorpusKeys(keys, fingers.split(","))
+        if layout is not None:
+            expected = CorpusKeys.for_layout(layout)
+            if (keys, self.keyset.fingers) != (expected.keys, expected.fingers):
+                raise ValueError("keyboard layout mismatch")
+
+        if len(self._mm) < self._text_off:
+            raise ValueError("truncated")
+
+    @classmethod
+    def open_for(
+        cls, src: str, layout: Layout, path: Optional[str] = None
+    ) -> Optional["CompiledCorpus"]:
+        """
+        აბრუნებს `src`-ის აქტუალურ კომპილირებულ კორპუსს `layout`-ისთვის,
+        ან None-ს (თუ არ არსებობს, დაზიანებულია, სხვა განლაგებისაა ან
+        წყარო შეიცვალა).
+        """
+        path = path or compiled_path_for(src, layout.name)
+        try:
+            st = os.stat(src)
+            corpus = cls(path, source=src, layout=layout)
+        except (OSError, ValueError):
+            return None
+        if (corpus.source_size, corpus.source_mtime_ns) != (st.st_size, st.st_mtime_ns):
+            corpus.close()
+            return None
+        return corpus
+
+    # ======================================================
+    #   Sequence API
+    # ======================================================
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self.count))]
+        return self.line(i)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self.count):
+            yield self.line(i)
+
+    def line(self, i: int) -> str:
+        if not 0 <= i < self.count:
+            raise IndexError(i)
+        off, length, _ = _PREFIX.unpack_from(self._mm, self._record(i))
+        start = self._text_off + off
+        return self._mm[start : start + length].decode("utf-8")
+
+    # ======================================================
+    #   METADATA
+    # ======================================================
+    def stats(self, i: int) -> LineStats:
+        values = self.keyset.record.unpack_from(self._mm, self._record(i))
+        k = len(self.keyset.keys)
+        return LineStats(
+            length=values[1],
+            histogram=values[3 : 3 + k],
+            fingers=values[3 + k :],
+            difficulty=values[2],
+        )
+
+    def key_count(self, i: int, key: str) -> int:
+        """კლავიშის რაოდენობა i-ურ ხაზში (255-ზე იჭრება)."""
+        return self._mm[self._record(i) + _PREFIX.size + self.keyset.index[key]]
+
+    def postings(self, term: str) -> memoryview:
+        """
+        inverted index: იმ ხაზების id-ები (ზრდადობით), რომლებიც შეიცავს
+        კლავიშს ან ბიგრამს `term`.
+        """
+        off, n = _POSTING.unpack_from(
+            self._mm, self._terms_off + self.keyset.term_id(term) * _POSTING.size
+        )
+        return memoryview(self._mm)[off : off + 4 * n].cast("I")
+
+    def length(self, i: int) -> int:
+        return _PREFIX.unpack_from(self._mm, self._record(i))[1]
+
+    def difficulty(self, i: int) -> float:
+        return _PREFIX.unpack_from(self._mm, self._record(i))[2]
+
+    def by_difficulty(
+        self, low: float = float("-inf"), high: float = float("inf")
+    ) -> "CorpusView":
+        """
+        ხაზები, რომელთა სირთულე ∈ [low, high], სირთულის ზრდადობით.
+        """
+        order = self._order()
+        keys = _DifficultyKeys(self, order)
+        lo = bisect.bisect_left(keys, low)
+        hi = bisect.bisect_right(keys, high)
+        return CorpusView(self, order[lo:hi])
+
+    def _order(self) -> memoryview:
+        start = self._order_off
+        return memoryview(self._mm)[start : start + 4 * self.count].cast("I")
+
+    def _record(self, i: int) -> int:
+        return self._records_off + i * self.keyset.record.size
+
+    # ======================================================
+    #   LIFECYCLE
+    # ======================================================
+    def is_fresh(self) -> bool:
+        """True თუ წყარო ფაილი კომპილაციის შემდეგ არ შეცვლილა."""
+        if self.source is None:
+            return True
+        try:
+            st = os.stat(self.source)
+        except OSError:
+            return False
+        return (st.st_size, st.st_mtime_ns) == (self.source_size, self.source_mtime_ns)
+
+    def close(self) -> None:
+        try:
+            self._mm.close()
+        except BufferError:
+            # CorpusView-ები ჯერ კიდევ იყენებენ mmap-ს — GC დახურავს
+            pass
+        self._file.close()
+
+    def __enter__(self) -> "CompiledCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _DifficultyKeys(Sequence[float]):
+    """bisect-ისთვის: order[i]-ის სირთულე (ზრდადი)."""
+
+    def __init__(self, corpus: CompiledCorpus, order: memoryview) -> None:
+        self.corpus = corpus
+        self.order = order
+
+    def __len__(self) -> int:
+        return len(self.order)
+
+    def __getitem__(self, i):
+        return self.corpus.difficulty(self.order[i])
+
+
+class CorpusView(Sequence[str]):
+    """კორპუსის ხაზების ქვესიმრავლე id-ების მიხედვით (ტექსტის კოპირების გარეშე)."""
+
+    def __init__(self, corpus: CompiledCorpus, ids: Sequence[int]) -> None:
+        self.corpus = corpus
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CorpusView(self.corpus, self.ids[i])
+        return self.corpus.line(self.ids[i])
+
+    def __iter__(self) -> Iterator[str]:
+        for i in self.ids:
+            yield self.corpus.line(i)
+
+    def is_fresh(self) -> bool:
+        return self.corpus.is_fresh()
+
+    def close(self) -> None:
+        self.corpus.close()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="KLAVA corpus compiler (.klc)")
+    parser.add_argument("src", help="ტექსტური კორპუსი (ერთი ხაზი — ერთი წინადადება)")
+    parser.add_argument(
+        "dst", nargs="?", help=f"შედეგი (ნაგულისხმევად SRC.LAYOUT{COMPILED_SUFFIX})"
+    )
+    parser.add_argument("--layout", default=DEFAULT_LAYOUT, help="განლაგება (data/layouts)")
+    args = parser.parse_args(argv)
+
+    try:
+        layout = load_layout(args.layout)
+        dst = compile_corpus(args.src, layout, args.dst)
+    except (OSError, ValueError, UnicodeDecodeError) as e:
+        print(f"კომპილაცია ვერ მოხერხდა: {e}", file=sys.stderr)
+        return 1
+    with CompiledCorpus(dst) as corpus:
+        print(f"{dst}: {len(corpus)} ხაზი")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,205 @@
+# logic/corpus.py
+# KLAVA — Indexed sentence corpus (mmap)
+# დიდი სავარჯიშო ფაილის ზარმაცი კითხვა ხაზების offset-ინდექსით
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+import struct
+from array import array
+from typing import Iterator, Optional, Sequence, Union, overload
+
+# ── ინდექსის ფაილის ფორმატი ─────────────────────────
+# header: magic, version, წყაროს ზომა, წყაროს mtime_ns, ხაზების რაოდენობა
+# body:   count × uint64 — არაცარიელი ხაზების დასაწყისის offset-ები
+INDEX_MAGIC: bytes = b"KLIX"
+INDEX_VERSION: int = 1
+INDEX_SUFFIX: str = ".idx"
+
+_HEADER = struct.Struct("<4sH2xQqQ")
+
+# არაცარიელი ხაზის დასაწყისი (zero-width, C-ის სიჩქარით)
+_LINE_START = re.compile(rb"^(?=[ \t\r\f\v]*[^\s])", re.MULTILINE)
+
+
+class SentenceCorpus(Sequence[str]):
+    """
+    სავარჯიშო სტრიქონების კორპუსი.
+
+    პასუხისმგებლობა:
+    - ინდექსის აგება ერთხელ და შენახვა `<file>.idx`-ში
+    - ინდექსის გაუქმება, თუ წყაროს ზომა ან mtime შეიცვალა
+    - ხაზის წაკითხვა მოთხოვნისას mmap-იდან (strip + UPPERCASE მხოლოდ მას)
+
+    `upper=False` — ტექსტი რჩება როგორც არის (ქართულისთვის: `upper()`
+    მხედრულს მთავრულად აქცევს).
+
+    გახსნა O(1)-ია (თუ ინდექსი აქტუალურია) და მეხსიერება არ იზრდება
+    ფაილის ზომასთან ერთად — ორივე ფაილი mmap-ით იკითხება.
+    """
+
+    def __init__(
+        self, path: str, index_path: Optional[str] = None, upper: bool = True
+    ) -> None:
+        self.path: str = path
+        self.upper: bool = upper
+        self.index_path: str = index_path or path + INDEX_SUFFIX
+
+        st = os.stat(path)
+        self._size: int = st.st_size
+        self._mtime_ns: int = st.st_mtime_ns
+
+        self._file = open(path, "rb")
+        self._mm: Optional[mmap.mmap] = None
+        if self._size:
+            self._mm = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self._index_file = None
+        self._index_mm: Optional[mmap.mmap] = None
+        self._offsets: Union[memoryview, array] = self._open_index()
+
+    # ======================================================
+    #   Sequence API
+    # ======================================================
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @overload
+    def __getitem__(self, i: int) -> str: ...
+
+    @overload
+    def __getitem__(self, i: slice) -> list[str]: ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return self.line(i)
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(len(self)):
+            yield self.line(i)
+
+    def line(self, i: int) -> str:
+        """i-ური არაცარიელი ხაზი (strip + UPPERCASE, თუ `upper`)."""
+        start = self._offsets[i]
+        mm = self._mm
+        assert mm is not None
+        end = mm.find(b"\n", start)
+        if end == -1:
+            end = self._size
+        text = mm[start:end].decode("utf-8").strip()
+        return text.upper() if self.upper else text
+
+    # ======================================================
+    #   LIFECYCLE
+    # ======================================================
+    def is_fresh(self) -> bool:
+        """True თუ წყარო ფაილი გახსნის შემდეგ არ შეცვლილა."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return False
+        return st.st_size == self._size and st.st_mtime_ns == self._mtime_ns
+
+    def close(self) -> None:
+        if isinstance(self._offsets, memoryview):
+            self._offsets.release()
+        self._offsets = array("Q")
+        for mm in (self._index_mm, self._mm):
+            if mm is not None:
+                mm.close()
+        self._index_mm = None
+        self._mm = None
+        if self._index_file is not None:
+            self._index_file.close()
+            self._index_file = None
+        self._file.close()
+
+    def __enter__(self) -> "SentenceCorpus":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # ======================================================
+    #   INDEX
+    # ======================================================
+    def _open_index(self) -> Union[memoryview, array]:
+        """
+        აქტუალური ინდექსის mmap-ით გახსნა; თუ არ არსებობს ან მოძველებულია —
+        აგება და შენახვა. თუ ჩაწერა ვერ ხერხდება (read-only დისკი),
+        ინდექსი რჩება მეხსიერებაში.
+        """
+        offsets = self._map_index()
+        if offsets is not None:
+            return offsets
+
+        built = self._build_offsets()
+        try:
+            self._write_index(built)
+        except OSError:
+            return built
+
+        offsets = self._map_index()
+        return offsets if offsets is not None else built
+
+    def _map_index(self) -> Optional[memoryview]:
+        try:
+            f = open(self.index_path, "rb")
+        except OSError:
+            return None
+
+        try:
+            head = f.read(_HEADER.size)
+            if len(head) != _HEADER.size:
+                raise ValueError
+            magic, version, size, mtime_ns, count = _HEADER.unpack(head)
+            if (
+                magic != INDEX_MAGIC
+                or version != INDEX_VERSION
+                or size != self._size
+                or mtime_ns != self._mtime_ns
+                or os.fstat(f.fileno()).st_size != _HEADER.size + 8 * count
+            ):
+                raise ValueError
+            if count == 0:
+                f.close()
+                return memoryview(b"").cast("Q")
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            f.close()
+            return None
+
+        self._index_file = f
+        self._index_mm = mm
+        return memoryview(mm)[_HEADER.size :].cast("Q")
+
+    def _build_offsets(self) -> array:
+        offsets = array("Q")
+        if self._mm is not None:
+            offsets.extend(m.start() for m in _LINE_START.finditer(self._mm))
+        return offsets
+
+    def _write_index(self, offsets: array) -> None:
+        tmp = f"{self.index_path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(
+                    _HEADER.pack(
+                        INDEX_MAGIC,
+                        INDEX_VERSION,
+                        self._size,
+                        self._mtime_ns,
+                        len(offsets),
+                    )
+                )
+                if offsets.itemsize != 8:
+                    raise OSError("unexpected array('Q') item size")
+                offsets.tofile(f)
+            os.replace(tmp, self.index_path)
+        except OSError:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
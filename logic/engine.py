@@ -1,10 +1,25 @@
 # logic/engine.py
 # KLAVA — Typing logic engine
 
+from __future__ import annotations
+
+from typing import Iterable, List, NamedTuple
+
+
+class FeedResult(NamedTuple):
+    """`TypingEngine.feed`-ის შედეგი."""
+
+    hits: int  # სწორი დაჭერები
+    misses: int  # არასწორი დაჭერები
+    start: int  # პოზიცია feed-მდე
+    pos: int  # პოზიცია feed-ის შემდეგ
+    errors: List[int]  # პოზიციები, სადაც არასწორი კლავიში დაეჭირა (თითო დაჭერაზე)
+
 
 class TypingEngine:
     """
-    ბეჭდვის ლოგიკა.
+    ბეჭდვის ლოგიკა — ერთადერთი ადგილი, სადაც ინახება სტრიქონი,
+    პოზიცია და დასრულების მდგომარეობა (TypingExercise მას იყენებს).
 
     პასუხისმგებლობა:
     - ერთ სტრიქონზე ბეჭდვის კონტროლი
@@ -15,30 +30,55 @@ class TypingEngine:
     - ფაილების კითხვას
     - ტექსტის არჩევას
     - fallback ტექსტის გენერაციას
+
+    სტრიქონი ინახება როგორც `str` (ასოების სია არ იქმნება); `reset`
+    იგივე ობიექტს ახალ სტრიქონზე გადართავს.
     """
 
+    __slots__ = ("line", "pos", "finished")
+
     def __init__(self, sentence: str):
         """
         ქმნის ბეჭდვის ლოგიკას ერთ სტრიქონზე.
 
         :param sentence: არაცარიელი სტრიქონი
         """
+        self.line: str = ""
+        self.pos: int = 0
+        self.finished: bool = False
+        self.reset(sentence)
+
+    def reset(self, sentence: str) -> None:
+        """ახალი სტრიქონი (ახალი ობიექტის შექმნის გარეშე)."""
         if not isinstance(sentence, str) or not sentence.strip():
             raise ValueError("TypingEngine საჭიროებს არაცარიელ სტრიქონს")
 
-        self.letters = list(sentence)
+        self.line = sentence
+        self.pos = 0
+        self.finished = False
+
+    def rewind(self) -> None:
+        """იგივე სტრიქონის თავიდან დაწყება."""
         self.pos = 0
         self.finished = False
 
+    def stop(self) -> None:
+        self.finished = True
+
     # --------------------------------------------------
     # API
     # --------------------------------------------------
+    @property
+    def letters(self) -> str:
+        """სტრიქონი (`str` ინდექსირებადია — ძველი `letters` სიის ადგილი)."""
+        return self.line
+
     @property
     def total(self) -> int:
         """
         სტრიქონის სიგრძე.
         """
-        return len(self.letters)
+        return len(self.line)
 
     def acceptable(self, ch: str) -> bool:
         """
@@ -50,9 +90,9 @@ class TypingEngine:
         """
         მიმდინარე სამიზნე სიმბოლო.
         """
-        if self.finished or self.pos >= len(self.letters):
+        if self.finished or self.pos >= len(self.line):
             return ""
-        return self.letters[self.pos]
+        return self.line[self.pos]
 
     # backward compatibility TypingExercise-ისთვის
     def current(self) -> str:
@@ -67,12 +107,49 @@ class TypingEngine:
         if self.finished:
             return False
 
-        if ch != self.letters[self.pos]:
+        if ch != self.line[self.pos]:
             return False
 
         self.pos += 1
 
-        if self.pos >= len(self.letters):
+        if self.pos >= len(self.line):
             self.finished = True
 
         return True
+
+    def feed(self, keys: Iterable[str]) -> FeedResult:
+        """
+        კლავიშების მიმდევრობის დამუშავება ერთი გამოძახებით
+        (replay, benchmark, headless სიმულაცია).
+
+        დასრულების შემდეგ დარჩენილი კლავიშები არ მუშავდება.
+        თუ `keys` არის `str` და სტრიქონის გაგრძელებაა, მუშავდება ერთი
+        შედარებით (startswith), სიმბოლო-სიმბოლო ციკლის გარეშე.
+        """
+        line = self.line
+        n = len(line)
+        start = pos = self.pos
+        errors: List[int] = []
+
+        if self.finished:
+            return FeedResult(0, 0, start, start, errors)
+
+        if isinstance(keys, str) and line.startswith(keys, pos):
+            pos += len(keys)
+            hits = len(keys)
+            misses = 0
+        else:
+            hits = misses = 0
+            for ch in keys:
+                if pos >= n:
+                    break
+                if ch == line[pos]:
+                    pos += 1
+                    hits += 1
+                else:
+                    misses += 1
+                    errors.append(pos)
+
+        self.pos = pos
+        self.finished = pos >= n
+        return FeedResult(hits, misses, start, pos, errors)
@@ -0,0 +1,298 @@
+# logic/journal.py
+# KLAVA — Crash-safe append-only keystroke journal
+#
+# ფაილი: HEADER + N × RECORD (ფიქსირებული ზომა)
+# RECORD: დრო (unix, float64) | მოსალოდნელი სიმბოლო | აკრეფილი სიმბოლო | flags | crc32
+
+from __future__ import annotations
+
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+from typing import Iterator, List, NamedTuple, Optional, Tuple
+
+JOURNAL_MAGIC: bytes = b"KLJ1"
+JOURNAL_SUFFIX: str = ".klj"
+
+_HEADER = struct.Struct("<4sI")  # magic, record size
+_BODY = struct.Struct("<dIIB3x")
+_RECORD = struct.Struct("<dIIB3xI")
+RECORD_SIZE: int = _RECORD.size
+
+# flags
+FLAG_CORRECT: int = 0x01
+FLAG_SESSION_START: int = 0x02
+FLAG_SESSION_END: int = 0x04
+
+# ფონური ნაკადის გაღვიძება (სესიის დასაწყისი) — ჩასაწერი არაფერია
+_WAKE: Tuple[bytearray, int] = (bytearray(), 0)
+
+
+class JournalRecord(NamedTuple):
+    time: float
+    expected: str
+    typed: str
+    flags: int
+
+    @property
+    def correct(self) -> bool:
+        return bool(self.flags & FLAG_CORRECT)
+
+
+# ======================================================
+#   RECOVERY / READ
+# ======================================================
+def _record_ok(data: bytes, offset: int) -> bool:
+    crc = struct.unpack_from("<I", data, offset + _BODY.size)[0]
+    return zlib.crc32(data[offset : offset + _BODY.size]) == crc
+
+
+def recover(path: str) -> int:
+    """
+    ჟურნალის აღდგენა დენის გათიშვის შემდეგ.
+
+    - უხსნის ნაწილობრივ ჩაწერილ ბოლო ჩანაწერს (ზომა არ არის RECORD_SIZE-ის ჯერადი)
+    - ბოლოდან უკან აგდებს ჩანაწერებს, რომელთა crc არ ემთხვევა
+      (მაგ. ნულებით შევსებული ბლოკები)
+    - თუ header დაზიანებულია/არ არის — ფაილი თავიდან იწყება
+
+    :return: მოჭრილი ბაიტების რაოდენობა
+    """
+    try:
+        size = os.path.getsize(path)
+    except OSError:
+        return 0
+
+    with open(path, "r+b") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size or _HEADER.unpack(head) != (JOURNAL_MAGIC, RECORD_SIZE):
+            f.seek(0)
+            f.truncate()
+            f.write(_HEADER.pack(JOURNAL_MAGIC, RECORD_SIZE))
+            f.flush()
+            os.fsync(f.fileno())
+            return size
+
+        count = (size - _HEADER.size) // RECORD_SIZE
+        end = _HEADER.size + count * RECORD_SIZE
+
+        # ბოლოდან უკან — პირველ ვალიდურ ჩანაწერამდე
+        chunk = 256
+        while count:
+            n = min(chunk, count)
+            start = end - n * RECORD_SIZE
+            f.seek(start)
+            data = f.read(n * RECORD_SIZE)
+            good = n
+            while good and not _record_ok(data, (good - 1) * RECORD_SIZE):
+                good -= 1
+            end = start + good * RECORD_SIZE
+            count -= n - good
+            if good:
+                break
+
+        if end != size:
+            f.truncate(end)
+            f.flush()
+            os.fsync(f.fileno())
+        return size - end
+
+
+def read_journal(path: str) -> Iterator[JournalRecord]:
+    """ვალიდური ჩანაწერების წაკითხვა (დაზიანებული ჩანაწერები გამოტოვებულია)."""
+    with open(path, "rb") as f:
+        head = f.read(_HEADER.size)
+        if len(head) < _HEADER.size or _HEADER.unpack(head) != (JOURNAL_MAGIC, RECORD_SIZE):
+            return
+        while True:
+            data = f.read(RECORD_SIZE * 1024)
+            if not data:
+                return
+            for off in range(0, len(data) - RECORD_SIZE + 1, RECORD_SIZE):
+                if not _record_ok(data, off):
+                    continue
+                t, expected, typed, flags, _ = _RECORD.unpack_from(data, off)
+                yield JournalRecord(
+                    t,
+                    chr(expected) if expected else "",
+                    chr(typed) if typed else "",
+                    flags,
+                )
+
+
+# ======================================================
+#   WRITER
+# ======================================================
+class KeystrokeJournal:
+    """
+    კლავიშების ჟურნალი.
+
+    Tk-ის მთავარი ნაკადი (append) მხოლოდ წინასწარ გამოყოფილ buffer-ში
+    ალაგებს ჩანაწერებს (struct.pack_into) — I/O-ს არასოდეს ელოდება.
+    სავსე buffer (ან `flush_interval`-ის გასვლისას ნაწილობრივი) გადაეცემა
+    ფონურ ნაკადს, რომელიც წერს append-only ფაილში და აკეთებს fsync-ს.
+    სესიებს შორის ფონური ნაკადი არ იღვიძებს (ტაიმერი მხოლოდ სესიის დროს).
+
+    ჩანაწერის დრო — კლავიშის მიღების მომენტი (time.monotonic, Trainer-ის
+    რიგიდან), გადაყვანილი unix დროში ერთი წანაცვლებით, რომელიც სესიის
+    დასაწყისში ფიქსირდება — batch-ის დამუშავების მომენტი ჩანაწერებს არ
+    აერთიანებს და სესიის შიგნით საათის გადაწევა რიგს არ არღვევს.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        capacity: int = 1024,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self.path = path
+        self.capacity = capacity
+        self.flush_interval = flush_interval
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # წინა გაშვების დაზიანებული კუდის აღდგენა
+        if os.path.exists(path):
+            self.recovered_bytes = recover(path)
+        else:
+            self.recovered_bytes = 0
+            with open(path, "wb") as f:
+                f.write(_HEADER.pack(JOURNAL_MAGIC, RECORD_SIZE))
+
+        self._file = open(path, "ab")
+
+        # time.monotonic() → time.time(); განახლდება session_start-ში
+        self._wall_offset: float = time.time() - time.monotonic()
+
+        self._lock = threading.Lock()
+        self._buf = bytearray(capacity * RECORD_SIZE)
+        self._n = 0
+        self._free: "queue.SimpleQueue[bytearray]" = queue.SimpleQueue()
+        self._full: "queue.Queue[Optional[Tuple[bytearray, int]]]" = queue.Queue()
+
+        self.dropped_writes: int = 0
+        self._active = False  # სესია მიმდინარეობს — ნაწილობრივი buffer-ის ტაიმერი
+        self._closed = False
+        self._thread = threading.Thread(target=self._writer, name="klava-journal", daemon=True)
+        self._thread.start()
+
+    # ======================================================
+    #   HOT PATH (Tk ნაკადი)
+    # ======================================================
+    def append(self, expected: str, typed: str, flags: int, t: Optional[float] = None) -> None:
+        """ერთი ჩანაწერი; I/O არ ხდება."""
+        if t is None:
+            t = time.time()
+        e = ord(expected) if expected else 0
+        k = ord(typed) if typed else 0
+        with self._lock:
+            if self._closed:
+                return
+            off = self._n * RECORD_SIZE
+            buf = self._buf
+            _BODY.pack_into(buf, off, t, e, k, flags)
+            struct.pack_into("<I", buf, off + _BODY.size, zlib.crc32(buf[off : off + _BODY.size]))
+            self._n += 1
+            if self._n == self.capacity:
+                self._swap_locked()
+
+    def key(self, expected: str, typed: str, correct: bool, t: Optional[float] = None) -> None:
+        """
+        :param t: კლავიშის მიღების დრო (time.monotonic); None — ახლა
+        """
+        self.append(
+            expected,
+            typed,
+            FLAG_CORRECT if correct else 0,
+            None if t is None else t + self._wall_offset,
+        )
+
+    def session_start(self) -> None:
+        self._wall_offset = time.time() - time.monotonic()
+        self.append("", "", FLAG_SESSION_START)
+        self._active = True
+        self._full.put(_WAKE)
+
+    def session_end(self) -> None:
+        self.append("", "", FLAG_SESSION_END)
+        self._active = False
+        self.flush()
+
+    def flush(self) -> None:
+        """ნაწილობრივი buffer-ის გადაცემა ფონურ ნაკადს (არ ელოდება ჩაწერას)."""
+        with self._lock:
+            if self._n:
+                self._swap_locked()
+
+    def close(self) -> None:
+        """ყველაფრის ჩაწერა და ნაკადის დასრულება."""
+        with self._lock:
+            if self._closed:
+                return
+            if self._n:
+                self._swap_locked()
+            self._closed = True
+        self._full.put(None)
+        self._thread.join()
+        self._file.close()
+
+    # ======================================================
+    #   HELPERS
+    # ======================================================
+    def _swap_locked(self) -> None:
+        self._full.put((self._buf, self._n))
+        try:
+            self._buf = self._free.get_nowait()
+        except queue.Empty:
+            self._buf = bytearray(self.capacity * RECORD_SIZE)
+        self._n = 0
+
+    def _writer(self) -> None:
+        while True:
+            try:
+                item = self._full.get(timeout=self.flush_interval if self._active else None)
+            except queue.Empty:
+                self.flush()
+                continue
+            if item is None:
+                return
+            if item is _WAKE:
+                continue
+
+            batch: List[Tuple[bytearray, int]] = [item]
+            stop = False
+            while True:
+                try:
+                    more = self._full.get_nowait()
+                except queue.Empty:
+                    break
+                if more is None:
+                    stop = True
+                    break
+                if more is not _WAKE:
+                    batch.append(more)
+
+            try:
+                for buf, n in batch:
+                    self._file.write(memoryview(buf)[: n * RECORD_SIZE])
+                self._file.flush()
+                os.fsync(self._file.fileno())
+            except OSError:
+                self.dropped_writes += sum(n for _, n in batch)
+
+            for buf, _ in batch:
+                self._free.put(buf)
+
+            if stop:
+                return
+
+
+def journal_path(directory: str, day: Optional[float] = None) -> str:
+    """დღის ჟურნალის ფაილი: <dir>/klava-YYYYMMDD.klj"""
+    stamp = time.strftime("%Y%m%d", time.localtime(day))
+    return os.path.join(directory, f"klava-{stamp}{JOURNAL_SUFFIX}")
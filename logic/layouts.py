@@ -0,0 +1,199 @@
+# logic/layouts.py
+# KLAVA — Keyboard layouts (QWERTY, ქართული)
+# data/layouts/*.json იკითხება ერთხელ და კომპილირდება O(1) ცხრილებად
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+from typing import Dict, List, Optional, Set, Tuple
+
+LAYOUT_DIR: str = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "layouts"
+)
+DEFAULT_LAYOUT: str = "qwerty"
+
+SPACE: str = " "
+
+# X11 (evdev) keycode-ები: AD01 / AC01 / AB01 რიგების დასაწყისი და SPACE.
+# ფიზიკური პოზიციაა — არ არის დამოკიდებული OS-ის განლაგებაზე.
+X11_ROW_KEYCODES: Tuple[int, ...] = (24, 38, 52)
+X11_SPACE_KEYCODE: int = 65
+
+# ქართული ასოების X keysym სახელები (U+10D0 … U+10F0, ანბანის რიგით)
+GEORGIAN_KEYSYMS: Tuple[str, ...] = (
+    "an", "ban", "gan", "don", "en", "vin", "zen", "tan", "in", "kan", "las",
+    "man", "nar", "on", "par", "zhar", "rae", "san", "tar", "un", "phar",
+    "khar", "ghan", "qar", "shin", "chin", "can", "jil", "cil", "char", "xan",
+    "jhan", "hae",
+)  # fmt: skip
+_GEORGIAN_FIRST: int = 0x10D0
+
+
+def keysyms_for(ch: str) -> List[str]:
+    """Tk-ის keysym სახელები, რომლებიც სიმბოლოს `ch` შეესაბამება."""
+    if ch == SPACE:
+        return ["space"]
+    if ch.isascii():
+        return [ch.lower(), ch.upper()] if ch.isalpha() else [ch]
+
+    names = [f"U{ord(ch):04X}"]
+    i = ord(ch) - _GEORGIAN_FIRST
+    if 0 <= i < len(GEORGIAN_KEYSYMS):
+        names.insert(0, f"Georgian_{GEORGIAN_KEYSYMS[i]}")
+    return names
+
+
+class Layout:
+    """
+    კომპილირებული კლავიატურის განლაგება.
+
+    კლავიში (key) — ასო, რომელიც კლავიშზე წერია (ძირითადი ფენა);
+    სიმბოლო (char) — ის, რაც იბეჭდება (ძირითადი ან Shift ფენა).
+
+    ცხრილები (ყველა dict — O(1)):
+    - keysym_map / char_map / keycode_map — Tk event → char (keycode → key)
+    - key_of — char → key (მაგ. "ჭ" → "წ" ფონეტიკურში)
+    - finger_of — key/char → თითი
+    - position — key → (რიგი, სვეტი)
+    """
+
+    def __init__(self, spec: Dict[str, object]) -> None:
+        try:
+            self.name: str = str(spec["name"])
+            rows = [str(r) for r in spec["rows"]]  # type: ignore[union-attr]
+            columns = [str(f) for f in spec["finger_columns"]]  # type: ignore[union-attr]
+        except (KeyError, TypeError) as e:
+            raise ValueError(f"განლაგების ფაილი არასრულია: {e}") from e
+
+        self.title: str = str(spec.get("title", self.name))
+        self.upper: bool = spec.get("case", "none") == "upper"
+        self.rows: Tuple[str, ...] = tuple(rows)
+        self.shift: Dict[str, str] = dict(spec.get("shift") or {})  # type: ignore[arg-type]
+        sentences = spec.get("sentences")
+        self.sentences: Optional[str] = str(sentences) if sentences else None
+
+        self.position: Dict[str, Tuple[int, int]] = {}
+        self.key_of: Dict[str, str] = {}
+        self.finger_of: Dict[str, str] = {}
+        self.fingers: Dict[str, Set[str]] = {f: set() for f in dict.fromkeys(columns)}
+        self.keycode_map: Dict[int, str] = {}
+
+        for r, row in enumerate(rows):
+            for c, key in enumerate(row):
+                if key in self.position:
+                    raise ValueError(f"კლავიში '{key}' ორჯერაა განლაგებაში {self.name}")
+                if c >= len(columns):
+                    raise ValueError(f"რიგი {r} უფრო გრძელია, ვიდრე finger_columns")
+                self.position[key] = (r, c)
+                finger = columns[c]
+                for ch in (key, self.shift.get(key)):
+                    if ch:
+                        self.key_of[ch] = key
+                        self.finger_of[ch] = finger
+                        self.fingers[finger].add(ch)
+                if r < len(X11_ROW_KEYCODES):
+                    self.keycode_map[X11_ROW_KEYCODES[r] + c] = key
+
+        self.key_of[SPACE] = SPACE
+        self.keycode_map[X11_SPACE_KEYCODE] = SPACE
+
+        # ყველა საბეჭდი სიმბოლო (კლავიშები, Shift ფენა, SPACE)
+        self.keys: Tuple[str, ...] = tuple(self.position) + (SPACE,)
+        self.chars: Tuple[str, ...] = tuple(self.key_of)
+
+        # Tk event → char
+        self.keysym_map: Dict[str, str] = {}
+        self.char_map: Dict[str, str] = {}
+        for ch in self.chars:
+            for name in keysyms_for(ch):
+                self.keysym_map[name] = ch
+            self.char_map[ch] = ch
+            if self.upper:
+                self.char_map[ch.lower()] = ch
+
+    # ======================================================
+    #   API
+    # ======================================================
+    def normalize(self, text: str) -> str:
+        """
+        ტექსტის მიყვანა კლავიატურის ფორმაზე.
+        ქართულზე `upper()` არ გამოიყენება — Python მას მთავრულად აქცევს.
+        """
+        return text.upper() if self.upper else text
+
+    def translate(self, keysym: str, char: str = "", keycode: Optional[int] = None) -> Optional[str]:
+        """
+        Tk event → აკრეფილი სიმბოლო; None — განლაგებას არ ეკუთვნის.
+
+        :param keycode: X11 keycode — ფიზიკური პოზიციით თარგმნა, როცა
+                        OS-ის განლაგება სხვაა (მხოლოდ x11-ზე)
+        """
+        ch = self.keysym_map.get(keysym)
+        if ch is None and char:
+            ch = self.char_map.get(char)
+        if ch is None and keycode is not None:
+            ch = self.keycode_map.get(keycode)
+        return ch
+
+    def __repr__(self) -> str:
+        return f"Layout({self.name!r})"
+
+
+# ======================================================
+#   LOADING
+# ======================================================
+_CACHE: Dict[str, Layout] = {}
+
+
+def available_layouts(directory: str = LAYOUT_DIR) -> List[str]:
+    """data/layouts-ში არსებული განლაგებების სახელები."""
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return []
+    return sorted(n[:-5] for n in names if n.endswith(".json"))
+
+
+def layout_titles(directory: str = LAYOUT_DIR) -> List[Tuple[str, str]]:
+    """
+    (name, title) მენიუსთვის — კომპილაციის გარეშე (მხოლოდ JSON-ის წაკითხვა).
+    წაუკითხავი ფაილი გამოტოვდება და stderr-ში ჩაიწერება.
+    """
+    out: List[Tuple[str, str]] = []
+    for name in available_layouts(directory):
+        path = os.path.join(directory, f"{name}.json")
+        layout = _CACHE.get(path)
+        if layout is not None:
+            out.append((name, layout.title))
+            continue
+        try:
+            with open(path, encoding="utf-8") as f:
+                spec = json.load(f)
+            out.append((name, str(spec.get("title", name))))
+        except (OSError, ValueError, AttributeError) as e:
+            print(f"KLAVA: განლაგება '{name}' გამოტოვებულია: {e}", file=sys.stderr)
+    return out
+
+
+def load_layout(name: str = DEFAULT_LAYOUT, directory: str = LAYOUT_DIR) -> Layout:
+    """
+    განლაგების ჩატვირთვა სახელით (ან .json ფაილის გზით); კომპილირდება ერთხელ.
+
+    აგდებს:
+        ValueError: თუ ფაილი ვერ მოიძებნა ან არასწორია.
+    """
+    path = name if name.endswith(".json") else os.path.join(directory, f"{name}.json")
+    layout = _CACHE.get(path)
+    if layout is not None:
+        return layout
+
+    try:
+        with open(path, encoding="utf-8") as f:
+            spec = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise ValueError(f"განლაგება '{name}' ვერ ჩაიტვირთა: {e}") from e
+
+    layout = _CACHE[path] = Layout(spec)
+    return layout
@@ -0,0 +1,91 @@
+# logic/passage.py
+# KLAVA — Long passage text: normalization and lazy line wrapping
+# სტრიქონები ითვლება მხოლოდ კურსორის წინ — მთელი ტექსტის wrap არ ხდება
+
+from __future__ import annotations
+
+import re
+from typing import Container, List, Tuple
+
+_WHITESPACE = re.compile(r"\s+")
+_SPACES = re.compile(r" {2,}")
+
+# სტრიქონი: (start, end) — ტექსტის ინდექსები, end-ში ბოლო space-იც შედის
+Line = Tuple[int, int]
+
+
+def normalize_passage(text: str, chars: Container[str]) -> str:
+    """
+    ტექსტის მიყვანა საბეჭდ ფორმაზე: ხაზის გადატანები → space,
+    კლავიატურაზე არარსებული სიმბოლოები იშლება, space-ები ერთდება.
+
+    :param chars: განლაგების სიმბოლოები (`Layout.key_of`)
+    """
+    text = _WHITESPACE.sub(" ", text)
+    text = "".join(ch for ch in text if ch in chars)
+    return _SPACES.sub(" ", text).strip()
+
+
+def wrap_line(text: str, start: int, cols: int) -> int:
+    """
+    ერთი სტრიქონის დასასრული (greedy wrap space-ზე).
+
+    სტრიქონი იჭერს ბოლო space-ს, რომ ბეჭდვა უწყვეტი იყოს; თუ სიტყვა
+    `cols`-ზე გრძელია, იჭრება `cols`-ზე. ღირებულება — O(cols).
+    """
+    n = len(text)
+    if start >= n:
+        return n
+    limit = start + cols
+    if limit >= n:
+        return n
+    cut = text.rfind(" ", start, limit)
+    if cut == -1:
+        return limit
+    return cut + 1
+
+
+class PassageWindow:
+    """
+    ხილული სტრიქონების ფანჯარა: `above` უკვე აკრეფილი სტრიქონი,
+    მიმდინარე და დანარჩენი — ქვემოთ.
+
+    `advance()` გადადის შემდეგ სტრიქონზე: ზედა ამოვარდება, ქვემოთ
+    ემატება ერთი ახალი (wrap_line). მეხსიერება — O(lines).
+    """
+
+    def __init__(self, text: str, cols: int, lines: int, above: int = 1) -> None:
+        self.text = text
+        self.cols = max(1, cols)
+        self.size = max(1, lines)
+        self.above = min(above, self.size - 1)
+
+        self.row: int = 0  # მიმდინარე სტრიქონის ადგილი ფანჯარაში
+        self.lines: List[Line] = []
+        self.rewrap(0)
+
+    def rewrap(self, start: int) -> None:
+        """ფანჯრის ხელახლა აგება `start`-იდან (მაგ. ახალი სიგანე)."""
+        self.row = 0
+        self.lines = []
+        for _ in range(self.size):
+            self.lines.append(self._next(start))
+            start = self.lines[-1][1]
+
+    def _next(self, start: int) -> Line:
+        return start, wrap_line(self.text, start, self.cols)
+
+    @property
+    def current(self) -> Line:
+        return self.lines[self.row]
+
+    def advance(self) -> bool:
+        """შემდეგ სტრიქონზე გადასვლა; False — ტექსტი დასრულდა."""
+        if self.current[1] >= len(self.text):
+            return False
+        if self.row < self.above:
+            self.row += 1
+        else:
+            self.lines.pop(0)
+            self.lines.append(self._next(self.lines[-1][1]))
+        return True
@@ -1,5 +1,10 @@
 # logic/progress.py
-# KLAVA — Progress tracker
+# KLAVA — Progress tracker + session statistics
+
+from __future__ import annotations
+
+from array import array
+from typing import Dict, Iterable, Mapping, Optional, Sequence
 
 
 class Progress:
@@ -32,3 +37,183 @@ class Progress:
         """
         self.total = total
         self.current = 0
+
+
+class SessionStats:
+    """
+    სესიის სტატისტიკა — სვეტური (array) საცავი + ინკრემენტული აგრეგატები.
+
+    სვეტები (ring buffer, `capacity` ჩანაწერი — მეხსიერება შეზღუდულია):
+    - t         : დრო (monotonic, წამები)         array('d')
+    - key       : მოსალოდნელი კლავიშის ინდექსი    array('B'), 255 — უცნობი
+    - interval  : წინა კლავიშიდან გასული დრო      array('f')
+    - correct   : 1/0                             array('B')
+
+    აგრეგატები (წაკითხვა O(1)):
+    - wpm, live_wpm, accuracy
+    - error_rate(key), finger_latency(finger)
+    """
+
+    UNKNOWN_KEY = 255
+
+    def __init__(
+        self,
+        keys: Sequence[str],
+        finger_groups: Mapping[str, Iterable[str]],
+        capacity: int = 1 << 16,
+        window: float = 10.0,
+    ) -> None:
+        self.keys: tuple[str, ...] = tuple(keys)
+        self.fingers: tuple[str, ...] = tuple(finger_groups)
+        self.capacity = capacity
+        self.window = window
+
+        self._key_index: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+        finger_index = {f: i for i, f in enumerate(self.fingers)}
+        self._key_finger: list[int] = [-1] * len(self.keys)
+        for finger, group in finger_groups.items():
+            for k in group:
+                i = self._key_index.get(k)
+                if i is not None:
+                    self._key_finger[i] = finger_index[finger]
+
+        # ── სვეტები ─────────────────────────────
+        self.t = array("d", [0.0]) * capacity
+        self.key = array("B", [0]) * capacity
+        self.interval = array("f", [0.0]) * capacity
+        self.correct = array("B", [0]) * capacity
+
+        # ── აგრეგატები ──────────────────────────
+        self.attempts = array("L", [0]) * len(self.keys)
+        self.errors = array("L", [0]) * len(self.keys)
+        self.finger_time = array("d", [0.0]) * len(self.fingers)
+        self.finger_hits = array("L", [0]) * len(self.fingers)
+
+        self.reset()
+
+    # ======================================================
+    #   LIFECYCLE
+    # ======================================================
+    def reset(self) -> None:
+        """ახალი სესია (სვეტები არ გადანაწილდება — მხოლოდ მრიცხველები)."""
+        self.count = 0  # ჯამში დარეგისტრირებული
+        self.total = 0
+        self.hits = 0
+        self.started: Optional[float] = None
+        self.last: Optional[float] = None
+        self._last_hit: Optional[float] = None
+
+        # live WPM-ის ფანჯარა: [_win_start, count) ring-ში
+        self._win_start = 0
+        self._win_hits = 0
+
+        for col in (self.attempts, self.errors, self.finger_hits):
+            for i in range(len(col)):
+                col[i] = 0
+        for i in range(len(self.finger_time)):
+            self.finger_time[i] = 0.0
+
+    # ======================================================
+    #   HOT PATH
+    # ======================================================
+    def record(self, expected: str, correct: bool, t: float) -> None:
+        """ერთი შეფასებული კლავიში."""
+        k = self._key_index.get(expected, self.UNKNOWN_KEY)
+
+        if self.started is None:
+            self.started = t
+            self._last_hit = t
+        interval = t - self.last if self.last is not None else 0.0
+        self.last = t
+
+        i = self.count % self.capacity
+        self.t[i] = t
+        self.key[i] = k
+        self.interval[i] = interval
+        self.correct[i] = 1 if correct else 0
+        self.count += 1
+        self.total += 1
+
+        if k != self.UNKNOWN_KEY:
+            self.attempts[k] += 1
+            if not correct:
+                self.errors[k] += 1
+
+        if correct:
+            self.hits += 1
+            self._win_hits += 1
+            f = self._key_finger[k] if k != self.UNKNOWN_KEY else -1
+            if f >= 0 and self._last_hit is not None:
+                self.finger_time[f] += t - self._last_hit
+                self.finger_hits[f] += 1
+            self._last_hit = t
+
+        self._slide(t)
+
+    def _slide(self, now: float) -> None:
+        """ფანჯრის დასაწყისის წაწევა (ამორტიზებული O(1))."""
+        start = max(self._win_start, self.count - self.capacity)
+        if start != self._win_start:
+            # ring-მა გადაფარა ფანჯრის დასაწყისი — ვითვლით თავიდან
+            self._win_hits = sum(
+                self.correct[j % self.capacity] for j in range(start, self.count)
+            )
+        limit = now - self.window
+        while start < self.count - 1 and self.t[start % self.capacity] < limit:
+            self._win_hits -= self.correct[start % self.capacity]
+            start += 1
+        self._win_start = start
+
+    # ======================================================
+    #   AGGREGATES (O(1))
+    # ======================================================
+    @property
+    def elapsed(self) -> float:
+        if self.started is None or self.last is None:
+            return 0.0
+        return self.last - self.started
+
+    @property
+    def accuracy(self) -> float:
+        """სწორი / ყველა (0..1)."""
+        return self.hits / self.total if self.total else 1.0
+
+    @property
+    def wpm(self) -> float:
+        """სესიის WPM (5 სწორი სიმბოლო = 1 სიტყვა)."""
+        minutes = self.elapsed / 60.0
+        return self.hits / 5.0 / minutes if minutes > 0 else 0.0
+
+    def live_wpm(self, now: Optional[float] = None) -> float:
+        """ბოლო `window` წამის WPM."""
+        if self.count == 0:
+            return 0.0
+        if now is not None:
+            self._slide(now)
+        first = self.t[self._win_start % self.capacity]
+        span = max((now if now is not None else self.last or first) - first, 1.0)
+        return self._win_hits / 5.0 / (span / 60.0)
+
+    def error_rate(self, key: str) -> float:
+        k = self._key_index.get(key)
+        if k is None or not self.attempts[k]:
+            return 0.0
+        return self.errors[k] / self.attempts[k]
+
+    def finger_latency(self, finger: str) -> float:
+        """საშუალო რეაქციის დრო (წამი) თითისთვის."""
+        f = self.fingers.index(finger)
+        return self.finger_time[f] / self.finger_hits[f] if self.finger_hits[f] else 0.0
+
+    def weak_keys(self, limit: int = 5, min_attempts: int = 3) -> Dict[str, float]:
+        """
+        ყველაზე მაღალი შეცდომის სიხშირის კლავიშები → error rate
+        (WeakKeySelector-ის წონებად).
+        """
+        rates = [
+            (self.errors[k] / self.attempts[k], key)
+            for k, key in enumerate(self.keys)
+            if self.attempts[k] >= min_attempts and self.errors[k]
+        ]
+        rates.sort(reverse=True)
+        return {key: rate for rate, key in rates[:limit]}
@@ -0,0 +1,328 @@
+# logic/quantiles.py
+# KLAVA — Streaming quantile sketches (DDSketch-style)
+# შეზღუდული მეხსიერება, ფარდობითი სიზუსტე, შერწყმადი (merge), კომპაქტური სერიალიზაცია
+
+from __future__ import annotations
+
+import math
+import os
+import struct
+from array import array
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+_SKETCH_HEADER = struct.Struct("<dQQdddiI")  # alpha, count, zero, min, max, sum, offset, bins
+
+
+def _write_varint(out: bytearray, n: int) -> None:
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+
+
+def _read_varint(data: bytes, pos: int) -> Tuple[int, int]:
+    """(მნიშვნელობა, ახალი პოზიცია); მოჭრილი/გრძელი varint — ValueError."""
+    n = shift = 0
+    while True:
+        if pos >= len(data) or shift > 63:
+            raise ValueError("დაზიანებული varint")
+        b = data[pos]
+        pos += 1
+        n |= (b & 0x7F) << shift
+        if b < 0x80:
+            return n, pos
+        shift += 7
+
+
+class QuantileSketch:
+    """
+    ნაკადური quantile-ის შემფასებელი (DDSketch).
+
+    - მნიშვნელობა x ხვდება bucket-ში i = ⌈log_γ x⌉, γ = (1+α)/(1−α)
+    - quantile-ის ფარდობითი ცდომილება ≤ α
+    - bucket-ები ≤ max_bins; გადაჭარბებისას უმცირესები ერთიანდება
+      (ზედა quantile-ები — p50/p90/p99 — ზუსტი რჩება)
+    - `merge` — იგივე α-ს მქონე sketch-ების შეჯამება
+    """
+
+    __slots__ = ("alpha", "max_bins", "min_value", "_gamma_ln", "_offset", "_bins",
+                 "count", "zero", "min", "max", "sum")
+
+    def __init__(self, alpha: float = 0.02, max_bins: int = 256, min_value: float = 1e-6) -> None:
+        if not 0 < alpha < 1:
+            raise ValueError("alpha უნდა იყოს (0, 1)-ში")
+        self.alpha = alpha
+        self.max_bins = max_bins
+        self.min_value = min_value
+        self._gamma_ln = math.log((1 + alpha) / (1 - alpha))
+
+        self._offset = 0  # პირველი bucket-ის ინდექსი
+        self._bins = array("L")
+
+        self.count = 0
+        self.zero = 0  # ≤ min_value
+        self.min = math.inf
+        self.max = -math.inf
+        self.sum = 0.0
+
+    # ======================================================
+    #   INSERT
+    # ======================================================
+    def add(self, x: float, n: int = 1) -> None:
+        self.count += n
+        self.sum += x * n
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+        if x <= self.min_value:
+            self.zero += n
+            return
+
+        i = math.ceil(math.log(x) / self._gamma_ln)
+        self._add_bin(i, n)
+
+    def _add_bin(self, i: int, n: int) -> None:
+        bins = self._bins
+        if not bins:
+            self._offset = i
+            bins.append(n)
+            return
+
+        if i < self._offset:
+            if len(bins) + (self._offset - i) > self.max_bins:
+                # უმცირესი bucket-ები ერთიანდება პირველში
+                bins[0] += n
+                return
+            bins[0:0] = array("L", [0]) * (self._offset - i)
+            self._offset = i
+        elif i >= self._offset + len(bins):
+            bins.extend(array("L", [0]) * (i - self._offset - len(bins) + 1))
+
+        bins[i - self._offset] += n
+        self._collapse()
+
+    def _collapse(self) -> None:
+        bins = self._bins
+        extra = len(bins) - self.max_bins
+        if extra > 0:
+            folded = sum(bins[: extra + 1])
+            del bins[:extra]
+            bins[0] = folded
+            self._offset += extra
+
+    # ======================================================
+    #   QUERY
+    # ======================================================
+    def quantile(self, q: float) -> float:
+        """q ∈ [0, 1]; ცარიელ sketch-ზე — 0.0."""
+        if self.count == 0:
+            return 0.0
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = self.zero
+        if rank < seen:
+            return self.min
+        for j, c in enumerate(self._bins):
+            seen += c
+            if seen > rank:
+                i = self._offset + j
+                value = 2.0 * math.exp(i * self._gamma_ln) / (1.0 + math.exp(self._gamma_ln))
+                return min(max(value, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    # ======================================================
+    #   MERGE / SERIALIZE
+    # ======================================================
+    def merge(self, other: "QuantileSketch") -> None:
+        if other.alpha != self.alpha:
+            raise ValueError("შერწყმა შესაძლებელია მხოლოდ იგივე alpha-ით")
+        if other.count == 0:
+            return
+        self.count += other.count
+        self.zero += other.zero
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        for j, c in enumerate(other._bins):
+            if c:
+                self._add_bin(other._offset + j, c)
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(
+            _SKETCH_HEADER.pack(
+                self.alpha,
+                self.count,
+                self.zero,
+                self.min if self.count else 0.0,
+                self.max if self.count else 0.0,
+                self.sum,
+                self._offset,
+                len(self._bins),
+            )
+        )
+        for c in self._bins:
+            _write_varint(out, c)
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, max_bins: int = 256) -> "QuantileSketch":
+        alpha, count, zero, lo, hi, total, offset, nbins = _SKETCH_HEADER.unpack_from(data, 0)
+        sketch = cls(alpha, max(max_bins, nbins))
+        sketch.count = count
+        sketch.zero = zero
+        sketch.min = lo if count else math.inf
+        sketch.max = hi if count else -math.inf
+        sketch.sum = total
+        sketch._offset = offset
+        pos = _SKETCH_HEADER.size
+        for _ in range(nbins):
+            c, pos = _read_varint(data, pos)
+            try:
+                sketch._bins.append(c)
+            except OverflowError:
+                raise ValueError("bucket-ის მნიშვნელობა დიაპაზონს სცდება") from None
+        return sketch
+
+
+# ======================================================
+#   რეაქციის დრო — კლავიშებზე და თითებზე
+# ======================================================
+_REACTION_MAGIC: bytes = b"KLRS"
+_ENTRY = struct.Struct("<HI")  # სახელის სიგრძე, sketch-ის სიგრძე
+
+
+class ReactionSketches:
+    """
+    რეაქციის დროის sketch-ები თითო კლავიშზე და თითო თითზე.
+
+    `hit(key, t)` გამოიძახება სწორ კლავიშზე; ინტერვალი ითვლება წინა
+    სწორი კლავიშიდან (ან `restart`-იდან — მაგ. ახალი სტრიქონის დასაწყისი).
+    """
+
+    def __init__(
+        self,
+        keys: Iterable[str],
+        finger_groups: Mapping[str, Iterable[str]],
+        alpha: float = 0.02,
+    ) -> None:
+        self.alpha = alpha
+        self.keys: Dict[str, QuantileSketch] = {k: QuantileSketch(alpha) for k in keys}
+        self.fingers: Dict[str, QuantileSketch] = {f: QuantileSketch(alpha) for f in finger_groups}
+        self._finger_of: Dict[str, str] = {
+            k: f for f, group in finger_groups.items() for k in group
+        }
+        self._last: Optional[float] = None
+
+    def restart(self, t: Optional[float] = None) -> None:
+        """ინტერვალის ათვლა თავიდან (სტრიქონის/სესიის დასაწყისი)."""
+        self._last = t
+
+    def hit(self, key: str, t: float) -> None:
+        last = self._last
+        self._last = t
+        if last is None:
+            return
+        dt = t - last
+        sketch = self.keys.get(key)
+        if sketch is not None:
+            sketch.add(dt)
+        finger = self._finger_of.get(key)
+        if finger is not None:
+            self.fingers[finger].add(dt)
+
+    def summary(self, name: str, qs: Tuple[float, ...] = (0.5, 0.9)) -> Tuple[float, ...]:
+        """კლავიშის ან თითის quantile-ები (წამებში)."""
+        sketch = self.keys.get(name) or self.fingers[name]
+        return tuple(sketch.quantile(q) for q in qs)
+
+    def merge(self, other: "ReactionSketches") -> None:
+        for table, others in ((self.keys, other.keys), (self.fingers, other.fingers)):
+            for name, sketch in others.items():
+                mine = table.get(name)
+                if mine is None:
+                    table[name] = mine = QuantileSketch(sketch.alpha)
+                mine.merge(sketch)
+
+    # ── სერიალიზაცია ─────────────────────────────
+    def to_bytes(self) -> bytes:
+        out = bytearray(_REACTION_MAGIC)
+        entries: List[Tuple[bytes, bytes]] = []
+        for prefix, table in (("k:", self.keys), ("f:", self.fingers)):
+            for name, sketch in table.items():
+                if sketch.count:
+                    entries.append(((prefix + name).encode("utf-8"), sketch.to_bytes()))
+        out += struct.pack("<I", len(entries))
+        for name_b, data in entries:
+            out += _ENTRY.pack(len(name_b), len(data))
+            out += name_b
+            out += data
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: bytes,
+        keys: Iterable[str],
+        finger_groups: Mapping[str, Iterable[str]],
+    ) -> "ReactionSketches":
+        if data[:4] != _REACTION_MAGIC:
+            raise ValueError("არასწორი reaction sketch ფაილი")
+        result = cls(keys, finger_groups)
+        (n,) = struct.unpack_from("<I", data, 4)
+        pos = 8
+        for _ in range(n):
+            name_len, data_len = _ENTRY.unpack_from(data, pos)
+            pos += _ENTRY.size
+            name = data[pos : pos + name_len].decode("utf-8")
+            pos += name_len
+            if pos + data_len > len(data):
+                raise ValueError("მოჭრილი reaction sketch ფაილი")
+            sketch = QuantileSketch.from_bytes(data[pos : pos + data_len])
+            pos += data_len
+            table = result.keys if name.startswith("k:") else result.fingers
+            table[name[2:]] = sketch
+        return result
+
+    # ── ფაილი ───────────────────────────────────
+    @classmethod
+    def load(
+        cls,
+        path: str,
+        keys: Iterable[str],
+        finger_groups: Mapping[str, Iterable[str]],
+    ) -> "ReactionSketches":
+        """ფაილიდან ჩატვირთვა; არარსებული/დაზიანებული ფაილი — ცარიელი sketch-ები."""
+        try:
+            with open(path, "rb") as f:
+                return cls.from_bytes(f.read(), keys, finger_groups)
+        except (OSError, ValueError, struct.error):
+            return cls(keys, finger_groups)
+
+    def save(self, path: str) -> None:
+        """ატომური ჩაწერა (tmp + fsync + os.replace) — გათიშვისას რჩება ან ძველი, ან ახალი ფაილი."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        try:
+            with open(tmp, "wb") as f:
+                f.write(self.to_bytes())
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
@@ -0,0 +1,247 @@
+# logic/scoring.py
+# KLAVA — Incremental edit-distance scoring (free typing with backspace)
+# Myers / Hyyrö bit-parallel: ერთი კლავიში = O(m / w) სიტყვის ოპერაცია
+
+from __future__ import annotations
+
+from typing import Dict, Iterator, List, Tuple
+
+# alignment-ის ოპერაციები
+MATCH = "="
+SUBSTITUTE = "~"
+INSERT = "+"  # ზედმეტი აკრეფილი სიმბოლო
+DELETE = "-"  # გამოტოვებული სამიზნე სიმბოლო
+
+# კურსორის ძებნის ზოლი: წინა კურსორიდან [c, c + AHEAD]
+CURSOR_AHEAD: int = 3
+
+# ბოლო აკრეფილი სიმბოლოები, რომელთა შეფასება ყოველ კლავიშზე ზუსტდება
+# (traceback) — ძველები აღარ იცვლება
+RETRACE_TAIL: int = 8
+
+
+class EditScorer:
+    """
+    აკრეფილი ტექსტის სამიზნე სტრიქონთან შედარება edit distance-ით.
+
+    მდგომარეობა — DP ცხრილის სვეტი ვერტიკალური სხვაობებით (VP/VN
+    ბიტური ვექტორები, Python int): D[i][j] = j + popcount(VP & low_i) -
+    popcount(VN & low_i), სადაც j — აკრეფილი სიმბოლოები, i — სამიზნის prefix.
+
+    - `type(ch)` — ახალი სვეტი: O(m / w), ცხრილის ხელახლა გამოთვლის გარეშე
+    - `backspace()` — სვეტების სტეკიდან ამოღება: O(1)
+    - `cursor` — სამიზნის პოზიცია, რომელსაც აკრეფილი ტექსტი ყველაზე
+      კარგად შეესაბამება (ეძებს ზოლში წინა კურსორის გარშემო)
+    - `errors` — აკრეფილი სიმბოლოების ინდექსები, რომლებიც alignment-ში
+      არ ემთხვევა სამიზნეს (canvas-ის შეფერადებისთვის); ბოლო
+      RETRACE_TAIL სიმბოლო ყოველ კლავიშზე ზუსტდება traceback-ით
+    - `alignment()` — ზუსტი traceback (სესიის ბოლოს / შედეგისთვის)
+    """
+
+    __slots__ = (
+        "target",
+        "typed",
+        "_peq",
+        "_mask",
+        "_high",
+        "_vp",
+        "_vn",
+        "_score",
+        "_cursor",
+        "_stack",
+        "_wrong",
+    )
+
+    def __init__(self, target: str = "") -> None:
+        self.target: str = ""
+        self.typed: List[str] = []
+        self._peq: Dict[str, int] = {}
+        self._mask: int = 0
+        self._high: int = 0
+        self._vp: int = 0
+        self._vn: int = 0
+        self._score: int = 0
+        self._cursor: int = 0
+        # j-ური სიმბოლოს აკრეფის შემდეგი სვეტი: (vp, vn, score, cursor)
+        self._stack: List[Tuple[int, int, int, int]] = []
+        # j-ური აკრეფილი სიმბოლო შეცდომაა (1) თუ არა (0)
+        self._wrong: bytearray = bytearray()
+        self.reset(target)
+
+    def reset(self, target: str) -> None:
+        """ახალი სამიზნე სტრიქონი; Peq ცხრილი — O(m)."""
+        m = len(target)
+        self.target = target
+        self.typed.clear()
+        self._stack.clear()
+        self._wrong.clear()
+
+        peq: Dict[str, int] = {}
+        for i, ch in enumerate(target):
+            peq[ch] = peq.get(ch, 0) | (1 << i)
+        self._peq = peq
+
+        self._mask = (1 << m) - 1
+        self._high = 1 << (m - 1) if m else 0
+        self._vp = self._mask  # D[i][0] = i
+        self._vn = 0
+        self._score = m  # D[m][0]
+        self._cursor = 0
+
+    # ======================================================
+    #   INPUT
+    # ======================================================
+    def type(self, ch: str) -> bool:
+        """
+        ერთი აკრეფილი სიმბოლო.
+
+        :return: True — სიმბოლო ემთხვევა სამიზნეს თავის (ახალ) პოზიციაზე
+        """
+        self.typed.append(ch)
+        self._wrong.append(0)
+
+        mask = self._mask
+        vp = self._vp
+        vn = self._vn
+        eq = self._peq.get(ch, 0)
+
+        # Hyyrö: edit distance-ის სვეტი (D[0][j] = j → Ph-ის carry-in = 1)
+        xv = eq | vn
+        xh = (((eq & vp) + vp) ^ vp) | eq
+        ph = vn | (~(xh | vp) & mask)
+        mh = vp & xh
+        if ph & self._high or not self._high:  # ცარიელი სამიზნე: D[0][j] = j
+            self._score += 1
+        elif mh & self._high:
+            self._score -= 1
+        ph = ((ph << 1) | 1) & mask
+        mh = (mh << 1) & mask
+        self._vp = mh | (~(xv | ph) & mask)
+        self._vn = ph & xv
+
+        self._move_cursor()
+        self._stack.append((self._vp, self._vn, self._score, self._cursor))
+        self._retrace(RETRACE_TAIL)
+        return not self._wrong[-1]
+
+    def backspace(self) -> bool:
+        """ბოლო აკრეფილი სიმბოლოს წაშლა; False — წასაშლელი არაფერია."""
+        stack = self._stack
+        if not stack:
+            return False
+        stack.pop()
+        self.typed.pop()
+        self._wrong.pop()
+        if stack:
+            self._vp, self._vn, self._score, self._cursor = stack[-1]
+        else:
+            self._vp, self._vn, self._score, self._cursor = self._mask, 0, len(self.target), 0
+        # დარჩენილი ბოლო სიმბოლოები გრძელ ტექსტზე იყო შეფასებული
+        self._retrace(RETRACE_TAIL)
+        return True
+
+    def _move_cursor(self) -> None:
+        """
+        ახალი კურსორი: ზოლში მინიმალური D[i][n]; თანაბარზე — წინა + 1-თან
+        ახლოს მყოფი (ჩანაცვლება უპირატესია ზედმეტ სიმბოლოზე).
+        """
+        prev = self._cursor
+        hi = min(len(self.target), prev + CURSOR_AHEAD)
+
+        best = min(prev + 1, hi)
+        best_d = self.distance_at(best)
+        for i in range(prev, hi + 1):
+            d = self.distance_at(i)
+            if d < best_d or (d == best_d and abs(i - prev - 1) < abs(best - prev - 1)):
+                best, best_d = i, d
+        self._cursor = best
+
+    def _retrace(self, steps: int) -> None:
+        """ბოლო `steps` აკრეფილი სიმბოლოს შეფასება ზუსტი traceback-ით."""
+        wrong = self._wrong
+        n = len(self.typed)
+        stop = max(0, n - steps)
+        for op, _, j in self._trace(self._cursor, n, stop):
+            if j >= 0:
+                wrong[j] = op != MATCH
+
+    # ======================================================
+    #   შედეგები
+    # ======================================================
+    def distance_at(self, i: int) -> int:
+        """D[i][n] — სამიზნის პირველი i სიმბოლოს მანძილი აკრეფილამდე: O(m / w)."""
+        low = (1 << i) - 1
+        return len(self.typed) + (self._vp & low).bit_count() - (self._vn & low).bit_count()
+
+    @property
+    def distance(self) -> int:
+        """მანძილი მთელ სამიზნე სტრიქონამდე (D[m][n])."""
+        return self._score
+
+    @property
+    def cursor(self) -> int:
+        return self._cursor
+
+    @property
+    def prefix_distance(self) -> int:
+        """მანძილი სამიზნის კურსორამდე ნაწილთან — მიმდინარე შეცდომები."""
+        return self.distance_at(self._cursor)
+
+    @property
+    def errors(self) -> List[int]:
+        """აკრეფილი სიმბოლოების ინდექსები, რომლებიც შეცდომად ჩაითვალა."""
+        return [j for j, w in enumerate(self._wrong) if w]
+
+    def is_error(self, j: int) -> bool:
+        return bool(self._wrong[j])
+
+    @property
+    def accuracy(self) -> float:
+        n = max(len(self.typed), self._cursor)
+        return 1.0 - self.prefix_distance / n if n else 1.0
+
+    @property
+    def finished(self) -> bool:
+        return self._cursor >= len(self.target)
+
+    def alignment(self) -> List[Tuple[str, int, int]]:
+        """
+        ზუსტი alignment (traceback შენახული სვეტებით) კურსორამდე:
+        (ოპერაცია, სამიზნის ინდექსი, აკრეფილის ინდექსი); -1 — არ არსებობს.
+        ღირებულება O((m + n) · m / w) — გამოიყენება შედეგისთვის, არა კლავიშზე.
+        """
+        ops = list(self._trace(self._cursor, len(self.typed), 0))
+        ops.reverse()
+        return ops
+
+    def _column(self, j: int) -> Tuple[int, int]:
+        """j სიმბოლოს აკრეფის შემდეგი (VP, VN)."""
+        if j == 0:
+            return self._mask, 0
+        vp, vn, _, _ = self._stack[j - 1]
+        return vp, vn
+
+    def _trace(self, i: int, j: int, stop: int) -> Iterator[Tuple[str, int, int]]:
+        """traceback (i, j)-დან უკან, სანამ აკრეფილი ინდექსი `stop`-ს არ მიაღწევს."""
+        target, typed = self.target, self.typed
+
+        def d(i: int, j: int) -> int:
+            vp, vn = self._column(j)
+            low = (1 << i) - 1
+            return j + (vp & low).bit_count() - (vn & low).bit_count()
+
+        while (i > 0 or j > 0) and (j > stop or stop == 0):
+            here = d(i, j)
+            if i > 0 and j > 0:
+                same = target[i - 1] == typed[j - 1]
+                if d(i - 1, j - 1) + (0 if same else 1) == here:
+                    yield (MATCH if same else SUBSTITUTE), i - 1, j - 1
+                    i -= 1
+                    j -= 1
+                    continue
+            if j > 0 and d(i, j - 1) + 1 == here:
+                yield INSERT, -1, j - 1
+                j -= 1
+            else:
+                yield DELETE, i - 1, -1
+                i -= 1
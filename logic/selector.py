@@ -0,0 +1,160 @@
+# logic/selector.py
+# KLAVA — Weak-key sentence selector (inverted index)
+
+from __future__ import annotations
+
+import bisect
+import random
+from typing import Dict, Iterable, List, Mapping, Optional, Union
+
+from logic.compiled_corpus import CompiledCorpus
+
+
+class WeakKeySelector:
+    """
+    სუსტი კლავიშების სავარჯიშო სტრიქონების შერჩევა.
+
+    პასუხისმგებლობა:
+    - კანდიდატების აღება inverted index-ის posting list-ებიდან
+      (იშვიათი term-ები პირველი), კორპუსის სრული სკანირების გარეშე
+    - N სტრიქონის ხარბი (greedy) შერჩევა სუსტი კლავიშების მაქსიმალური დაფარვით
+
+    ღირებულება დამოკიდებულია `max_candidates`-ზე და term-ების რაოდენობაზე,
+    არა კორპუსის ზომაზე (posting list-ში წევრობა მოწმდება bisect-ით).
+    """
+
+    # უკვე დაფარული term-ის წონა მცირდება ყოველ შერჩევაზე
+    COVERED_DECAY: float = 0.5
+
+    def __init__(
+        self,
+        corpus: CompiledCorpus,
+        max_candidates: int = 512,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.corpus = corpus
+        self.max_candidates = max_candidates
+        self.rng = rng or random.Random()
+
+    # ======================================================
+    #   API
+    # ======================================================
+    def select(
+        self,
+        weak_keys: Union[Iterable[str], Mapping[str, float]],
+        n: int,
+    ) -> List[int]:
+        """
+        აბრუნებს ≤ n ხაზის id-ს, რომლებიც მაქსიმალურად ფარავს სუსტ კლავიშებს.
+
+        :param weak_keys: კლავიშები ან ბიგრამები ("Q", "TH", ...), ან
+                          რუკა term → წონა (მაგ. შეცდომის სიხშირე)
+        :param n: სტრიქონების რაოდენობა
+        """
+        weights = self._weights(weak_keys)
+        if not weights or n <= 0:
+            return []
+
+        # იშვიათი term-ები პირველი — ისინი ყველაზე მეტად ზღუდავენ არჩევანს
+        terms = sorted(weights, key=lambda t: len(self.corpus.postings(t)))
+        lists = [self.corpus.postings(t) for t in terms]
+
+        candidates = self._candidates(lists)
+        if not candidates:
+            return []
+
+        # თითო კანდიდატის term-ების ბიტური ნიღაბი და სიმჭიდროვე
+        masks: Dict[int, int] = {}
+        density: Dict[int, float] = {}
+        for c in candidates:
+            mask = 0
+            hits = 0.0
+            for bit, (t, ids) in enumerate(zip(terms, lists)):
+                if _contains(ids, c):
+                    mask |= 1 << bit
+                    hits += weights[t] * self._occurrences(c, t)
+            masks[c] = mask
+            density[c] = hits / max(1, self.corpus.length(c))
+
+        w = [weights[t] for t in terms]
+        chosen: List[int] = []
+        for _ in range(min(n, len(candidates))):
+            best = max(
+                masks,
+                key=lambda c: (_gain(masks[c], w), density[c]),
+            )
+            chosen.append(best)
+            mask = masks.pop(best)
+            for bit in range(len(w)):
+                if mask >> bit & 1:
+                    w[bit] *= self.COVERED_DECAY
+
+        return chosen
+
+    # ======================================================
+    #   HELPERS
+    # ======================================================
+    def _weights(
+        self, weak_keys: Union[Iterable[str], Mapping[str, float]]
+    ) -> Dict[str, float]:
+        if isinstance(weak_keys, Mapping):
+            items = list(weak_keys.items())
+        else:
+            items = [(k, 1.0) for k in weak_keys]
+
+        keyset = self.corpus.keyset
+        weights: Dict[str, float] = {}
+        for key, weight in items:
+            # QWERTY-ს `.klc` UPPERCASE-ს ინახავს; ქართული ასო კი თავისი
+            # ფორმით (upper() მას მთავრულად აქცევდა)
+            for term in (key, key.upper()):
+                try:
+                    keyset.term_id(term)
+                    break
+                except (KeyError, ValueError):
+                    continue
+            else:
+                continue
+            if weight > 0:
+                weights[term] = weights.get(term, 0.0) + weight
+        return weights
+
+    def _candidates(self, lists: List[memoryview]) -> List[int]:
+        """
+        თითო posting list-იდან თანაბარი წილი, შემთხვევითი წანაცვლებით და
+        თანაბარი ბიჯით (რომ სესიებს შორის სტრიქონები იცვლებოდეს).
+        """
+        share = max(1, self.max_candidates // len(lists))
+        seen: set[int] = set()
+        for ids in lists:
+            size = len(ids)
+            if size == 0:
+                continue
+            take = min(share, size)
+            step = size / take
+            start = self.rng.random() * step
+            for j in range(take):
+                seen.add(ids[int(start + j * step)])
+        return list(seen)
+
+    def _occurrences(self, line_id: int, term: str) -> int:
+        if len(term) == 1:
+            return self.corpus.key_count(line_id, term)
+        return 1
+
+
+def _contains(ids: memoryview, value: int) -> bool:
+    """დალაგებულ posting list-ში წევრობა (bisect)."""
+    i = bisect.bisect_left(ids, value)
+    return i < len(ids) and ids[i] == value
+
+
+def _gain(mask: int, weights: List[float]) -> float:
+    gain = 0.0
+    bit = 0
+    while mask:
+        if mask & 1:
+            gain += weights[bit]
+        mask >>= 1
+        bit += 1
+    return gain
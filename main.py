@@ -1,9 +1,21 @@
-from trainer import Trainer
+import time
+
+_T0 = time.perf_counter()
+
 import tkinter as tk
 
+from diagnostics.startup import startup
+from trainer import STARTUP_PROFILE, Trainer
+
 __version__ = "0.3.1-alfa"
 
 if __name__ == "__main__":
-    root = tk.Tk()
+    # გაშვების ფაზები (KLAVA_STARTUP_PROFILE): import-იდან პირველ paint-მდე
+    if STARTUP_PROFILE:
+        startup.enable(STARTUP_PROFILE, t0=_T0)
+        startup.mark("import")
+
+    with startup.phase("tk"):
+        root = tk.Tk()
     Trainer(root)
     root.mainloop()
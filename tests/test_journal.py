@@ -0,0 +1,138 @@
+# tests/test_journal.py
+# KLAVA — KeystrokeJournal: ჩაწერა/წაკითხვა, crc, კუდის აღდგენა
+
+import os
+import time
+
+from logic.journal import (
+    FLAG_CORRECT,
+    FLAG_SESSION_END,
+    FLAG_SESSION_START,
+    RECORD_SIZE,
+    KeystrokeJournal,
+    read_journal,
+    recover,
+)
+
+
+def write_session(path, keys, capacity=4):
+    journal = KeystrokeJournal(path, capacity=capacity)
+    journal.session_start()
+    t = time.monotonic()
+    for n, (expected, typed) in enumerate(keys):
+        journal.key(expected, typed, expected == typed, t + n)
+    journal.session_end()
+    journal.close()
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "j.klj")
+    keys = [("ა", "ა"), ("ბ", "გ"), ("ბ", "ბ")] * 5
+    write_session(path, keys)
+
+    records = list(read_journal(path))
+    assert records[0].flags == FLAG_SESSION_START
+    assert records[-1].flags == FLAG_SESSION_END
+    body = records[1:-1]
+    assert [(r.expected, r.typed) for r in body] == keys
+    assert [r.correct for r in body] == [e == k for e, k in keys]
+    # კლავიშის დრო — event-ის დრო, არა batch-ის ჩაწერის მომენტი
+    gaps = [b.time - a.time for a, b in zip(body, body[1:])]
+    assert all(abs(g - 1.0) < 1e-6 for g in gaps)
+
+
+def test_partial_tail_is_truncated(tmp_path):
+    path = str(tmp_path / "j.klj")
+    write_session(path, [("A", "A")] * 3)
+    size = os.path.getsize(path)
+    with open(path, "ab") as f:
+        f.write(b"\x01" * (RECORD_SIZE // 2))
+
+    assert recover(path) == RECORD_SIZE // 2
+    assert os.path.getsize(path) == size
+    assert len(list(read_journal(path))) == 5
+
+
+def test_zeroed_tail_records_are_dropped(tmp_path):
+    path = str(tmp_path / "j.klj")
+    write_session(path, [("A", "A")] * 3)
+    size = os.path.getsize(path)
+    # დენის გათიშვა: ფაილის ზომა გაიზარდა, მონაცემი — არა
+    with open(path, "ab") as f:
+        f.write(b"\x00" * RECORD_SIZE * 3)
+
+    assert recover(path) == RECORD_SIZE * 3
+    assert os.path.getsize(path) == size
+
+
+def test_corrupt_record_is_skipped_on_read(tmp_path):
+    path = str(tmp_path / "j.klj")
+    write_session(path, [("A", "A"), ("B", "B"), ("C", "C")])
+    header = os.path.getsize(path) - 5 * RECORD_SIZE
+    with open(path, "r+b") as f:
+        f.seek(header + 2 * RECORD_SIZE + 9)  # მეორე კლავიშის expected
+        f.write(b"\xff")
+
+    records = list(read_journal(path))
+    assert [r.expected for r in records if r.flags & FLAG_CORRECT] == ["A", "C"]
+
+
+def test_bad_header_restarts_file(tmp_path):
+    path = str(tmp_path / "j.klj")
+    with open(path, "wb") as f:
+        f.write(b"garbage" * 10)
+
+    journal = KeystrokeJournal(path)
+    assert journal.recovered_bytes == 70
+    journal.session_start()
+    journal.close()
+    assert [r.flags for r in read_journal(path)] == [FLAG_SESSION_START]
+
+
+def test_reopen_appends_after_recovery(tmp_path):
+    path = str(tmp_path / "j.klj")
+    write_session(path, [("A", "A")])
+    with open(path, "ab") as f:
+        f.write(b"\x07" * 5)
+    write_session(path, [("B", "B")])
+
+    flags = [r.flags for r in read_journal(path)]
+    assert flags == [FLAG_SESSION_START, FLAG_CORRECT, FLAG_SESSION_END] * 2
+
+
+def test_idle_writer_does_not_wake(tmp_path, monkeypatch):
+    journal = KeystrokeJournal(str(tmp_path / "j.klj"), flush_interval=0.01)
+    calls = []
+    flush = journal.flush
+    monkeypatch.setattr(journal, "flush", lambda: (calls.append(1), flush())[1])
+
+    time.sleep(0.1)
+    assert calls == []
+
+    # სესიის დროს ნაწილობრივი buffer იწერება flush_interval-ში
+    journal.session_start()
+    journal.key("A", "A", True)
+    deadline = time.monotonic() + 2.0
+    while len(list(read_journal(journal.path))) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(list(read_journal(journal.path))) == 2
+
+    journal.session_end()
+    journal.close()
+
+
+def test_trainer_exit_closes_journal(tmp_path):
+    from diagnostics.replay import HeadlessTrainer
+
+    trainer = HeadlessTrainer()
+    journal = trainer.journal = KeystrokeJournal(str(tmp_path / "j.klj"), capacity=1024)
+    journal.session_start()
+    journal.key("A", "A", True)
+    journal.session_end()
+
+    trainer.headless_root.options["WM_DELETE_WINDOW"]()
+
+    assert trainer.headless_root.destroyed
+    assert trainer.journal is None
+    assert not journal._thread.is_alive()
+    assert [r.flags for r in read_journal(journal.path)] == [FLAG_SESSION_START, FLAG_CORRECT, FLAG_SESSION_END]
@@ -0,0 +1,24 @@
+# tests/test_layout.py
+# KLAVA — ეკრანის გეომეტრია (ui/layout.py)
+
+from ui.layout import SENTENCE_FONT_PER_SPACING, SENTENCE_MIN_FONT, sentence_geometry
+
+
+def test_sentence_font_scales_with_height():
+    sizes = [sentence_geometry(1920, h, 20).font_size for h in (480, 768, 1080, 1440)]
+    assert sizes == sorted(sizes)
+    assert sizes[0] < sizes[-1]
+    assert sentence_geometry(1920, 1080, 20).font_size == 50
+
+
+def test_sentence_font_fits_spacing():
+    for count in (5, 40, 120):
+        geo = sentence_geometry(1280, 2160, count)
+        assert geo.font_size <= round(geo.spacing * SENTENCE_FONT_PER_SPACING)
+        assert geo.font_size >= SENTENCE_MIN_FONT
+
+
+def test_sentence_is_centered():
+    geo = sentence_geometry(1000, 700, 10)
+    assert geo.x + geo.spacing * 10 / 2 == 500
+    assert geo.y < 700 / 3  # კლავიატურის ზემოთ
@@ -0,0 +1,66 @@
+# tests/test_passage.py
+# KLAVA — ტექსტის რეჟიმი: ნორმალიზაცია განლაგებისთვის
+
+import pytest
+
+import trainer as trainer_module
+from diagnostics.replay import HeadlessTrainer
+from logic.passage import PassageWindow, normalize_passage, wrap_line
+
+GEORGIAN = "ქართული ანბანი თავისებური და ლამაზია.\nმას ოცდაცამეტი ასო აქვს.\n" * 3
+ENGLISH = "The quick brown fox\njumps over   the lazy dog.\n" * 3
+
+
+@pytest.fixture
+def trainer(tmp_path):
+    t = HeadlessTrainer()
+    t.passage_file = str(tmp_path / "passage.txt")
+    return t
+
+
+def write(trainer, text):
+    with open(trainer.passage_file, "w", encoding="utf-8") as f:
+        f.write(text)
+
+
+def test_passage_is_normalized_for_layout(trainer):
+    write(trainer, ENGLISH)
+    text = trainer._load_passage()
+    assert "\n" not in text and "  " not in text
+    assert set(text) <= set(trainer.layout.key_of)
+
+
+def test_untypable_passage_is_rejected(trainer, monkeypatch):
+    assert trainer.layout.name == "qwerty"
+    write(trainer, GEORGIAN)
+    with pytest.raises(RuntimeError, match="განლაგებით"):
+        trainer._load_passage()
+
+    errors = []
+
+    class Box:
+        @staticmethod
+        def showerror(title, message):
+            errors.append(message)
+
+    monkeypatch.setattr(trainer_module, "_messagebox", lambda: Box)
+    trainer.start_training()
+    assert errors == ["ტექსტი ამ განლაგებით ვერ აიკრიფება"]
+    assert not trainer.training_active
+
+
+def test_empty_passage_is_rejected(trainer):
+    write(trainer, "  \n\n")
+    with pytest.raises(RuntimeError, match="ცარიელია"):
+        trainer._load_passage()
+
+
+def test_window_covers_text():
+    text = normalize_passage(ENGLISH.upper(), set("ABCDEFGHIJKLMNOPQRSTUVWXYZ. "))
+    window = PassageWindow(text, cols=12, lines=3)
+    ends = [window.current[1]]
+    while window.advance():
+        ends.append(window.current[1])
+    assert ends[-1] == len(text)
+    assert all(b - a <= 12 for a, b in zip([0] + ends, ends))
+    assert wrap_line(text, len(text), 12) == len(text)
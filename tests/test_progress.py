@@ -0,0 +1,87 @@
+# tests/test_progress.py
+# KLAVA — SessionStats: ring buffer, live WPM-ის ფანჯარა, აგრეგატები
+
+import random
+
+import pytest
+
+from logic.progress import SessionStats
+
+KEYS = "ABCDEF"
+FINGERS = {"left": "ABC", "right": "DEF"}
+
+
+def live_wpm_brute(events, now, window, capacity):
+    """ბოლო `window` წამის WPM — პირდაპირ ჩანაწერების სიიდან."""
+    kept = events[-capacity:]
+    limit = now - window
+    start = 0
+    while start < len(kept) - 1 and kept[start][0] < limit:
+        start += 1
+    hits = sum(correct for _, correct in kept[start:])
+    span = max(now - kept[start][0], 1.0)
+    return hits / 5.0 / (span / 60.0)
+
+
+@pytest.mark.parametrize("capacity", [8, 64, 1024])
+def test_live_wpm_matches_brute_force(capacity):
+    rng = random.Random(capacity)
+    stats = SessionStats(KEYS, FINGERS, capacity=capacity, window=3.0)
+    events = []
+    times = [100.0]
+    for _ in range(600):
+        # ხანდახან პაუზა — ფანჯარა მთლიანად იცლება
+        times.append(times[-1] + (rng.expovariate(4.0) if rng.random() > 0.02 else 5.0))
+
+    for t, following in zip(times, times[1:]):
+        correct = rng.random() > 0.1
+        stats.record(rng.choice(KEYS), correct, t)
+        events.append((t, int(correct)))
+
+        # მონოტონური საათი: მოთხოვნა — შემდეგ კლავიშამდე
+        now = rng.uniform(t, following)
+        assert stats.live_wpm(now) == pytest.approx(live_wpm_brute(events, now, 3.0, capacity))
+
+
+def test_ring_keeps_last_capacity_records():
+    stats = SessionStats(KEYS, FINGERS, capacity=4)
+    for n in range(10):
+        stats.record(KEYS[n % len(KEYS)], n % 3 != 0, float(n))
+
+    assert stats.count == 10
+    assert sorted(stats.t) == [6.0, 7.0, 8.0, 9.0]
+    assert stats.total == 10
+    assert stats.hits == 6
+
+
+def test_aggregates():
+    stats = SessionStats(KEYS, FINGERS)
+    assert stats.accuracy == 1.0
+    assert stats.wpm == 0.0
+    assert stats.live_wpm() == 0.0
+
+    # A: 4 მცდელობა, 2 შეცდომა; D: სამივე სწორი, 0.5 წმ ინტერვალით
+    script = [("A", False), ("A", True), ("A", False), ("A", True), ("D", True), ("D", True), ("D", True)]
+    for n, (key, correct) in enumerate(script):
+        stats.record(key, correct, n * 0.5)
+
+    assert stats.accuracy == pytest.approx(5 / 7)
+    assert stats.wpm == pytest.approx(5 / 5.0 / (3.0 / 60.0))
+    assert stats.error_rate("A") == 0.5
+    assert stats.error_rate("D") == 0.0
+    assert stats.error_rate("?") == 0.0
+    assert stats.finger_latency("right") == pytest.approx(0.5)
+    assert stats.weak_keys() == {"A": 0.5}
+
+
+def test_reset_clears_counters():
+    stats = SessionStats(KEYS, FINGERS, capacity=4)
+    for n in range(6):
+        stats.record("B", False, float(n))
+    stats.reset()
+
+    assert stats.total == 0
+    assert stats.error_rate("B") == 0.0
+    assert stats.finger_latency("left") == 0.0
+    stats.record("B", True, 50.0)
+    assert stats.live_wpm(50.0) == pytest.approx(1 / 5.0 / (1.0 / 60.0))
@@ -0,0 +1,122 @@
+# tests/test_quantiles.py
+# KLAVA — QuantileSketch / ReactionSketches: სიზუსტე, merge, სერიალიზაცია
+
+import random
+import struct
+
+import pytest
+
+from logic.quantiles import QuantileSketch, ReactionSketches
+
+FINGERS = {"left": "AB", "right": "C"}
+
+
+def exact(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+def test_relative_error_bound():
+    rng = random.Random(3)
+    values = [rng.lognormvariate(-1.5, 0.6) for _ in range(20000)]
+    sketch = QuantileSketch(alpha=0.02)
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.1, 0.5, 0.9, 0.99):
+        assert sketch.quantile(q) == pytest.approx(exact(values, q), rel=0.02 + 1e-9)
+    assert sketch.quantile(0) == min(values)
+    assert sketch.quantile(1) == max(values)
+
+
+def test_merge_equals_single_sketch():
+    rng = random.Random(5)
+    values = [rng.expovariate(5.0) for _ in range(5000)]
+    whole = QuantileSketch()
+    parts = [QuantileSketch() for _ in range(4)]
+    for n, v in enumerate(values):
+        whole.add(v)
+        parts[n % 4].add(v)
+
+    merged = QuantileSketch()
+    for part in parts:
+        merged.merge(part)
+    assert merged.count == whole.count
+    for q in (0.5, 0.9, 0.99):
+        assert merged.quantile(q) == whole.quantile(q)
+
+    with pytest.raises(ValueError):
+        merged.merge(QuantileSketch(alpha=0.05))
+
+
+def test_sketch_round_trip():
+    sketch = QuantileSketch()
+    for v in (0.0, 0.05, 0.2, 0.2, 1.5, 40.0):
+        sketch.add(v)
+    copy = QuantileSketch.from_bytes(sketch.to_bytes())
+
+    assert copy.to_bytes() == sketch.to_bytes()
+    assert (copy.count, copy.zero, copy.min, copy.max) == (6, 1, 0.0, 40.0)
+    assert copy.quantile(0.5) == sketch.quantile(0.5)
+
+    empty = QuantileSketch.from_bytes(QuantileSketch().to_bytes())
+    assert empty.count == 0
+    assert empty.quantile(0.5) == 0.0
+
+
+def reaction(seed=0):
+    rng = random.Random(seed)
+    sketches = ReactionSketches("ABC", FINGERS)
+    t = 0.0
+    for _ in range(500):
+        t += rng.uniform(0.1, 0.6)
+        sketches.hit(rng.choice("ABC"), t)
+    return sketches
+
+
+def test_reaction_save_load(tmp_path):
+    path = str(tmp_path / "sub" / "reaction.bin")
+    sketches = reaction()
+    sketches.save(path)
+    loaded = ReactionSketches.load(path, "ABC", FINGERS)
+
+    assert loaded.to_bytes() == sketches.to_bytes()
+    for name in ("A", "C", "left", "right"):
+        assert loaded.summary(name) == sketches.summary(name)
+    assert not [p for p in (tmp_path / "sub").iterdir() if p.suffix == ".tmp"]
+
+
+def test_reaction_load_corrupt_files(tmp_path):
+    path = tmp_path / "reaction.bin"
+    data = reaction().to_bytes()
+
+    # მოჭრილი ფაილი — ცარიელი sketch-ები, არა exception
+    for n in (0, 3, 9, len(data) // 2, len(data) - 1):
+        path.write_bytes(data[:n])
+        assert ReactionSketches.load(str(path), "ABC", FINGERS).keys["A"].count == 0
+
+    missing = ReactionSketches.load(str(tmp_path / "missing.bin"), "ABC", FINGERS)
+    assert missing.keys["A"].count == 0
+
+
+def test_from_bytes_rejects_damage():
+    data = reaction().to_bytes()
+    for n in range(len(data)):
+        with pytest.raises((ValueError, struct.error)):
+            ReactionSketches.from_bytes(data[:n], "ABC", FINGERS)
+
+    # შემთხვევითი ბაიტი — ან იკითხება, ან ValueError/struct.error (IndexError — არასოდეს)
+    rng = random.Random(1)
+    for _ in range(2000):
+        broken = bytearray(data)
+        broken[rng.randrange(len(broken))] = rng.randrange(256)
+        try:
+            ReactionSketches.from_bytes(bytes(broken), "ABC", FINGERS)
+        except (ValueError, struct.error):
+            pass
+
+
+def test_truncated_varint_raises_value_error():
+    data = reaction().keys["A"].to_bytes()
+    with pytest.raises(ValueError):
+        QuantileSketch.from_bytes(data[:-1])
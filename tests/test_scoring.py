@@ -0,0 +1,95 @@
+# tests/test_scoring.py
+# KLAVA — EditScorer vs. ჩვეულებრივი DP (შემთხვევითი სესიები backspace-ით)
+
+import random
+
+from logic.scoring import DELETE, INSERT, MATCH, SUBSTITUTE, EditScorer
+
+ALPHABET = "ABCDE "
+
+
+def dp_column(target: str, typed: str) -> list:
+    """D[i][n], i = 0..m — Levenshtein, სრული ცხრილით."""
+    col = list(range(len(target) + 1))
+    for j, ch in enumerate(typed, 1):
+        prev, col[0] = col[0], j
+        for i in range(1, len(target) + 1):
+            cur = min(col[i] + 1, col[i - 1] + 1, prev + (target[i - 1] != ch))
+            prev, col[i] = col[i], cur
+    return col
+
+
+def check(scorer: EditScorer) -> None:
+    typed = "".join(scorer.typed)
+    col = dp_column(scorer.target, typed)
+    assert scorer.distance == col[-1]
+    assert [scorer.distance_at(i) for i in range(len(col))] == col
+
+    # alignment — ვალიდური და მისი ღირებულება = D[cursor][n]
+    ops = scorer.alignment()
+    cost = sum(op != MATCH for op, _, _ in ops)
+    assert cost == scorer.prefix_distance
+    assert [j for op, _, j in ops if op != DELETE] == list(range(len(typed)))
+    assert [i for op, i, _ in ops if op != INSERT] == list(range(scorer.cursor))
+    for op, i, j in ops:
+        if op == MATCH:
+            assert scorer.target[i] == typed[j]
+        elif op == SUBSTITUTE:
+            assert scorer.target[i] != typed[j]
+
+
+def test_random_sessions_match_dp():
+    rng = random.Random(2024)
+    for _ in range(200):
+        target = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(0, 90)))
+        scorer = EditScorer(target)
+        check(scorer)
+        for _ in range(rng.randint(1, 120)):
+            r = rng.random()
+            if r < 0.15:
+                scorer.backspace()
+            elif r < 0.3 or scorer.cursor >= len(target):
+                scorer.type(rng.choice(ALPHABET))
+            else:
+                scorer.type(target[scorer.cursor])
+            check(scorer)
+
+
+def test_long_target_crosses_word_boundary():
+    rng = random.Random(7)
+    target = "".join(rng.choice(ALPHABET) for _ in range(300))
+    scorer = EditScorer(target)
+    for ch in target[:150]:
+        scorer.type(ch)
+    scorer.type("X")
+    scorer.backspace()
+    check(scorer)
+    assert scorer.prefix_distance == 0
+    assert scorer.cursor == 150
+
+
+def test_backspace_restores_previous_column():
+    scorer = EditScorer("HELLO")
+    for ch in "HEX":
+        scorer.type(ch)
+    assert scorer.is_error(2)
+    assert scorer.backspace()
+    assert scorer.errors == []
+    for ch in "LLO":
+        scorer.type(ch)
+    assert scorer.finished
+    assert scorer.distance == 0
+    while scorer.backspace():
+        pass
+    assert not scorer.backspace()
+    assert scorer.distance == 5
+    assert scorer.cursor == 0
+
+
+def test_reset_reuses_scorer():
+    scorer = EditScorer("ABC")
+    scorer.type("X")
+    scorer.reset("DE")
+    assert scorer.typed == []
+    assert scorer.distance == 2
+    check(scorer)
@@ -0,0 +1,110 @@
+# tests/test_selector.py
+# KLAVA — compiled corpus-ის inverted index და WeakKeySelector
+
+import random
+import subprocess
+import sys
+
+import pytest
+
+from logic.compiled_corpus import CompiledCorpus, compile_corpus
+from logic.layouts import load_layout
+from logic.selector import WeakKeySelector
+
+LINES = [
+    "the quick brown fox",
+    "jumps over the lazy dog",
+    "pack my box with five dozen jugs",
+    "zebra quiz",
+    "hello world",
+    "sphinx of black quartz judge my vow",
+    "a a a a a",
+    "queue",
+]
+
+LINES_KA = [
+    "ბავშვი ბაღში თამაშობს",
+    "მზე ანათებს",
+    "დედა სადილს ამზადებს",
+    "ბიჭი წიგნს კითხულობს",
+    "ქალაქი დიდია",
+]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    src = tmp_path / "sentences.txt"
+    src.write_text("\n".join(LINES) + "\n", encoding="utf-8")
+    with CompiledCorpus(compile_corpus(str(src), load_layout("qwerty"))) as compiled:
+        yield compiled
+
+
+@pytest.fixture
+def corpus_ka(tmp_path):
+    src = tmp_path / "sentences_ka.txt"
+    src.write_text("\n".join(LINES_KA) + "\n", encoding="utf-8")
+    layout = load_layout("georgian_phonetic")
+    with CompiledCorpus.open_for(str(src), layout) or CompiledCorpus(
+        compile_corpus(str(src), layout), layout=layout
+    ) as compiled:
+        yield compiled
+
+
+def test_postings_match_brute_force(corpus):
+    assert len(corpus) == len(LINES)
+    for term in ("Q", "Z", "A", " ", "TH", "QU", "ZZ"):
+        keyset = corpus.keyset
+        expected = [
+            i for i, line in enumerate(corpus) if keyset.term_id(term) in keyset.line_terms(line)
+        ]
+        assert list(corpus.postings(term)) == expected
+
+
+def test_select_covers_weak_keys(corpus):
+    selector = WeakKeySelector(corpus, rng=random.Random(0))
+    chosen = selector.select(["q", "z"], 2)
+
+    assert len(chosen) == 2
+    text = " ".join(corpus[i] for i in chosen)
+    assert "Q" in text and "Z" in text
+
+
+def test_select_prefers_heavier_terms(corpus):
+    selector = WeakKeySelector(corpus, rng=random.Random(0))
+    (best,) = selector.select({"Q": 5.0, "H": 0.1}, 1)
+    assert "Q" in corpus[best]
+
+
+def test_select_bigram(corpus):
+    selector = WeakKeySelector(corpus, rng=random.Random(0))
+    chosen = selector.select(["QU"], 10)
+    assert chosen
+    assert all("QU" in corpus[i] for i in chosen)
+    assert len(set(chosen)) == len(chosen)
+
+
+def test_select_ignores_unknown_and_empty(corpus):
+    selector = WeakKeySelector(corpus, rng=random.Random(0))
+    assert selector.select([], 3) == []
+    assert selector.select(["ა", "ABC", ""], 3) == []
+    assert selector.select(["Q"], 0) == []
+    assert selector.select({"Q": 0.0}, 3) == []
+
+
+def test_georgian_layout_compiles(corpus_ka):
+    assert corpus_ka.path.endswith("sentences_ka.georgian_phonetic.klc")
+    assert list(corpus_ka) == LINES_KA
+
+    selector = WeakKeySelector(corpus_ka, rng=random.Random(0))
+    assert sorted(selector.select(["ბ"], 5)) == [0, 1, 2, 3]
+    assert selector.select(["ჭ"], 5) == [3]  # Shift ფენა (წ კლავიში)
+
+
+def test_layout_mismatch_is_rejected(corpus_ka):
+    with pytest.raises(ValueError):
+        CompiledCorpus(corpus_ka.path, layout=load_layout("georgian_ergonomic"))
+
+
+def test_logic_does_not_import_tk():
+    code = "import sys, logic.selector; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
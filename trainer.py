@@ -4,14 +4,31 @@
 from __future__ import annotations
 
 import os
+import struct
+import sys
+import threading
+import time
 import tkinter as tk
-from tkinter import messagebox
-from typing import Optional
+from collections import deque
+from typing import Deque, Optional, Sequence, Tuple, Union
 
 from ui.canvas import Canvas
+from ui.hud import Hud
 from ui.keyboard import Keyboard
 from ui.menu import AppMenu
+from ui.sprites import SpriteAtlas
+from exercises.passage import PassageExercise
 from exercises.typing import TypingExercise
+from logic.corpus import SentenceCorpus
+from logic.compiled_corpus import CompiledCorpus, CorpusView, compile_corpus, compiled_path_for
+from logic.layouts import DEFAULT_LAYOUT, Layout, layout_titles, load_layout
+from logic.passage import normalize_passage
+from logic.selector import WeakKeySelector
+from logic.journal import KeystrokeJournal, journal_path
+from logic.progress import SessionStats
+from logic.quantiles import ReactionSketches
+from diagnostics.latency import probe
+from diagnostics.startup import startup
 
 
 # ===============================================
@@ -21,7 +38,71 @@ MIN_LINES: int = 2
 
 # ფაილის გზა განისაზღვრება ამ ფაილიდან მიმართებით
 BASE_DIR: str = os.path.dirname(os.path.abspath(__file__))
-SENTENCE_FILE: str = os.path.join(BASE_DIR, "data", "sentences.txt")
+DATA_DIR: str = os.path.join(BASE_DIR, "data")
+SENTENCE_FILE: str = os.path.join(DATA_DIR, "sentences.txt")
+
+# კლავიატურის განლაგება (data/layouts/<name>.json): KLAVA_LAYOUT=georgian_phonetic
+LAYOUT: str = os.environ.get("KLAVA_LAYOUT") or "qwerty"
+
+# OS-ის განლაგებისგან დამოუკიდებელი შეყვანა ფიზიკური კლავიშით (X11 keycode):
+# KLAVA_KEYCODE_FALLBACK=1
+KEYCODE_FALLBACK: bool = os.environ.get("KLAVA_KEYCODE_FALLBACK") == "1"
+
+Corpus = Union[SentenceCorpus, CompiledCorpus]
+
+# გრძელი ტექსტის რეჟიმი (სტრიქონების ნაცვლად ერთი ტექსტი, ფანჯრით):
+# KLAVA_PASSAGE_FILE=/path/text.txt
+PASSAGE_FILE: Optional[str] = os.environ.get("KLAVA_PASSAGE_FILE") or None
+
+# ტექსტის რეჟიმში — მინიმუმ ამდენი სიმბოლო, რომელიც განლაგებით იკრიფება
+MIN_PASSAGE_CHARS: int = 20
+
+# სტრიქონების შერჩევა სირთულით (None — ფაილის მიმდევრობით)
+DIFFICULTY_RANGE: Optional[tuple[float, float]] = None
+
+# შემდეგი სტრიქონის მომზადება (ms) — კლავიშის დამუშავების შემდეგ, არა მის დროს
+STAGE_DELAY_MS: int = 30
+
+# სუსტი კლავიშების რეჟიმში სესიის სტრიქონების რაოდენობა
+WEAK_KEY_LINES: int = 10
+
+# დასრულებული სესიის სუსტი კლავიშები შემდეგი სესიის weak_keys ხდება
+# (საჭიროა განლაგების კომპილირებული `.klc` კორპუსი): KLAVA_WEAK_KEY_DRILL=1
+WEAK_KEY_DRILL: bool = os.environ.get("KLAVA_WEAK_KEY_DRILL") == "1"
+
+# კლავიშები PhotoImage sprite-ებით smooth polygon-ის ნაცვლად (სუსტი GPU-სთვის):
+# KLAVA_KEY_SPRITES=1
+KEY_SPRITES: bool = os.environ.get("KLAVA_KEY_SPRITES") == "1"
+
+# სტატიკური კლავიატურა + legend ერთ ფონურ სურათად (გულისხმობს sprite-ებს):
+# KLAVA_KEY_FLATTEN=1
+KEY_FLATTEN: bool = os.environ.get("KLAVA_KEY_FLATTEN") == "1"
+
+# ფანჯრის ზომის ცვლილებაზე relayout — ბოლო <Configure>-იდან ამდენი ms-ის შემდეგ
+RESIZE_DEBOUNCE_MS: int = 150
+
+# HUD-ის (ტაიმერი/ქულა/WPM) განახლების სიხშირე, ჯერ წამში
+HUD_REFRESH_HZ: float = 4.0
+
+# კლავიშების ჟურნალი (opt-in): KLAVA_JOURNAL_DIR=/path/journal
+JOURNAL_DIR: Optional[str] = os.environ.get("KLAVA_JOURNAL_DIR") or None
+
+# კლავიშის დაყოვნების გაზომვა (opt-in): KLAVA_LATENCY_LOG=/path/latency.jsonl
+LATENCY_LOG: Optional[str] = os.environ.get("KLAVA_LATENCY_LOG") or None
+
+# რეაქციის დროის sketch-ები, შერწყმული სესიებს შორის (opt-in):
+# KLAVA_REACTION_FILE=/path/reaction.klrs
+REACTION_FILE: Optional[str] = os.environ.get("KLAVA_REACTION_FILE") or None
+
+# გაშვების ფაზების დრო (opt-in): KLAVA_STARTUP_PROFILE=/path/startup.jsonl ("-" — stderr)
+STARTUP_PROFILE: Optional[str] = os.environ.get("KLAVA_STARTUP_PROFILE") or None
+
+
+def _messagebox():
+    """tkinter.messagebox — იტვირთება პირველი დიალოგისას და არა გაშვებისას."""
+    from tkinter import messagebox
+
+    return messagebox
 
 
 class Trainer:
@@ -44,42 +125,158 @@ class Trainer:
     # ===============================================
     #   INIT
     # ===============================================
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(
+        self,
+        root: tk.Tk,
+        canvas: Optional[tk.Canvas] = None,
+        menu: Optional[AppMenu] = None,
+    ) -> None:
+        """
+        :param root: Tk root ფანჯარა
+        :param canvas: მზა canvas (headless რეჟიმისთვის); None — ახალი tk.Canvas
+        :param menu: მზა მენიუ (headless რეჟიმისთვის); None — AppMenu
+        """
         self.root: tk.Tk = root
 
         # ── მდგომარეობა ─────────────────────────────
         self.training_active: bool = False
-        self.exercise: Optional[TypingExercise] = None
+        self.exercise: Optional[Union[TypingExercise, PassageExercise]] = None
+
+        # ერთი TypingExercise ყველა სტრიქონისთვის (reset-ით)
+        self._typing: Optional[TypingExercise] = None
+        self._passage: Optional[PassageExercise] = None
+        self._stage_job: Optional[str] = None
+
+        # შეყვანის რიგი: (event, time.monotonic, probe.stamp) — მუშავდება კადრში ერთხელ
+        self._input: Deque[Tuple[tk.Event, float, float]] = deque()
+        self._drain_job: Optional[str] = None
+
+        # <Configure> debounce: ბოლო ზომა და დაგეგმილი relayout
+        self._resize_job: Optional[str] = None
+        self._pending_size: Optional[Tuple[int, int]] = None
+
+        self.journal: Optional[KeystrokeJournal] = None
 
-        self.sentences: list[str] = []
+        # კლავიატურის განლაგება (სიმბოლოები, თითები, სავარჯიშო ფაილი)
+        # (წაუკითხავი KLAVA_LAYOUT — ნაგულისხმევი, აპლიკაცია მაინც იხსნება)
+        try:
+            self.layout: Layout = load_layout(LAYOUT)
+        except ValueError as e:
+            print(f"KLAVA: {e}; გამოიყენება '{DEFAULT_LAYOUT}'", file=sys.stderr)
+            self.layout = load_layout(DEFAULT_LAYOUT)
+        keys = list(self.layout.chars)
+        fingers = self.layout.fingers
+
+        # სესიის სტატისტიკა (ერთი ობიექტი, reset ყოველ სესიაზე)
+        self.stats: SessionStats = SessionStats(keys, fingers)
+
+        # რეაქციის დრო: მიმდინარე სესია და ყველა სესიის ჯამი
+        self.reaction: ReactionSketches = ReactionSketches(keys, fingers)
+        self.reaction_total: ReactionSketches = (
+            ReactionSketches.load(REACTION_FILE, keys, fingers)
+            if REACTION_FILE
+            else ReactionSketches(keys, fingers)
+        )
+
+        self.sentence_file: str = self._sentence_file_for(self.layout)
+        self.passage_file: Optional[str] = PASSAGE_FILE
+        self.corpus: Optional[Corpus] = None
+        self.sentences: Sequence[str] = []
+        self.selector: Optional[WeakKeySelector] = None
+
+        # `.klc` კომპილაცია ფონურ thread-ში (Tk thread-ს არ აჩერებს)
+        self._compile_job: Optional[threading.Thread] = None
+        self._compile_failed: set[str] = set()  # `.klc` გზები (წყარო + განლაგება)
+
+        # სუსტი კლავიშები/ბიგრამები → წონა; თუ ცარიელი არაა, სტრიქონები
+        # ირჩევა მათი დაფარვით (იხ. _select_lines)
+        self.weak_keys: dict[str, float] = {}
+        # უკვე ნაჩვენები "drill მიუწვდომელია" შეტყობინებები (განლაგება, მიზეზი)
+        self._drill_warned: set[tuple[str, str]] = set()
         self.current_index: int = 0
         self.lines_done: int = 0
 
+        startup.mark("trainer.state")
+
         # ── UI ──────────────────────────────────────
-        self.ui: Canvas = Canvas(root)
+        with startup.phase("canvas"):
+            self.ui: Canvas = Canvas(root, canvas=canvas)
 
-        self.keyboard: Keyboard = Keyboard(
-            self.ui.canvas,
-            self.ui.width,
-            self.ui.height,
-        )
+        # კლავიატურა იქმნება cover-ის პირველი paint-ის შემდეგ (idle-ში)
+        # ან პირველი მიმართვისას — იხ. `keyboard`
+        self._keyboard: Optional[Keyboard] = None
+
+        # ტაიმერი/ქულა/WPM — მხოლოდ ტრენინგის დროს
+        self.hud: Hud = Hud(self.ui, self.stats, HUD_REFRESH_HZ)
 
         # ── Menu ────────────────────────────────────
-        self.menu: AppMenu = AppMenu(
-            root=self.root,
-            on_start=self.start_training,
-            on_exit=self.root.destroy,
-            on_about=self._about,
-        )
-        self.menu.show()
+        with startup.phase("menu"):
+            self.menu: AppMenu = menu or AppMenu(
+                root=self.root,
+                on_start=self.start_training,
+                on_exit=self._exit,
+                on_about=self._about,
+                layouts=layout_titles,
+                on_layout=self.set_layout,
+                current_layout=self.layout.name,
+            )
+            self.menu.show()
 
         # ── საწყისი მდგომარეობა ─────────────────────
         self.ui.show_cover("KLAVA\n\nStart to begin")
-        self.ui.hide_keyboard()
 
         # ── კლავიშები ──────────────────────────────
         self.root.bind("<Key>", self.on_key)
         self.root.bind(self.SECRET_EXIT_COMBO, self._secret_finish)
+        self.root.protocol("WM_DELETE_WINDOW", self._exit)
+
+        # ── ზომის ცვლილება (არა-kiosk რეჟიმი, პროექტორი, მეორე მონიტორი) ──
+        self.ui.canvas.bind("<Configure>", self._on_configure)
+
+        # ── დიაგნოსტიკა ─────────────────────────────
+        if LATENCY_LOG:
+            probe.enable(LATENCY_LOG)
+
+        # ── კლავიატურა — cover-ის დახატვის შემდეგ ───
+        # პირველ idle-ზე Tk ხატავს cover-ს, მეორეზე იქმნება კლავიატურა
+        startup.mark("trainer.bind")
+        self.root.after_idle(lambda: self.root.after_idle(self._on_first_paint))
+
+    # ===============================================
+    #   KEYBOARD (deferred)
+    # ===============================================
+    @property
+    def keyboard(self) -> Keyboard:
+        """ეკრანის კლავიატურა; თუ ჯერ არ შექმნილა — იქმნება ახლა."""
+        keyboard = self._keyboard
+        if keyboard is None:
+            keyboard = self._build_keyboard()
+        return keyboard
+
+    def _build_keyboard(self) -> Keyboard:
+        with startup.phase("keyboard"):
+            keyboard = self._keyboard = Keyboard(
+                self.ui.canvas,
+                self.ui.width,
+                self.ui.height,
+                render=self.ui.render,
+                atlas=SpriteAtlas(self.ui.canvas) if KEY_SPRITES or KEY_FLATTEN else None,
+                flatten=KEY_FLATTEN,
+                layout=self.layout,
+            )
+
+            # cover-ზე კლავიატურა არ ჩანს (item-ები cover-ის შემდეგ შეიქმნა)
+            if not self.training_active:
+                self.ui.raise_cover()
+                self.ui.hide_keyboard()
+        return keyboard
+
+    def _on_first_paint(self) -> None:
+        startup.mark("first_paint")
+        if self._keyboard is None:
+            self._build_keyboard()
+        self._prepare_corpus()
+        startup.dump()
 
     # ===============================================
     #   TRAINING CONTROL
@@ -93,14 +290,17 @@ class Trainer:
 
         # ── დავალებების ჩატვირთვა ──────────────────
         try:
-            self.sentences = self._load_sentences()
+            if self.passage_file:
+                self.sentences = [self._load_passage()]
+            else:
+                self.sentences = self._load_sentences()
         except RuntimeError as e:
-            messagebox.showerror("დავალების შეცდომა", str(e))
+            _messagebox().showerror("დავალების შეცდომა", str(e))
             return
 
-        # ვალიდაცია — მინიმალური ხაზები
-        if len(self.sentences) < MIN_LINES:
-            messagebox.showerror(
+        # ვალიდაცია — მინიმალური ხაზები (ტექსტის რეჟიმში — ერთი ტექსტი)
+        if not self.passage_file and len(self.sentences) < MIN_LINES:
+            _messagebox().showerror(
                 "დავალების შეცდომა",
                 f"დავალება უნდა შეიცავდეს მინიმუმ {MIN_LINES} სტრიქონს",
             )
@@ -114,9 +314,15 @@ class Trainer:
         self.current_index = 0
         self.lines_done = 0
 
+        # ჟურნალი (დღის ფაილი) და სტატისტიკა
+        self._open_journal()
+        self.stats.reset()
+        self.reaction = ReactionSketches(self.layout.chars, self.layout.fingers)
+
         # UI
         self.ui.hide_cover()
         self.ui.show_keyboard()
+        self.hud.start()
 
         # პირველი სტრიქონი
         self._load_current_line()
@@ -127,20 +333,80 @@ class Trainer:
         """
         self.training_active = False
         self.exercise = None
+        self._cancel_stage()
+        self._input.clear()
 
-        # UI
+        # ჟურნალი (თუ ჩართულია)
+        if self.journal is not None:
+            self.journal.session_end()
+
+        self._save_reaction()
+
+        if WEAK_KEY_DRILL:
+            self.weak_keys = self.stats.weak_keys()
+
+        # UI (HUD ჩერდება cover-მდე — მენიუზე ტაიმერი არ ბრუნავს)
+        self.hud.stop()
         self.ui.hide_keyboard()
         self.ui.show_cover("დავალება შესრულებულია")
 
         self._disable_kiosk()
         self.menu.show()
 
+        # დაყოვნების სტატისტიკა (თუ ჩართულია) — UI-ს აღდგენის შემდეგ
+        probe.dump()
+
+    def set_layout(self, name: str) -> bool:
+        """
+        კლავიატურის განლაგების გადართვა (მაგ. სხვა მოსწავლისთვის).
+
+        Canvas და კლავიატურის item-ები ხელახლა გამოიყენება; იცვლება
+        სტატისტიკის კლავიშები/თითები და სავარჯიშო ფაილი. ტრენინგის დროს
+        გადართვა არ ხდება.
+
+        :return: True — თუ განლაგება შეიცვალა
+        """
+        if self.training_active:
+            return False
+        try:
+            layout = load_layout(name)
+        except ValueError as e:
+            _messagebox().showerror("განლაგების შეცდომა", str(e))
+            return False
+        if layout is self.layout:
+            return False
+
+        self.layout = layout
+        if self._keyboard is not None:
+            self._keyboard.set_layout(layout)
+            # ახალი კლავიშები/ლეგენდა შეიქმნა cover-ის ზემოთ
+            if not self.training_active:
+                self.ui.raise_cover()
+                self.ui.hide_keyboard()
+
+        self.stats = SessionStats(layout.chars, layout.fingers)
+        self.hud.stats = self.stats
+        self.reaction = ReactionSketches(layout.chars, layout.fingers)
+
+        # `.klc` განლაგებაზეა მიბმული (ორივე ქართული განლაგება ერთ ფაილს
+        # იყენებს, მაგრამ კლავიშები/თითები განსხვავდება) — კორპუსი ყოველთვის
+        # ხელახლა იხსნება
+        self.sentence_file = self._sentence_file_for(layout)
+        if self.corpus is not None:
+            self.corpus.close()
+        self.corpus = None
+        self.selector = None
+        self.weak_keys = {}
+        self._prepare_corpus()
+        return True
+
     # ===============================================
     #   LINE CONTROL
     # ===============================================
     def _load_current_line(self) -> None:
         """
-        იტვირთება მიმდინარე სტრიქონი TypingExercise-ში.
+        იტვირთება მიმდინარე სტრიქონი TypingExercise-ში
+        (ტექსტის რეჟიმში — მთელი ტექსტი PassageExercise-ში).
         """
         if self.current_index >= len(self.sentences):
             self.finish_training()
@@ -148,20 +414,84 @@ class Trainer:
 
         sentence = self.sentences[self.current_index]
 
-        self.exercise = TypingExercise(
-            ui=self.ui,
-            keyboard=self.keyboard,
-            sentence=sentence,
-        )
-        self.exercise.start()
+        exercise: Union[TypingExercise, PassageExercise]
+        if self.passage_file:
+            exercise = self._load_passage_exercise(sentence)
+        elif self._typing is None:
+            exercise = self._typing = TypingExercise(
+                ui=self.ui,
+                keyboard=self.keyboard,
+                sentence=sentence,
+            )
+            exercise.keycode_fallback = KEYCODE_FALLBACK
+        else:
+            exercise = self._typing
+            exercise.reset(sentence)
+
+        self.exercise = exercise
+        exercise.journal = self.journal
+        exercise.stats = self.stats
+        exercise.reaction = self.reaction
+        exercise.start()
+
+        # შემდეგი სტრიქონი მზადდება დამალულად, კლავიშების შუალედში
+        self._cancel_stage()
+        self._stage_job = self.root.after(STAGE_DELAY_MS, self._stage_next_line)
+
+    def _load_passage_exercise(self, text: str) -> PassageExercise:
+        exercise = self._passage
+        if exercise is None:
+            exercise = self._passage = PassageExercise(self.ui, self.keyboard, text)
+            exercise.keycode_fallback = KEYCODE_FALLBACK
+        else:
+            exercise.reset(text)
+        return exercise
+
+    def _stage_next_line(self) -> None:
+        """შემდეგი სტრიქონის layout და item-ები Canvas-ის დამალულ pool-ში."""
+        self._stage_job = None
+        if not self.training_active:
+            return
+
+        nxt = self.current_index + 1
+        if nxt < len(self.sentences):
+            self.ui.stage_sentence(self.layout.normalize(self.sentences[nxt]))
+
+    def _cancel_stage(self) -> None:
+        if self._stage_job is not None:
+            self.root.after_cancel(self._stage_job)
+            self._stage_job = None
 
     # ===============================================
     #   KEY HANDLING
     # ===============================================
     def on_key(self, event: tk.Event) -> None:
         """
-        ყველა კლავიშის გლობალური დამუშავება.
+        ყველა კლავიშის გლობალური მიღება.
+
+        event მხოლოდ რიგში ჩადგება დროის ნიშნულით; დამუშავება ხდება
+        `_drain_input`-ში, კადრში ერთხელ (after_idle). სწრაფი შეყვანისას
+        (auto-repeat, burst) ყველა event მუშავდება მიმდევრობით, ხოლო
+        ვიზუალური შედეგი (RenderScheduler) იგზავნება ერთხელ — batch-ის ბოლოს.
         """
+        self._input.append((event, time.monotonic(), probe.stamp()))
+        if self._drain_job is None:
+            self._drain_job = self.root.after_idle(self._drain_input)
+
+    def _drain_input(self) -> None:
+        """რიგში დაგროვებული event-ების დამუშავება მიღების მიმდევრობით."""
+        self._drain_job = None
+        queue = self._input
+        while queue:
+            event, t, stamp = queue.popleft()
+            probe.begin(stamp)
+            try:
+                self._handle_key(event, t)
+            finally:
+                probe.end(self.root.after_idle)
+
+    def _handle_key(self, event: tk.Event, t: Optional[float] = None) -> None:
+        """ერთი event-ის დამუშავება (probe-ის გარეშე)."""
         if not self.training_active:
             return
 
@@ -170,7 +500,7 @@ class Trainer:
         if exercise is None:
             return
 
-        exercise.on_key(event)
+        exercise.on_key(event, t)
 
         if exercise.finished:
             self.lines_done += 1
@@ -184,6 +514,41 @@ class Trainer:
             # ყველა სტრიქონი შესრულებულია
             self.finish_training()
 
+    # ===============================================
+    #   RESIZE
+    # ===============================================
+    def _on_configure(self, event: tk.Event) -> None:
+        """canvas-ის ზომის ცვლილება — relayout გადაიდება, სანამ ზომა არ დამშვიდდება."""
+        self._pending_size = (event.width, event.height)
+        if self._resize_job is not None:
+            self.root.after_cancel(self._resize_job)
+        self._resize_job = self.root.after(RESIZE_DEBOUNCE_MS, self._apply_resize)
+
+    def _apply_resize(self) -> None:
+        """ახალი ზომის გამოყენება არსებულ item-ებზე (წაშლა/ხელახლა შექმნის გარეშე)."""
+        self._resize_job = None
+        size, self._pending_size = self._pending_size, None
+        if size is None:
+            return
+
+        width, height = size
+        if width < 2 or height < 2:
+            # ჯერ არ არის გამოსახული
+            return
+
+        changed = self.ui.relayout(width, height)
+        if self._keyboard is not None:
+            changed = self._keyboard.relayout(width, height) or changed
+
+        # ტექსტის ფანჯარა — ახალი სიგანით wrap
+        if changed and isinstance(self.exercise, PassageExercise):
+            self.exercise.relayout()
+
+        # დამალულად მომზადებული სტრიქონი ძველ layout-ზე იყო
+        if changed and self.training_active:
+            self._cancel_stage()
+            self._stage_next_line()
+
     # ===============================================
     #   SECRET EXIT
     # ===============================================
@@ -216,38 +581,208 @@ class Trainer:
         self.root.attributes("-fullscreen", False)
         self.root.attributes("-topmost", False)
         self.root.config(cursor="")
-        self.root.protocol("WM_DELETE_WINDOW", self.root.destroy)
+        self.root.protocol("WM_DELETE_WINDOW", self._exit)
+
+    def _exit(self) -> None:
+        """
+        აპლიკაციიდან გასვლა (Exit, ფანჯრის დახურვა): ჟურნალის ბოლო batch
+        იწერება და fsync ხდება root.destroy-მდე — daemon ნაკადი არ წყდება
+        ჩაწერის შუაში.
+        """
+        if self.journal is not None:
+            self.journal.close()
+            self.journal = None
+        self.root.destroy()
 
     # ===============================================
     #   HELPERS
     # ===============================================
-    def _load_sentences(self) -> list[str]:
+    def _load_sentences(self) -> Sequence[str]:
         """
-        კითხულობს სავარჯიშო სტრიქონებს ფაილიდან.
+        ხსნის სავარჯიშო სტრიქონების კორპუსს.
+
+        უპირატესობა აქვს კომპილირებულ `.klc` კორპუსს (საჭიროებისას
+        კომპილირდება ერთხელ); თუ ეს ვერ ხერხდება — ინდექსირებულ ტექსტს.
+        ორივე ხაზებს კითხულობს მოთხოვნისას (mmap), ამიტომ ღირებულება
+        არ არის დამოკიდებული ფაილის ზომაზე.
+        წინა სესიის კორპუსი ხელახლა გამოიყენება, თუ ფაილი არ შეცვლილა.
 
         აბრუნებს:
-            list[str]: სტრიქონების სია (UPPERCASE, ცარიელების გარეშე)
+            Sequence[str]: სესიის სტრიქონები (განლაგების ფორმით — QWERTY-ზე UPPERCASE, ცარიელების გარეშე)
 
         აგდებს:
             RuntimeError: თუ ფაილი ვერ გაიხსნა ან ცარიელია.
         """
+        corpus = self.corpus
+        if corpus is None or not corpus.is_fresh() or self._compiled_ready(corpus):
+            try:
+                fresh = self._open_corpus()
+            except Exception as e:
+                raise RuntimeError(f"დავალების ფაილი ვერ გაიხსნა: {e}") from e
+
+            if corpus is not None:
+                corpus.close()
+            self.corpus = corpus = fresh
+
+        if len(corpus) == 0:
+            raise RuntimeError("დავალების ფაილი ცარიელია")
+
+        return self._select_lines(corpus)
+
+    def _load_passage(self) -> str:
+        """
+        გრძელი ტექსტის წაკითხვა (PASSAGE_FILE) და ნორმალიზაცია მიმდინარე
+        განლაგებისთვის (იშლება სიმბოლოები, რომლებიც ვერ აიკრიფება).
+
+        აგდებს:
+            RuntimeError: თუ ფაილი ვერ გაიხსნა, ცარიელია, ან განლაგებით
+                          აკრეფადი ნაწილი MIN_PASSAGE_CHARS-ზე მოკლეა.
+        """
+        assert self.passage_file is not None
         try:
-            with open(SENTENCE_FILE, encoding="utf-8") as f:
-                lines = [line.strip().upper() for line in f if line.strip()]
-        except Exception as e:
-            raise RuntimeError(f"დავალების ფაილი ვერ გაიხსნა: {e}") from e
+            with open(self.passage_file, encoding="utf-8") as f:
+                text = f.read()
+        except (OSError, UnicodeDecodeError) as e:
+            raise RuntimeError(f"ტექსტის ფაილი ვერ გაიხსნა: {e}") from e
+        if not text.strip():
+            raise RuntimeError("ტექსტის ფაილი ცარიელია")
+
+        layout = self.layout
+        text = normalize_passage(layout.normalize(text), layout.key_of)
+        if len(text) < MIN_PASSAGE_CHARS:
+            raise RuntimeError("ტექსტი ამ განლაგებით ვერ აიკრიფება")
+        return text
+
+    def _open_journal(self) -> None:
+        """დღის ჟურნალის გახსნა (ან გადართვა ახალ დღეზე) და სესიის მონიშვნა."""
+        if not JOURNAL_DIR:
+            return
 
-        if not lines:
-            raise RuntimeError("დავალების ფაილი ცარიელია")
+        path = journal_path(JOURNAL_DIR)
+        journal = self.journal
+        if journal is None or journal.path != path:
+            if journal is not None:
+                journal.close()
+            try:
+                journal = KeystrokeJournal(path)
+            except OSError:
+                self.journal = None
+                return
+            self.journal = journal
+
+        journal.session_start()
+
+    def _save_reaction(self) -> None:
+        """სესიის sketch-ების შერწყმა ჯამში და (თუ ჩართულია) ფაილში ჩაწერა."""
+        self.reaction_total.merge(self.reaction)
+        if not REACTION_FILE:
+            return
+        try:
+            self.reaction_total.save(REACTION_FILE)
+        except OSError:
+            pass
 
-        return lines
+    @staticmethod
+    def _sentence_file_for(layout: Layout) -> str:
+        if not layout.sentences:
+            return SENTENCE_FILE
+        return os.path.join(DATA_DIR, layout.sentences)
+
+    def _open_corpus(self) -> Corpus:
+        """
+        კომპილირებული კორპუსი, თუ აქტუალური `.klc` უკვე არსებობს; თუ არა —
+        ინდექსირებული ტექსტი, ხოლო კომპილაცია ფონზე იწყება და შემდეგი
+        სესია `.klc`-ს გამოიყენებს (იხ. _compiled_ready).
+        `.klc` თითო განლაგებისთვის ცალკეა (`<src>.<layout>.klc`).
+        """
+        path = self.sentence_file
+        compiled = CompiledCorpus.open_for(path, self.layout)
+        if compiled is not None:
+            return compiled
+        self._compile_in_background(path)
+        return SentenceCorpus(path, upper=self.layout.upper)
+
+    def _prepare_corpus(self) -> None:
+        """
+        კორპუსის მომზადება სესიამდე (პირველი paint-ის შემდეგ, განლაგების
+        გადართვისას): აქტუალური `.klc` იხსნება (O(1)), არარსებული ან
+        მოძველებული — კომპილირდება ფონზე.
+        """
+        if self.passage_file or self.corpus is not None:
+            return
+        compiled = CompiledCorpus.open_for(self.sentence_file, self.layout)
+        if compiled is None:
+            self._compile_in_background(self.sentence_file)
+        else:
+            self.corpus = compiled
+
+    def _compile_in_background(self, path: str) -> None:
+        """`compile_corpus` daemon thread-ში; ჩაწერა ატომურია (tmp + replace)."""
+        layout = self.layout
+        dst = compiled_path_for(path, layout.name)
+        job = self._compile_job
+        if (job is not None and job.is_alive()) or dst in self._compile_failed:
+            return
+
+        def run() -> None:
+            try:
+                compile_corpus(path, layout, dst)
+            except (OSError, ValueError, UnicodeDecodeError, struct.error):
+                # ამ გაშვებაში აღარ ვცდით — ტექსტური კორპუსი საკმარისია
+                self._compile_failed.add(dst)
+
+        job = self._compile_job = threading.Thread(target=run, name="klava-compile", daemon=True)
+        job.start()
+
+    def _compiled_ready(self, corpus: Corpus) -> bool:
+        """ფონური კომპილაცია დასრულდა, კორპუსი კი ჯერ ისევ ტექსტურია."""
+        job = self._compile_job
+        if job is None or job.is_alive() or not isinstance(corpus, SentenceCorpus):
+            return False
+        self._compile_job = None
+        return True
+
+    def _select_lines(self, corpus: Corpus) -> Sequence[str]:
+        """
+        სესიის სტრიქონების შერჩევა კორპუსიდან:
+        - სუსტი კლავიშები → WeakKeySelector (inverted index)
+        - DIFFICULTY_RANGE → სირთულის მიხედვით
+        - სხვა შემთხვევაში — ფაილის მიმდევრობით
+        """
+        if not isinstance(corpus, CompiledCorpus):
+            if self.weak_keys:
+                self._drill_unavailable()
+            return corpus
+
+        if self.weak_keys:
+            if self.selector is None or self.selector.corpus is not corpus:
+                self.selector = WeakKeySelector(corpus)
+            ids = self.selector.select(self.weak_keys, WEAK_KEY_LINES)
+            if len(ids) >= MIN_LINES:
+                return CorpusView(corpus, ids)
+
+        if DIFFICULTY_RANGE is not None:
+            return corpus.by_difficulty(*DIFFICULTY_RANGE)
+        return corpus
+
+    def _drill_unavailable(self) -> None:
+        """weak-key drill-ს inverted index სჭირდება — მიზეზი stderr-ზე (ერთხელ)."""
+        name = self.layout.name
+        if compiled_path_for(self.sentence_file, name) in self._compile_failed:
+            reason = f"{self.sentence_file} ვერ დაკომპილირდა ({name})"
+        else:
+            reason = "`.klc` ჯერ კომპილირდება — შემდეგი სესიიდან"
+        if (name, reason) in self._drill_warned:
+            return
+        self._drill_warned.add((name, reason))
+        print(f"KLAVA: weak-key drill მიუწვდომელია: {reason}", file=sys.stderr)
 
     # ===============================================
     #   ABOUT
     # ===============================================
     def _about(self) -> None:
         """About დიალოგი."""
-        messagebox.showinfo(
+        _messagebox().showinfo(
             "About KLAVA",
             "KLAVA Typing Trainer\n\nAccuracy-first typing practice.",
         )
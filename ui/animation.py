@@ -0,0 +1,89 @@
+# ui/animation.py
+# KLAVA — Timed UI effects on a single timer
+# ერთი `after` ყველა ეფექტისთვის; თითო გასაღებზე მაქსიმუმ ერთი ეფექტი
+
+from __future__ import annotations
+
+import time
+import tkinter as tk
+from typing import Callable, Dict, Optional, Tuple
+
+
+class Animator:
+    """
+    დროითი ეფექტების (მაგ. არასწორი კლავიშის "ციმციმი") გამგზავნი.
+
+    - `schedule(name, delay_ms, callback)` — ეფექტის დასრულება `delay_ms`-ში;
+      იგივე `name`-ის ხელახალი დაგეგმვა ანაცვლებს (აგრძელებს) წინას
+    - ყველა ეფექტს ემსახურება ერთი `after` — ყველაზე ადრეული ვადისთვის
+    - callback იღებს `name`-ს (lambda-ს შექმნა ყოველ დაჭერაზე საჭირო არაა)
+
+    ამიტომ დაგეგმილი callback-ების რაოდენობა შეზღუდულია
+    (≤ 1 Tk timer, ≤ გასაღებების რაოდენობა ეფექტი) ნებისმიერი შეყვანისას.
+    """
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.canvas = canvas
+        self.clock = clock
+
+        # name → (ვადა წამებში, callback)
+        self._effects: Dict[str, Tuple[float, Callable[[str], None]]] = {}
+        self._job: Optional[str] = None
+        self._due: float = 0.0
+
+    # ======================================================
+    #   API
+    # ======================================================
+    def schedule(self, name: str, delay_ms: int, callback: Callable[[str], None]) -> None:
+        """ეფექტის დაგეგმვა ან არსებულის ვადის გადაწევა."""
+        due = self.clock() + delay_ms / 1000.0
+        self._effects[name] = (due, callback)
+        if self._job is None or due < self._due:
+            self._arm(due)
+
+    def cancel(self, name: str) -> None:
+        """ეფექტის გაუქმება (callback აღარ გამოიძახება)."""
+        self._effects.pop(name, None)
+        if not self._effects:
+            self._disarm()
+
+    def cancel_all(self) -> None:
+        self._effects.clear()
+        self._disarm()
+
+    def is_pending(self, name: str) -> bool:
+        return name in self._effects
+
+    @property
+    def pending(self) -> int:
+        return len(self._effects)
+
+    # ======================================================
+    #   TIMER
+    # ======================================================
+    def _arm(self, due: float) -> None:
+        self._disarm()
+        delay = max(1, int((due - self.clock()) * 1000 + 0.5))
+        self._due = due
+        self._job = self.canvas.after(delay, self._fire)
+
+    def _disarm(self) -> None:
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+
+    def _fire(self) -> None:
+        self._job = None
+        now = self.clock()
+
+        due = [name for name, (t, _) in self._effects.items() if t <= now]
+        for name in due:
+            _, callback = self._effects.pop(name)
+            callback(name)
+
+        if self._effects and self._job is None:
+            self._arm(min(t for t, _ in self._effects.values()))
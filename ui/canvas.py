@@ -6,32 +6,135 @@
 from __future__ import annotations
 
 import tkinter as tk
+from typing import Optional, Sequence
+
+from ui.layout import SentenceGeometry, screen_geometry, sentence_geometry
+from ui.passage import PassageView
+from ui.render import RenderScheduler
 
 # ფერები დროებით აქაა — ქვემოთ აგიხსნი როგორ გავიტანოთ
 PALE = "#cccccc"
 DARK = "#000000"
 
 
+class LetterPool:
+    """
+    ერთი წინადადების ასოების item-ების pool, საკუთარი tag-ით.
+
+    - item-ები არ იშლება: ახალი სტრიქონი იწერება itemconfig/coords-ით
+    - ზედმეტი item-ები ცარიელ ტექსტს იღებს
+    - ხილვადობა იცვლება ერთი itemconfigure-ით მთელ tag-ზე
+    """
+
+    def __init__(self, canvas: tk.Canvas, render: RenderScheduler, tag: str) -> None:
+        self.canvas = canvas
+        self.render = render
+        self.tag = tag
+
+        self.ids: list[int] = []
+        self.xy: list[tuple[float, float]] = []
+        self.count: int = 0
+        self.visible: bool = False
+
+        # რა წერია ამჟამად pool-ში (None — შინაარსი მოძველებულია)
+        self.letters: Optional[Sequence[str]] = None
+
+    def write(self, letters: Sequence[str], geo: SentenceGeometry) -> None:
+        font = ("Arial", geo.font_size, "bold")
+        for i, ch in enumerate(letters):
+            x = geo.x + i * geo.spacing
+            if i == len(self.ids):
+                self._create(x, geo.y, font)
+
+            tid = self.ids[i]
+            if self.xy[i] != (x, geo.y):
+                self.canvas.coords(tid, x, geo.y)
+                self.xy[i] = (x, geo.y)
+            self.render.set(tid, text=ch, fill=PALE, font=font)
+
+        for tid in self.ids[len(letters) : self.count]:
+            self.render.set(tid, text="")
+
+        self.count = len(letters)
+        self.letters = letters
+
+    def move(self, geo: SentenceGeometry) -> None:
+        """გამოყენებული item-ების გადაადგილება და შრიფტი (ტექსტი და ფერი არ იცვლება)."""
+        font = ("Arial", geo.font_size, "bold")
+        for i in range(self.count):
+            x = geo.x + i * geo.spacing
+            self.canvas.coords(self.ids[i], x, geo.y)
+            self.xy[i] = (x, geo.y)
+            self.render.set(self.ids[i], font=font)
+
+    def show(self) -> None:
+        if not self.visible:
+            self.canvas.itemconfigure(self.tag, state="normal")
+            self.visible = True
+
+    def hide(self) -> None:
+        if self.visible:
+            self.canvas.itemconfigure(self.tag, state="hidden")
+            self.visible = False
+
+    def drop(self) -> None:
+        """item-ების დავიწყება (canvas.delete-ის შემდეგ)."""
+        for tid in self.ids:
+            self.render.forget(tid)
+        self.ids.clear()
+        self.xy.clear()
+        self.count = 0
+        self.visible = False
+        self.letters = None
+
+    def _create(self, x: float, y: float, font: tuple) -> None:
+        tid = self.canvas.create_text(
+            x,
+            y,
+            text="",
+            font=font,
+            fill=PALE,
+            state="normal" if self.visible else "hidden",
+            tags=("sentence", self.tag),
+        )
+        self.render.known(tid, text="", fill=PALE, font=font)
+        self.ids.append(tid)
+        self.xy.append((x, y))
+
+
 class Canvas:
     """
     Canvas UI ფენა.
     Trainer იძახებს, Canvas ხატავს.
     """
 
-    def __init__(self, root: tk.Tk) -> None:
+    def __init__(self, root: tk.Tk, canvas: Optional[tk.Canvas] = None) -> None:
+        """
+        :param root: Tk root ფანჯარა
+        :param canvas: მზა canvas (მაგ. ui.headless.HeadlessCanvas); None — ახალი tk.Canvas
+        """
         self.root = root
-        self.canvas = tk.Canvas(
+        self.canvas = canvas or tk.Canvas(
             root,
             bg="white",
             highlightthickness=0,
         )
         self.canvas.pack(fill="both", expand=True)
 
+        # item-ების განახლება კადრში ერთხელ (Keyboard-იც ამავეს იყენებს)
+        self.render = RenderScheduler(self.canvas)
+
         self.width = self.canvas.winfo_screenwidth()
         self.height = self.canvas.winfo_screenheight()
+        geo = screen_geometry(self.width, self.height)
 
-        # ტექსტის ID-ები (ერთი წინადადება)
-        self.text_ids: list[int] = []
+        # ასოების ორი pool: ხილული (front) და შემდეგი სტრიქონისთვის
+        # წინასწარ მომზადებული, დამალული (back)
+        self._front = LetterPool(self.canvas, self.render, "sentence_a")
+        self._back = LetterPool(self.canvas, self.render, "sentence_b")
+
+        # გრძელი ტექსტის ფანჯარა — იქმნება პირველი საჭიროებისას
+        self.passage: Optional[PassageView] = None
 
         # სტატუსის ელემენტები
         self.timer_display: int | None = None
@@ -40,18 +143,14 @@ class Canvas:
 
         # ── COVER OVERLAY ─────────────────────────
         self.cover_rect = self.canvas.create_rectangle(
-            0,
-            0,
-            self.width,
-            self.height,
+            *geo.cover,
             fill="white",
             outline="",
             tags=("cover",),
         )
 
         self.cover_text = self.canvas.create_text(
-            self.width / 2,
-            self.height / 2,
+            *geo.cover_text,
             text="",
             font=("Arial", 44, "bold"),
             fill="black",
@@ -61,6 +160,43 @@ class Canvas:
         # cover ნაგულისხმევად ჩანს
         self.canvas.tag_raise("cover")
 
+    # ======================================================
+    #   RELAYOUT
+    # ======================================================
+    def relayout(self, width: int, height: int) -> bool:
+        """
+        ახალი ზომა: cover, HUD და ხილული წინადადება გადაადგილდება
+        არსებული item-ებით (coords). დამალული (staged) სტრიქონი ძველდება
+        და draw_sentence მას ხელახლა დაწერს.
+
+        :return: True — თუ ზომა შეიცვალა
+        """
+        if (width, height) == (self.width, self.height):
+            return False
+
+        self.width = width
+        self.height = height
+        geo = screen_geometry(width, height)
+
+        self.canvas.coords(self.cover_rect, *geo.cover)
+        self.canvas.coords(self.cover_text, *geo.cover_text)
+        for item, pos in (
+            (self.timer_display, geo.timer),
+            (self.score_display, geo.score),
+            (self.result_display, geo.result),
+        ):
+            if item is not None:
+                self.canvas.coords(item, *pos)
+
+        front = self._front
+        if front.count:
+            front.move(sentence_geometry(width, height, front.count))
+        self._back.letters = None
+
+        if self.passage is not None:
+            self.passage.relayout(width, height)
+        return True
+
     # ======================================================
     #   კლავიატურის ხილვადობა
     # ======================================================
@@ -81,6 +217,10 @@ class Canvas:
         self.canvas.itemconfigure("cover", state="normal")
         self.canvas.tag_raise("cover")
 
+    def raise_cover(self) -> None:
+        """ფარდა ყველა item-ზე მაღლა (მის შემდეგ შექმნილი item-ების დასაფარად)."""
+        self.canvas.tag_raise("cover")
+
     def hide_cover(self) -> None:
         """ფარდის დამალვა (ტრენინგის დაწყება)."""
         self.canvas.itemconfigure("cover", state="hidden")
@@ -98,36 +238,61 @@ class Canvas:
         """
         self.canvas.delete("sentence")
         self.canvas.delete("hud")
-        self.text_ids.clear()
+        self.timer_display = self.score_display = self.result_display = None
+        self._front.drop()
+        self._back.drop()
 
     # ======================================================
     #   წინადადება
     # ======================================================
-    def draw_sentence(self, letters: list[str]) -> None:
-        """ხატავს წინადადებას ღია ფერით (PALE)."""
-        self.clear_sentence()
+    @property
+    def text_ids(self) -> list[int]:
+        """ხილული წინადადების item-ები (pool; გამოიყენება პირველი letter_count)."""
+        return self._front.ids
 
-        y = 130
-        spacing = min(70, max(40, self.width * 0.75 / len(letters)))
-        total = spacing * len(letters)
-        start_x = self.width / 2 - total / 2
+    @property
+    def letter_count(self) -> int:
+        return self._front.count if self._front.visible else 0
 
-        for i, ch in enumerate(letters):
-            tid = self.canvas.create_text(
-                start_x + i * spacing,
-                y,
-                text=ch if ch != " " else " ",
-                font=("Arial", 50, "bold"),
-                fill=PALE,
-                tags=("sentence",),
-            )
-            self.text_ids.append(tid)
+    def draw_sentence(self, letters: Sequence[str]) -> None:
+        """
+        ხატავს წინადადებას ღია ფერით (PALE).
+
+        თუ იგივე სტრიქონი უკვე მომზადებულია (stage_sentence), ხდება მხოლოდ
+        ხილვადობის გაცვლა. სხვა შემთხვევაში pool-ის item-ები ხელახლა
+        გამოიყენება; ახალი item იქმნება მხოლოდ, როცა სტრიქონი pool-ზე გრძელია.
+        """
+        back = self._back
+        if back.letters is not None and back.letters == letters:
+            self._front.hide()
+            back.show()
+            self._front, self._back = back, self._front
+            self._back.letters = None
+            return
+
+        self._write(self._front, letters)
+        self._front.show()
+
+    def stage_sentence(self, letters: Sequence[str]) -> None:
+        """
+        შემდეგი სტრიქონის წინასწარ მომზადება დამალულ pool-ში
+        (layout + item-ები), რომ გადართვა draw_sentence-ში უფასო იყოს.
+        """
+        if letters:
+            self._write(self._back, letters)
+
+    def passage_view(self) -> PassageView:
+        """გრძელი ტექსტის ფანჯარა (PassageExercise); item-ები იქმნება ერთხელ."""
+        if self.passage is None:
+            self.passage = PassageView(self.canvas, self.render, self.width, self.height)
+        return self.passage
+
+    def _write(self, pool: LetterPool, letters: Sequence[str]) -> None:
+        pool.write(letters, sentence_geometry(self.width, self.height, len(letters)))
 
     def clear_sentence(self) -> None:
-        """შლის მხოლოდ წინადადების ასოებს."""
-        for tid in self.text_ids:
-            self.canvas.delete(tid)
-        self.text_ids.clear()
+        """მალავს წინადადების ასოებს (item-ები pool-ში რჩება)."""
+        self._front.hide()
 
     def mark_letter(self, index: int) -> None:
         """
@@ -136,17 +301,18 @@ class Canvas:
         NOTE:
         ეს არის API, რომელსაც TypingExercise იყენებს.
         """
-        if 0 <= index < len(self.text_ids):
-            self.canvas.itemconfig(self.text_ids[index], fill=DARK)
+        front = self._front
+        if front.visible and 0 <= index < front.count:
+            self.render.set(front.ids[index], fill=DARK)
 
     # ======================================================
     #   ქულები და ტაიმერი
     # ======================================================
     def draw_score_timer(self) -> None:
         """ხატავს ტაიმერს, ქულებს და შედეგის ველს."""
+        geo = screen_geometry(self.width, self.height)
         self.timer_display = self.canvas.create_text(
-            120,
-            self.height - 130,
+            *geo.timer,
             text="0",
             font=("Arial", 40, "bold"),
             fill="blue",
@@ -154,8 +320,7 @@ class Canvas:
         )
 
         self.score_display = self.canvas.create_text(
-            self.width - 120,
-            self.height - 130,
+            *geo.score,
             text="0",
             font=("Arial", 40, "bold"),
             fill="green",
@@ -163,8 +328,7 @@ class Canvas:
         )
 
         self.result_display = self.canvas.create_text(
-            self.width / 2,
-            self.height - 70,
+            *geo.result,
             text="",
             font=("Arial", 28, "bold"),
             fill="purple",
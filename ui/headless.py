@@ -0,0 +1,410 @@
+# ui/headless.py
+# KLAVA — Headless canvas backend (ეკრანის გარეშე)
+# tk.Canvas-ის იმ ქვესიმრავლის იმიტაცია, რომელსაც Canvas/Keyboard/Trainer იყენებს.
+# ითვლის ოპერაციებს და მათ სავარაუდო ღირებულებას; დრო ვირტუალურია.
+
+from __future__ import annotations
+
+import heapq
+import itertools
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# ── ოპერაციების ფარდობითი ღირებულება (Tk-ის მიახლოებითი მოდელი) ────
+# ერთეული ≈ ერთი itemconfig ტექსტზე; smooth polygon-ის ხელახალი
+# tessellation და ახალი item-ის შექმნა გაცილებით ძვირია.
+COST_MODEL: Dict[str, float] = {
+    "create_text": 4.0,
+    "create_polygon": 8.0,
+    "create_rectangle": 3.0,
+    "create_image": 3.0,
+    "itemconfig": 1.0,
+    "itemconfig:polygon": 3.0,
+    "coords": 1.5,
+    "delete": 2.0,
+    "tag_raise": 1.0,
+    "tag_lower": 1.0,
+    "after": 0.5,
+    "after_idle": 0.2,
+    "after_cancel": 0.2,
+}
+
+
+class HeadlessLoop:
+    """
+    ვირტუალური event loop: `after` ტაიმერები (heap) და `after_idle` რიგი.
+    Root-ი და Canvas-ი ერთ loop-ს იზიარებენ.
+    """
+
+    def __init__(self) -> None:
+        self.now_ms: int = 0
+        self._timers: List[Tuple[int, int, str]] = []
+        self._callbacks: Dict[str, Callable[[], Any]] = {}
+        self._idle: List[Tuple[str, Callable[[], Any]]] = []
+        self._ids = itertools.count(1)
+
+    def after(self, ms: int, func: Callable[[], Any]) -> str:
+        job = f"after#{next(self._ids)}"
+        self._callbacks[job] = func
+        heapq.heappush(self._timers, (self.now_ms + int(ms), next(self._ids), job))
+        return job
+
+    def after_idle(self, func: Callable[[], Any]) -> str:
+        job = f"idle#{next(self._ids)}"
+        self._callbacks[job] = func
+        self._idle.append((job, func))
+        return job
+
+    def after_cancel(self, job: str) -> None:
+        self._callbacks.pop(job, None)
+
+    @property
+    def pending(self) -> int:
+        """დაგეგმილი (ჯერ არ შესრულებული) callback-ების რაოდენობა."""
+        return len(self._callbacks)
+
+    @property
+    def timers(self) -> int:
+        """ტაიმერების heap-ის ზომა (გაუქმებულების ჩათვლით, compaction-მდე)."""
+        return len(self._timers)
+
+    def run_idle(self) -> None:
+        """idle რიგის დაცლა (Tk-ის მსგავსად — ეტაპობრივად)."""
+        while self._idle:
+            batch, self._idle = self._idle, []
+            for job, func in batch:
+                if self._callbacks.pop(job, None) is not None:
+                    func()
+
+    def advance(self, ms: int) -> None:
+        """ვირტუალური დროის წინ წაწევა და ვადაგასული ტაიმერების შესრულება."""
+        target = self.now_ms + int(ms)
+        self.run_idle()
+        while self._timers and self._timers[0][0] <= target:
+            due, _, job = heapq.heappop(self._timers)
+            func = self._callbacks.pop(job, None)
+            if func is None:
+                continue
+            self.now_ms = due
+            func()
+            self.run_idle()
+        self.now_ms = target
+        # გაუქმებული ტაიმერები heap-ში არ გროვდება
+        if len(self._timers) > 4 * len(self._callbacks) + 64:
+            self._timers = [t for t in self._timers if t[2] in self._callbacks]
+            heapq.heapify(self._timers)
+
+
+class HeadlessCanvas:
+    """
+    tk.Canvas-ის headless ვერსია.
+
+    მხარდაჭერილია: create_text/polygon/rectangle/image, itemconfig(ure),
+    itemcget, coords, delete, tag_raise/tag_lower, find_all, find_withtag,
+    after/after_idle/after_cancel, bind, pack, winfo_*.
+
+    `items`-ის რიგი — display list (ქვემოდან ზემოთ), როგორც Tk-ში:
+    ახალი item ზემოთ ემატება, tag_raise/tag_lower მას გადაადგილებს;
+    `find_all()` ამავე რიგით ბრუნდება (z-order-ის შესამოწმებლად).
+    """
+
+    def __init__(
+        self,
+        loop: Optional[HeadlessLoop] = None,
+        width: int = 1920,
+        height: int = 1080,
+    ) -> None:
+        self.loop: HeadlessLoop = loop or HeadlessLoop()
+        self.screen_width = width
+        self.screen_height = height
+
+        self.items: Dict[int, Dict[str, Any]] = {}
+        self._ids = itertools.count(1)
+        self.bindings: Dict[str, Callable[..., Any]] = {}
+
+        self.ops: Counter[str] = Counter()
+
+    # ======================================================
+    #   სტატისტიკა
+    # ======================================================
+    @property
+    def cost(self) -> float:
+        """ოპერაციების ჯამური ღირებულება COST_MODEL-ით."""
+        return sum(COST_MODEL.get(op, 1.0) * n for op, n in self.ops.items())
+
+    def reset_stats(self) -> None:
+        self.ops.clear()
+
+    # ======================================================
+    #   ITEMS
+    # ======================================================
+    def _create(self, kind: str, coords: Tuple[Any, ...], options: Dict[str, Any]) -> int:
+        self.ops["create_" + kind] += 1
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = tuple(coords[0])
+        tags = options.pop("tags", ())
+        if isinstance(tags, str):
+            tags = (tags,)
+        item = next(self._ids)
+        self.items[item] = {
+            "type": kind,
+            "coords": list(coords),
+            "tags": tuple(tags),
+            "state": "normal",
+            **options,
+        }
+        return item
+
+    def create_text(self, *coords: Any, **options: Any) -> int:
+        return self._create("text", coords, options)
+
+    def create_polygon(self, *coords: Any, **options: Any) -> int:
+        return self._create("polygon", coords, options)
+
+    def create_rectangle(self, *coords: Any, **options: Any) -> int:
+        return self._create("rectangle", coords, options)
+
+    def create_image(self, *coords: Any, **options: Any) -> int:
+        return self._create("image", coords, options)
+
+    def _resolve(self, tag_or_id: Any) -> List[int]:
+        if isinstance(tag_or_id, int):
+            return [tag_or_id] if tag_or_id in self.items else []
+        if isinstance(tag_or_id, str) and tag_or_id.isdigit():
+            return self._resolve(int(tag_or_id))
+        if tag_or_id == "all":
+            return list(self.items)
+        return [i for i, it in self.items.items() if tag_or_id in it["tags"]]
+
+    def itemconfig(self, tag_or_id: Any, **options: Any) -> None:
+        for item in self._resolve(tag_or_id):
+            it = self.items[item]
+            self.ops["itemconfig:polygon" if it["type"] == "polygon" else "itemconfig"] += 1
+            it.update(options)
+
+    itemconfigure = itemconfig
+
+    def itemcget(self, tag_or_id: Any, option: str) -> Any:
+        items = self._resolve(tag_or_id)
+        return self.items[items[0]].get(option, "") if items else ""
+
+    def coords(self, tag_or_id: Any, *coords: Any) -> List[float]:
+        items = self._resolve(tag_or_id)
+        if not coords:
+            return list(self.items[items[0]]["coords"]) if items else []
+        if len(coords) == 1 and isinstance(coords[0], (list, tuple)):
+            coords = tuple(coords[0])
+        self.ops["coords"] += 1
+        for item in items:
+            self.items[item]["coords"] = list(coords)
+        return list(coords)
+
+    def delete(self, *tags_or_ids: Any) -> None:
+        self.ops["delete"] += 1
+        for t in tags_or_ids:
+            for item in self._resolve(t):
+                del self.items[item]
+
+    def _restack(self, tag_or_id: Any, ref: Any, above: bool) -> None:
+        """item-ების გადატანა display list-ში `ref`-ის ზემოთ/ქვემოთ (ან ბოლოში/თავში)."""
+        moved = self._resolve(tag_or_id)
+        if not moved:
+            return
+        order = [i for i in self.items if i not in moved]
+        refs = self._resolve(ref) if ref is not None else []
+        refs = [i for i in refs if i not in moved]
+        if not refs:
+            at = len(order) if above else 0
+        elif above:
+            at = max(order.index(i) for i in refs) + 1
+        else:
+            at = min(order.index(i) for i in refs)
+        order[at:at] = moved
+        self.items = {i: self.items[i] for i in order}
+
+    def tag_lower(self, tag_or_id: Any, below: Any = None) -> None:
+        self.ops["tag_lower"] += 1
+        self._restack(tag_or_id, below, above=False)
+
+    def tag_raise(self, tag_or_id: Any, above: Any = None) -> None:
+        self.ops["tag_raise"] += 1
+        self._restack(tag_or_id, above, above=True)
+
+    def on_top(self, tag_or_id: Any) -> bool:
+        """`tag_or_id`-ის item-ები display list-ის თავზეა (ყველაფერს ფარავს)."""
+        items = self._resolve(tag_or_id)
+        return bool(items) and self.find_all()[-len(items) :] == tuple(items)
+
+    def find_all(self) -> Tuple[int, ...]:
+        return tuple(self.items)
+
+    def find_withtag(self, tag_or_id: Any) -> Tuple[int, ...]:
+        return tuple(self._resolve(tag_or_id))
+
+    # ======================================================
+    #   EVENT LOOP
+    # ======================================================
+    def after(self, ms: int, func: Optional[Callable[[], Any]] = None, *args: Any) -> str:
+        self.ops["after"] += 1
+        assert func is not None
+        return self.loop.after(ms, (lambda: func(*args)) if args else func)
+
+    def after_idle(self, func: Callable[[], Any], *args: Any) -> str:
+        self.ops["after_idle"] += 1
+        return self.loop.after_idle((lambda: func(*args)) if args else func)
+
+    def after_cancel(self, job: str) -> None:
+        self.ops["after_cancel"] += 1
+        self.loop.after_cancel(job)
+
+    def bind(self, sequence: str, func: Callable[..., Any], add: Any = None) -> None:
+        self.bindings[sequence] = func
+
+    # ======================================================
+    #   WIDGET
+    # ======================================================
+    def pack(self, **_: Any) -> None:
+        pass
+
+    def update_idletasks(self) -> None:
+        self.loop.run_idle()
+
+    def winfo_screenwidth(self) -> int:
+        return self.screen_width
+
+    def winfo_screenheight(self) -> int:
+        return self.screen_height
+
+    def winfo_width(self) -> int:
+        return self.screen_width
+
+    def winfo_height(self) -> int:
+        return self.screen_height
+
+
+class HeadlessPhotoImage:
+    """
+    tk.PhotoImage-ის იმიტაცია (ui.sprites-ისთვის): `put` იწერს პიქსელებს ლექსიკონში.
+    ჩაუწერელი პიქსელი გამჭვირვალეა (როგორც Tk-ში).
+    """
+
+    def __init__(self, width: int = 0, height: int = 0) -> None:
+        self._width = width
+        self._height = height
+        self.pixels: Dict[Tuple[int, int], str] = {}
+        self.puts: int = 0
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+    def put(self, data: str, to: Tuple[int, ...] = (0, 0)) -> None:
+        self.puts += 1
+        rows = [r.split() for r in data.strip("{}").split("} {")]
+        x0, y0 = to[0], to[1]
+        if len(to) == 4:
+            x1, y1 = to[2], to[3]
+        else:
+            x1, y1 = x0 + len(rows[0]), y0 + len(rows)
+        for y in range(y0, y1):
+            row = rows[(y - y0) % len(rows)]
+            for x in range(x0, x1):
+                self.pixels[(x, y)] = row[(x - x0) % len(row)]
+
+    def get(self, x: int, y: int) -> Optional[str]:
+        return self.pixels.get((x, y))
+
+    def blit(self, src: "HeadlessPhotoImage", x: int, y: int) -> None:
+        """ui.sprites.tk_blit-ის ანალოგი (გამჭვირვალე პიქსელები არ იწერება)."""
+        self.puts += 1
+        for (sx, sy), color in src.pixels.items():
+            self.pixels[(sx + x, sy + y)] = color
+
+
+class HeadlessEvent:
+    """tk.Event-ის ის ველები, რასაც KLAVA კითხულობს."""
+
+    __slots__ = ("keysym", "char", "keycode", "time", "widget")
+
+    def __init__(self, keysym: str, char: str = "", keycode: int = 0, time: int = 0) -> None:
+        self.keysym = keysym
+        self.char = char
+        self.keycode = keycode
+        self.time = time
+        self.widget = None
+
+
+class HeadlessRoot:
+    """tk.Tk-ის headless ვერსია (bind, attributes, after, event_generate, ...)."""
+
+    def __init__(self, loop: Optional[HeadlessLoop] = None) -> None:
+        self.loop: HeadlessLoop = loop or HeadlessLoop()
+        self.bindings: Dict[str, Callable[..., Any]] = {}
+        self.attrs: Dict[str, Any] = {}
+        self.options: Dict[str, Any] = {}
+        self.destroyed: bool = False
+
+    def bind(self, sequence: str, func: Callable[..., Any], add: Any = None) -> None:
+        self.bindings[sequence] = func
+
+    def attributes(self, name: str, value: Any = None) -> Any:
+        if value is None:
+            return self.attrs.get(name)
+        self.attrs[name] = value
+        return None
+
+    def config(self, **options: Any) -> None:
+        self.options.update(options)
+
+    configure = config
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.options[key] = value
+
+    def protocol(self, name: str, func: Optional[Callable[[], Any]] = None) -> None:
+        self.options[name] = func
+
+    def destroy(self) -> None:
+        self.destroyed = True
+
+    def after(self, ms: int, func: Optional[Callable[[], Any]] = None, *args: Any) -> str:
+        assert func is not None
+        return self.loop.after(ms, (lambda: func(*args)) if args else func)
+
+    def after_idle(self, func: Callable[[], Any], *args: Any) -> str:
+        return self.loop.after_idle((lambda: func(*args)) if args else func)
+
+    def after_cancel(self, job: str) -> None:
+        self.loop.after_cancel(job)
+
+    def event_generate(self, sequence: str, **fields: Any) -> None:
+        """`<Key>` event-ის მიწოდება bind-ით დარეგისტრირებულ handler-ზე."""
+        handler = self.bindings.get(sequence) or self.bindings.get("<Key>")
+        if handler is None:
+            return
+        handler(
+            HeadlessEvent(
+                keysym=fields.get("keysym", ""),
+                char=fields.get("char", ""),
+                keycode=fields.get("keycode", 0),
+                time=fields.get("time", self.loop.now_ms),
+            )
+        )
+
+    def winfo_screenwidth(self) -> int:
+        return 1920
+
+    def winfo_screenheight(self) -> int:
+        return 1080
+
+
+class HeadlessMenu:
+    """AppMenu-ის ადგილი headless რეჟიმში."""
+
+    def show(self) -> None:
+        pass
+
+    def hide(self) -> None:
+        pass
@@ -0,0 +1,106 @@
+# ui/hud.py
+# KLAVA — Live HUD (ტაიმერი, ქულა, WPM)
+# ერთი ფიქსირებული სიხშირის `after` ციკლი; კლავიშზე არაფერი იხატება
+
+from __future__ import annotations
+
+import time
+from typing import Callable, Optional
+
+from logic.progress import SessionStats
+from ui.canvas import Canvas
+
+
+class Hud:
+    """
+    ცოცხალი HUD ტრენინგის დროს.
+
+    - მნიშვნელობები იკითხება `SessionStats`-იდან მხოლოდ tick-ზე
+      (`refresh_hz`-ჯერ წამში), არა ყოველ კლავიშზე
+    - ტექსტი იცვლება მხოლოდ მაშინ, როცა ნაჩვენები მნიშვნელობა შეიცვალა
+    - tick-ები ეწყობა monotonic საათის ბადეზე: დაგვიანება არ გროვდება,
+      გამოტოვებული tick-ები არ მეორდება
+    - `stop()`-ის შემდეგ დაგეგმილი callback აღარ რჩება (მენიუ/cover — 0 CPU)
+    """
+
+    def __init__(
+        self,
+        ui: Canvas,
+        stats: SessionStats,
+        refresh_hz: float = 4.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ui = ui
+        self.stats = stats
+        self.interval: float = 1.0 / refresh_hz
+        self.clock = clock
+
+        self.running: bool = False
+        self._job: Optional[str] = None
+        self._t0: float = 0.0
+        self._next: float = 0.0
+
+        # ბოლოს ნაჩვენები მნიშვნელობები
+        self._timer: Optional[int] = None
+        self._score: Optional[int] = None
+        self._wpm: Optional[int] = None
+
+    # ======================================================
+    #   LIFECYCLE
+    # ======================================================
+    def start(self) -> None:
+        """HUD-ის ჩვენება და ციკლის დაწყება (სესიის დასაწყისში)."""
+        self.stop()
+        if self.ui.timer_display is None:
+            self.ui.draw_score_timer()
+
+        self._timer = self._score = self._wpm = None
+        self.running = True
+        self._t0 = self._next = self.clock()
+        self._tick()
+
+    def stop(self) -> None:
+        """ციკლის სრული შეჩერება (ბოლო მნიშვნელობები ეკრანზე რჩება)."""
+        self.running = False
+        if self._job is not None:
+            self.ui.canvas.after_cancel(self._job)
+            self._job = None
+
+    # ======================================================
+    #   TICK
+    # ======================================================
+    def _tick(self) -> None:
+        self._job = None
+        if not self.running:
+            return
+
+        now = self.clock()
+        self.refresh(now)
+
+        # შემდეგი tick ბადის მომდევნო წერტილზე
+        self._next += self.interval
+        if self._next <= now:
+            self._next = now + self.interval
+        delay = max(1, int((self._next - now) * 1000))
+        self._job = self.ui.canvas.after(delay, self._tick)
+
+    def refresh(self, now: Optional[float] = None) -> None:
+        """მნიშვნელობების გადათვლა და მხოლოდ შეცვლილის განახლება."""
+        if now is None:
+            now = self.clock()
+        stats = self.stats
+
+        seconds = int(now - self._t0)
+        if seconds != self._timer:
+            self._timer = seconds
+            self.ui.update_timer(seconds)
+
+        score = stats.hits
+        if score != self._score:
+            self._score = score
+            self.ui.update_score(score)
+
+        wpm = round(stats.live_wpm(now)) if stats.count else 0
+        if wpm != self._wpm:
+            self._wpm = wpm
+            self.ui.show_result(f"{wpm} WPM")
@@ -3,7 +3,14 @@
 
 from __future__ import annotations
 import tkinter as tk
-from typing import Dict, Optional, TypedDict
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+from diagnostics.startup import startup
+from logic.layouts import SPACE, Layout, load_layout
+from ui.animation import Animator
+from ui.layout import Box, KeyboardGeometry, keyboard_geometry, round_rect_points
+from ui.render import RenderScheduler
+from ui.sprites import SpriteAtlas
 
 # ── ფერები ─────────────────────────────────────────
 COLOR_IDLE_FALLBACK = "#eeeeee"
@@ -16,6 +23,11 @@ TEXT_DARK = "#000000"
 
 BORDER_BLUE = "#3b82f6"
 
+# არასწორი კლავიშის წითლად ციმციმის ხანგრძლივობა (ms)
+WRONG_FLASH_MS = 160
+
+# QWERTY — ნაგულისხმევი განლაგება (data/layouts/qwerty.json);
+# სხვა განლაგებები — logic.layouts
 KEYBOARD = [
     list("QWERTYUIOP"),
     list("ASDFGHJKL"),
@@ -53,32 +65,80 @@ class KeyBox(TypedDict):
     base_fill: str
     outline: str
     center_x: float
+    x: float
+    y: float
+    width: float
+    height: float
+    radius: int
 
 
 class Keyboard:
-    def __init__(self, canvas: tk.Canvas, screen_width: int, screen_height: int):
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        screen_width: int,
+        screen_height: int,
+        render: Optional[RenderScheduler] = None,
+        atlas: Optional[SpriteAtlas] = None,
+        flatten: bool = False,
+        layout: Optional[Layout] = None,
+    ):
+        """
+        :param layout: კლავიატურის განლაგება (None — QWERTY);
+                       გადართვა არსებულ Canvas-ზე — `set_layout`
+        :param render: საერთო RenderScheduler (None — საკუთარი)
+        :param atlas: sprite-ების ატლასი; მოცემულისას კლავიშები იხატება
+                      PhotoImage-ებით (smooth polygon-ის ნაცვლად) და
+                      მდგომარეობის ცვლა არის image swap
+        :param flatten: სტატიკური ფენა (idle კლავიშები + legend) ერთ
+                        ფონურ სურათად; live რჩება მხოლოდ წარწერები და
+                        highlight overlay-ები (საჭიროებს atlas-ს)
+        """
+        if flatten and atlas is None:
+            raise ValueError("flatten რეჟიმს სჭირდება SpriteAtlas")
+
         self.canvas = canvas
+        self.layout: Layout = layout or load_layout()
         self.width = screen_width
         self.height = screen_height
 
+        # ფერების ცვლილებები იგზავნება კადრში ერთხელ (საერთო Canvas-თან)
+        self.render: RenderScheduler = render or RenderScheduler(canvas)
+        self.atlas: Optional[SpriteAtlas] = atlas
+        self.flatten: bool = flatten
+
+        # flatten: ფონური სურათი (idle კლავიშები + legend)
+        self.background: Optional[int] = None
+        self._background_image: Any = None
+
         self.key_boxes: Dict[str, KeyBox] = {}
         self.current_target: Optional[str] = None
-        self._wrong_flash_id: Optional[str] = None
 
-        self.finger_centers: Dict[str, float] = {}
+        # დროითი ეფექტები (wrong flash) — ერთი timer, თითო კლავიშზე ერთი ეფექტი
+        self.animator: Animator = Animator(canvas)
+
+        # გეომეტრია — სუფთა მონაცემი (ui.layout); relayout ამოძრავებს item-ებს
+        with startup.phase("keyboard.geometry"):
+            self.geometry: KeyboardGeometry = self._compute_geometry()
+        self.finger_centers: Dict[str, float] = self.geometry.finger_centers
+        self._legend_items: List[Tuple[int, int]] = []
 
-        self._draw_keys()
-        self._compute_finger_centers()
-        self._draw_finger_legend()
+        with startup.phase("keyboard.draw_keys"):
+            self._draw_keys()
+        with startup.phase("keyboard.draw_finger_legend"):
+            self._draw_finger_legend()
+        with startup.phase("keyboard.background"):
+            self._draw_background()
 
     # ==================================================
     #   Helpers
     # ==================================================
     def _finger_for_key(self, ch: str) -> Optional[str]:
-        for finger, keys in FINGER_GROUPS.items():
-            if ch in keys:
-                return finger
-        return None
+        return self.layout.finger_of.get(ch)
+
+    def _key(self, ch: str) -> str:
+        """სიმბოლო → კლავიში (Shift ფენის სიმბოლო ანათებს თავის კლავიშს)."""
+        return self.layout.key_of.get(ch, ch)
 
     @staticmethod
     def lighten_color(hex_color: str, factor: float = 0.88) -> str:
@@ -93,180 +153,267 @@ class Keyboard:
 
         return f"#{r:02x}{g:02x}{b:02x}"
 
-    def _round_rect(self, x1, y1, x2, y2, r=16, **kw) -> int:
-        r = min(r, (x2 - x1) / 2, (y2 - y1) / 2)
-        points = [
-            x1 + r,
-            y1,
-            x2 - r,
-            y1,
-            x2,
-            y1,
-            x2,
-            y1 + r,
-            x2,
-            y2 - r,
-            x2,
-            y2,
-            x2 - r,
-            y2,
-            x1 + r,
-            y2,
-            x1,
-            y2,
-            x1,
-            y2 - r,
-            x1,
-            y1 + r,
-            x1,
-            y1,
-        ]
-        return self.canvas.create_polygon(points, smooth=True, **kw)
+    def _key_colors(self, ch: str) -> Tuple[str, str]:
+        """კლავიშის idle ფერები: (fill, outline)."""
+        if ch == SPACE:
+            return COLOR_IDLE_FALLBACK, BORDER_BLUE
+        finger = self._finger_for_key(ch)
+        outline = FINGER_COLORS[finger] if finger else "#999999"
+        return self.lighten_color(outline), outline
+
+    def _compute_geometry(self) -> KeyboardGeometry:
+        layout = self.layout
+        return keyboard_geometry(self.width, self.height, layout.rows, layout.finger_of)
+
+    def _shape(self, box: Box, fill: str, outline: str, width: int = 2) -> int:
+        """
+        მომრგვალებული ფიგურა: smooth polygon ან sprite (ატლასიდან).
+        flatten რეჟიმში item არ იქმნება (ფიგურა ფონურ სურათშია) — აბრუნებს 0-ს.
+        """
+        if self.atlas is None:
+            return self.canvas.create_polygon(
+                round_rect_points(box), smooth=True, fill=fill, outline=outline, width=width
+            )
+        if self.flatten:
+            return 0
+
+        image = self.atlas.get(box.w, box.h, box.r, fill, outline, width)
+        item = self.canvas.create_image(box.x, box.y, image=image, anchor="nw")
+        self.render.known(item, image=image)
+        return item
+
+    def _move(self, item: int, box: Box, fill: str, outline: str, width: int = 2) -> None:
+        """არსებული ფიგურის გადატანა ახალ გეომეტრიაზე (coords; sprite — ახალი ზომის image)."""
+        if not item:
+            return
+        if self.atlas is None:
+            self.canvas.coords(item, *round_rect_points(box))
+            return
+
+        self.canvas.coords(item, box.x, box.y)
+        self.render.set(item, image=self.atlas.get(box.w, box.h, box.r, fill, outline, width))
+
+    def _paint(self, box: KeyBox, fill: str) -> None:
+        """კლავიშის ფონის ფერი: sprite-ის გაცვლა ან polygon-ის fill."""
+        if self.atlas is None:
+            self.render.set(box["rect"], fill=fill, outline=box["outline"])
+            return
+
+        image = self.atlas.get(
+            box["width"], box["height"], box["radius"], fill, box["outline"]
+        )
+        if not self.flatten:
+            self.render.set(box["rect"], image=image)
+            return
+
+        # flatten: idle მდგომარეობა უკვე ფონშია — overlay იმალება
+        if fill == box["base_fill"]:
+            if box["rect"]:
+                self.render.set(box["rect"], state="hidden")
+            return
+        item = box["rect"] or self._overlay(box, image)
+        self.render.set(item, image=image, state="normal")
+
+    def _overlay(self, box: KeyBox, image: Any) -> int:
+        """highlight overlay-ის შექმნა პირველი საჭიროებისას (წარწერის ქვეშ)."""
+        item = self.canvas.create_image(
+            box["x"], box["y"], image=image, anchor="nw", state="hidden"
+        )
+        self.canvas.tag_lower(item, box["text"])
+        self.render.known(item, image=image, state="hidden")
+        box["rect"] = item
+        return item
 
     # ==================================================
     #   Draw keyboard + SPACE
     # ==================================================
     def _draw_keys(self):
-        key_w = self.width / 14
-        key_h = self.height / 11
-        gap = key_w * 0.12
-        y0 = self.height / 3
-
-        row_offsets = {
-            0: 0,
-            1: key_w / 6,
-            2: key_w / 6 + key_w / 2,
-        }
+        geo = self.geometry
+        if self.atlas is not None:
+            self.atlas.begin((round(geo.key_w), round(geo.key_h)))
 
-        # --- letter keys ---
-        for r, row in enumerate(KEYBOARD):
-            offset = row_offsets[r]
-            total_w = len(row) * (key_w + gap) - gap
-            x0 = self.width / 2 - total_w / 2 - offset
-
-            for c, ch in enumerate(row):
-                x1 = x0 + c * (key_w + gap)
-                y1 = y0 + r * (key_h + gap)
-
-                finger = self._finger_for_key(ch)
-                outline = FINGER_COLORS[finger] if finger else "#999999"
-                fill = self.lighten_color(outline)
-
-                rect = self._round_rect(
-                    x1,
-                    y1,
-                    x1 + key_w,
-                    y1 + key_h,
-                    r=18,
-                    fill=fill,
-                    outline=outline,
-                    width=2,
-                )
-                txt = self.canvas.create_text(
-                    x1 + key_w / 2,
-                    y1 + key_h / 2,
-                    text=ch,
-                    font=("Arial", int(key_h * 0.42), "bold"),
-                    fill=TEXT_PALE,
-                )
-
-                self.key_boxes[ch] = {
-                    "rect": rect,
-                    "text": txt,
-                    "base_fill": fill,
-                    "outline": outline,
-                    "center_x": x1 + key_w / 2,
-                }
-
-        # --- SPACE ---
-        third_offset = key_w / 3 + key_w / 2
-        row3_w = len(KEYBOARD[2]) * (key_w + gap) - gap
-        row3_x0 = self.width / 2 - row3_w / 2 - third_offset
-
-        space_x = row3_x0 + 2 * (key_w + gap) + gap
-        space_w = 5 * key_w + 4 * gap
-        space_y = y0 + 3 * (key_h + gap)
-
-        rect = self._round_rect(
-            space_x,
-            space_y,
-            space_x + space_w,
-            space_y + key_h,
-            r=22,
-            fill=COLOR_IDLE_FALLBACK,
-            outline=BORDER_BLUE,
-            width=2,
-        )
+        for ch, kg in geo.keys.items():
+            self.key_boxes[ch] = self._new_key(ch, kg.box, kg.font_size)
+
+        self.key_boxes["SPACE"] = self.key_boxes[SPACE]
+
+    def _new_key(self, ch: str, b: Box, font_size: int) -> KeyBox:
+        fill, outline = self._key_colors(ch)
+
+        rect = self._shape(b, fill, outline)
+        font = ("Arial", font_size, "bold")
         txt = self.canvas.create_text(
-            space_x + space_w / 2,
-            space_y + key_h / 2,
-            text="SPACE",
-            font=("Arial", int(key_h * 0.38), "bold"),
+            *b.center,
+            text="SPACE" if ch == SPACE else ch,
+            font=font,
             fill=TEXT_PALE,
         )
 
-        self.key_boxes[" "] = {
+        if self.atlas is None:
+            self.render.known(rect, fill=fill, outline=outline)
+        self.render.known(txt, fill=TEXT_PALE, font=font)
+
+        return {
             "rect": rect,
             "text": txt,
-            "base_fill": COLOR_IDLE_FALLBACK,
-            "outline": BORDER_BLUE,
-            "center_x": space_x + space_w / 2,
+            "base_fill": fill,
+            "outline": outline,
+            "center_x": b.center[0],
+            "x": b.x,
+            "y": b.y,
+            "width": b.w,
+            "height": b.h,
+            "radius": b.r,
         }
-        self.key_boxes["SPACE"] = self.key_boxes[" "]
 
     # ==================================================
-    #   Finger centers (SPACE excluded)
+    #   Legend (unchanged, just lower)
     # ==================================================
-    def _compute_finger_centers(self):
-        acc: Dict[str, list[float]] = {}
+    def _legend_colors(self, finger: str) -> Tuple[Tuple[str, str], Tuple[str, str]]:
+        """(body fill, outline), (nail fill, outline)."""
+        light = self.lighten_color(FINGER_COLORS[finger])
+        return (light, light), ("#F5F5F5", "#E0E0E0")
+
+    def _draw_finger_legend(self):
+        for lg in self.geometry.legend:
+            body_colors, nail_colors = self._legend_colors(lg.finger)
+            body = self._shape(lg.body, *body_colors)
+            nail = self._shape(lg.nail, *nail_colors)
+            self._legend_items.append((body, nail))
 
-        for ch, box in self.key_boxes.items():
-            if ch in (" ", "SPACE"):
-                continue
-            finger = self._finger_for_key(ch)
-            if finger:
-                acc.setdefault(finger, []).append(box["center_x"])
+    # ==================================================
+    #   Static layer (flatten)
+    # ==================================================
+    def _draw_background(self) -> None:
+        """idle კლავიშების და legend-ის sprite-ები ერთ სურათად და ერთ item-ად."""
+        if not self.flatten or self.atlas is None:
+            return
 
-        self.finger_centers = {f: sum(xs) / len(xs) for f, xs in acc.items()}
+        atlas = self.atlas
+        placements: List[Tuple[float, float, Any]] = []
+        for ch, kg in self.geometry.keys.items():
+            b = kg.box
+            fill, outline = self._key_colors(ch)
+            placements.append((b.x, b.y, atlas.get(b.w, b.h, b.r, fill, outline)))
+        for lg in self.geometry.legend:
+            for b, (fill, outline) in zip((lg.body, lg.nail), self._legend_colors(lg.finger)):
+                placements.append((b.x, b.y, atlas.get(b.w, b.h, b.r, fill, outline)))
+
+        x0, y0, image = atlas.compose(placements)
+        self._background_image = image
+        if self.background is None:
+            self.background = self.canvas.create_image(x0, y0, image=image, anchor="nw")
+            self.canvas.tag_lower(self.background)
+        else:
+            self.canvas.coords(self.background, x0, y0)
+            self.canvas.itemconfig(self.background, image=image)
 
     # ==================================================
-    #   Legend (unchanged, just lower)
+    #   Relayout (ფანჯრის ზომის ცვლილება)
     # ==================================================
-    def _draw_finger_legend(self):
-        finger_w = 36
-        finger_h = 90
-        nail_w = 26
-        nail_h = 18
-
-        y = self.height / 3 + 5.0 * (self.height / 11)
-
-        for finger, cx in self.finger_centers.items():
-            x = cx - finger_w / 2
-            light = self.lighten_color(FINGER_COLORS[finger])
-
-            self._round_rect(
-                x,
-                y,
-                x + finger_w,
-                y + finger_h,
-                r=int(finger_w / 2),
-                fill=light,
-                outline=light,
-                width=2,
+    def relayout(self, width: int, height: int) -> bool:
+        """
+        ახალი ზომის გეომეტრიის გამოყენება არსებულ item-ებზე
+        (coords + font; sprite-ები — ახალი ზომით). item-ები არ იშლება.
+
+        :return: True — თუ ზომა შეიცვალა
+        """
+        if (width, height) == (self.width, self.height):
+            return False
+
+        self.width = width
+        self.height = height
+        self._apply_geometry()
+        return True
+
+    def _apply_geometry(self, geo: Optional[KeyboardGeometry] = None) -> None:
+        """
+        გეომეტრიის (თავიდან გამოთვლა და) არსებული item-ების გადატანა;
+        ყველა კლავიში უბრუნდება თავის მდგომარეობას (ციმციმი წყდება).
+        """
+        self.geometry = geo = geo or self._compute_geometry()
+        self.finger_centers = geo.finger_centers
+
+        if self.atlas is not None:
+            self.atlas.begin((round(geo.key_w), round(geo.key_h)))
+
+        for ch, kg in geo.keys.items():
+            b = kg.box
+            box = self.key_boxes[ch]
+            box.update(
+                center_x=b.center[0], x=b.x, y=b.y, width=b.w, height=b.h, radius=b.r
             )
+            self._move(box["rect"], b, box["base_fill"], box["outline"])
+            self.canvas.coords(box["text"], *b.center)
+            self.render.set(box["text"], font=("Arial", kg.font_size, "bold"))
+
+        if len(self._legend_items) != len(geo.legend):
+            self._delete(*(item for pair in self._legend_items for item in pair))
+            self._legend_items = []
+            self._draw_finger_legend()
+        else:
+            for (body, nail), lg in zip(self._legend_items, geo.legend):
+                body_colors, nail_colors = self._legend_colors(lg.finger)
+                self._move(body, lg.body, *body_colors)
+                self._move(nail, lg.nail, *nail_colors)
+
+        self._draw_background()
+
+        self.animator.cancel_all()
+        for key in geo.keys:
+            self._restore_key(key)
+
+    def _delete(self, *items: int) -> None:
+        for item in items:
+            if item:
+                self.canvas.delete(item)
+                self.render.forget(item)
 
-            nx = x + (finger_w - nail_w) / 2
-            ny = y + 16
-            self._round_rect(
-                nx,
-                ny,
-                nx + nail_w,
-                ny + nail_h,
-                r=int(nail_h / 2),
-                fill="#F5F5F5",
-                outline="#E0E0E0",
-                width=2,
-            )
+    # ==================================================
+    #   Layout switch (Canvas-ის ხელახლა აგების გარეშე)
+    # ==================================================
+    def set_layout(self, layout: Layout) -> bool:
+        """
+        სხვა განლაგებაზე გადართვა. კლავიშების item-ები ხელახლა გამოიყენება
+        (წარწერა, ფერი, coords); აკლდება — იქმნება, რჩება — იშლება.
+
+        :return: True — თუ განლაგება შეიცვალა
+        """
+        if layout is self.layout:
+            return False
+
+        self.animator.cancel_all()
+        self.current_target = None
+        self.layout = layout
+        geo = self._compute_geometry()
+        if self.atlas is not None:
+            self.atlas.begin((round(geo.key_w), round(geo.key_h)))
+
+        old = self.key_boxes
+        space = old[SPACE]
+        spare = [box for ch, box in old.items() if ch not in (SPACE, "SPACE")]
+        spare.reverse()
+
+        self.key_boxes = {}
+        for ch in layout.keys:
+            if ch == SPACE:
+                box = space
+            elif spare:
+                box = spare.pop()
+                fill, outline = self._key_colors(ch)
+                box.update(base_fill=fill, outline=outline)
+                self.render.set(box["text"], text=ch)
+            else:
+                kg = geo.keys[ch]
+                box = self._new_key(ch, kg.box, kg.font_size)
+            self.key_boxes[ch] = box
+        self.key_boxes["SPACE"] = space
+
+        for box in spare:
+            self._delete(box["rect"], box["text"])
+
+        self._apply_geometry(geo)
+        return True
 
     # ==================================================
     #   Public API (SPACE works)
@@ -275,32 +422,42 @@ class Keyboard:
         box = self.key_boxes.get(key)
         if not box:
             return
-        self.canvas.itemconfig(box["rect"], fill=fill)
-        self.canvas.itemconfig(box["text"], fill=text_color)
+        self._paint(box, fill)
+        self.render.set(box["text"], fill=text_color)
 
     def _reset_key(self, key: str):
         box = self.key_boxes.get(key)
         if not box:
             return
-        self.canvas.itemconfig(
-            box["rect"], fill=box["base_fill"], outline=box["outline"]
-        )
-        self.canvas.itemconfig(box["text"], fill=TEXT_PALE)
+        self._paint(box, box["base_fill"])
+        self.render.set(box["text"], fill=TEXT_PALE)
+
+    def _restore_key(self, key: str):
+        """ეფექტის ბოლოს კლავიში უბრუნდება მიმდინარე მდგომარეობას (target ან idle)."""
+        if key == self.current_target:
+            self._set_key(key, COLOR_TARGET, TEXT_DARK)
+        else:
+            self._reset_key(key)
 
     def clear(self):
+        self.animator.cancel_all()
         for key in self.key_boxes:
             self._reset_key(key)
         self.current_target = None
 
     def set_target(self, key: str):
+        key = self._key(key)
         if self.current_target:
+            self.animator.cancel(self.current_target)
             self._reset_key(self.current_target)
         self.current_target = key
+        self.animator.cancel(key)
         self._set_key(key, COLOR_TARGET, TEXT_DARK)
 
     def highlight_correct(self, key: str):
-        self._set_key(key, COLOR_CORRECT, TEXT_DARK)
+        self._set_key(self._key(key), COLOR_CORRECT, TEXT_DARK)
 
     def highlight_wrong(self, key: str):
+        key = self._key(key)
         self._set_key(key, COLOR_WRONG, TEXT_DARK)
-        self.canvas.after(160, lambda k=key: self._reset_key(k))
+        self.animator.schedule(key, WRONG_FLASH_MS, self._restore_key)
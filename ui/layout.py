@@ -0,0 +1,228 @@
+# ui/layout.py
+# KLAVA — Screen geometry as pure data
+# კოორდინატები ითვლება აქ (Tk-ის გარეშე); Canvas/Keyboard მხოლოდ ახატავს/ამოძრავებს
+
+from __future__ import annotations
+
+from typing import Dict, List, Mapping, NamedTuple, Optional, Sequence, Tuple
+
+KEY_RADIUS: int = 18
+SPACE_RADIUS: int = 22
+
+# წინადადება: y და შრიფტი — ეკრანის სიმაღლის წილი (1080-ზე: 130 და 50)
+SENTENCE_Y_RATIO: float = 0.12
+SENTENCE_FONT_RATIO: float = 0.046
+SENTENCE_MIN_FONT: int = 12
+SENTENCE_MIN_SPACING: float = 40
+SENTENCE_MAX_SPACING: float = 70
+# შრიფტი ≤ spacing · ეს — მსხვილი ასოები ერთმანეთს არ ეხება
+SENTENCE_FONT_PER_SPACING: float = 1.25
+
+# passage: ხილული სტრიქონები, მონოსიგანის შრიფტის სიგანე/სიმაღლე
+PASSAGE_LINES: int = 5
+PASSAGE_CHAR_ASPECT: float = 0.6
+
+
+class Box(NamedTuple):
+    """მომრგვალებული მართკუთხედი: ზედა-მარცხენა კუთხე, ზომა, რადიუსი."""
+
+    x: float
+    y: float
+    w: float
+    h: float
+    r: int
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return self.x + self.w / 2, self.y + self.h / 2
+
+
+class KeyGeometry(NamedTuple):
+    box: Box
+    font_size: int
+
+
+class LegendGeometry(NamedTuple):
+    finger: str
+    body: Box
+    nail: Box
+
+
+class KeyboardGeometry(NamedTuple):
+    key_w: float
+    key_h: float
+    keys: Dict[str, KeyGeometry]  # " " — SPACE
+    finger_centers: Dict[str, float]
+    legend: List[LegendGeometry]
+
+
+class SentenceGeometry(NamedTuple):
+    x: float  # პირველი ასოს ცენტრი; i-ური — x + i * spacing
+    spacing: float
+    y: float
+    font_size: int
+
+
+class PassageGeometry(NamedTuple):
+    x: float  # სტრიქონების მარცხენა კიდე (anchor "nw")
+    y: float  # პირველი სტრიქონის ზედა კიდე
+    line_h: float
+    cols: int  # სიმბოლოები სტრიქონში (wrap-ის სიგანე)
+    font_size: int
+
+
+class ScreenGeometry(NamedTuple):
+    width: float
+    height: float
+    cover: Tuple[float, float, float, float]
+    cover_text: Tuple[float, float]
+    timer: Tuple[float, float]
+    score: Tuple[float, float]
+    result: Tuple[float, float]
+
+
+# ======================================================
+#   KEYBOARD
+# ======================================================
+def keyboard_geometry(
+    width: float,
+    height: float,
+    rows: Sequence[Sequence[str]],
+    finger_of: Mapping[str, Optional[str]],
+) -> KeyboardGeometry:
+    """
+    კლავიშების, SPACE-ის და თითების legend-ის გეომეტრია ეკრანის ზომიდან.
+
+    :param rows: კლავიატურის რიგები (ზემოდან ქვემოთ)
+    :param finger_of: კლავიში → თითი (legend-ის ცენტრებისთვის)
+    """
+    key_w = width / 14
+    key_h = height / 11
+    gap = key_w * 0.12
+    y0 = height / 3
+
+    row_offsets = {
+        0: 0,
+        1: key_w / 6,
+        2: key_w / 6 + key_w / 2,
+    }
+
+    keys: Dict[str, KeyGeometry] = {}
+    key_font = int(key_h * 0.42)
+
+    # --- letter keys ---
+    for r, row in enumerate(rows):
+        offset = row_offsets.get(r, 0)
+        total_w = len(row) * (key_w + gap) - gap
+        x0 = width / 2 - total_w / 2 - offset
+
+        for c, ch in enumerate(row):
+            x1 = x0 + c * (key_w + gap)
+            y1 = y0 + r * (key_h + gap)
+            keys[ch] = KeyGeometry(Box(x1, y1, key_w, key_h, KEY_RADIUS), key_font)
+
+    # --- SPACE ---
+    third_offset = key_w / 3 + key_w / 2
+    row3_w = len(rows[2]) * (key_w + gap) - gap
+    row3_x0 = width / 2 - row3_w / 2 - third_offset
+
+    space_x = row3_x0 + 2 * (key_w + gap) + gap
+    space_w = 5 * key_w + 4 * gap
+    space_y = y0 + 3 * (key_h + gap)
+    keys[" "] = KeyGeometry(
+        Box(space_x, space_y, space_w, key_h, SPACE_RADIUS), int(key_h * 0.38)
+    )
+
+    # --- finger centers (SPACE excluded) ---
+    acc: Dict[str, List[float]] = {}
+    for ch, kg in keys.items():
+        finger = finger_of.get(ch)
+        if ch != " " and finger:
+            acc.setdefault(finger, []).append(kg.box.center[0])
+    centers = {f: sum(xs) / len(xs) for f, xs in acc.items()}
+
+    # --- legend ---
+    finger_w = 36
+    finger_h = 90
+    nail_w = 26
+    nail_h = 18
+    y = height / 3 + 5.0 * (height / 11)
+
+    legend: List[LegendGeometry] = []
+    for finger, cx in centers.items():
+        x = cx - finger_w / 2
+        nx = x + (finger_w - nail_w) / 2
+        legend.append(
+            LegendGeometry(
+                finger,
+                Box(x, y, finger_w, finger_h, int(finger_w / 2)),
+                Box(nx, y + 16, nail_w, nail_h, int(nail_h / 2)),
+            )
+        )
+
+    return KeyboardGeometry(key_w, key_h, keys, centers, legend)
+
+
+def round_rect_points(box: Box) -> List[float]:
+    """smooth polygon-ის წვეროები მომრგვალებული მართკუთხედისთვის."""
+    x1, y1 = box.x, box.y
+    x2, y2 = box.x + box.w, box.y + box.h
+    r = min(box.r, box.w / 2, box.h / 2)
+    return [
+        x1 + r, y1,
+        x2 - r, y1,
+        x2, y1,
+        x2, y1 + r,
+        x2, y2 - r,
+        x2, y2,
+        x2 - r, y2,
+        x1 + r, y2,
+        x1, y2,
+        x1, y2 - r,
+        x1, y1 + r,
+        x1, y1,
+    ]  # fmt: skip
+
+
+# ======================================================
+#   SCREEN / SENTENCE
+# ======================================================
+def screen_geometry(width: float, height: float) -> ScreenGeometry:
+    """cover-ის და HUD-ის პოზიციები."""
+    return ScreenGeometry(
+        width,
+        height,
+        cover=(0, 0, width, height),
+        cover_text=(width / 2, height / 2),
+        timer=(120, height - 130),
+        score=(width - 120, height - 130),
+        result=(width / 2, height - 70),
+    )
+
+
+def sentence_geometry(width: float, height: float, count: int) -> SentenceGeometry:
+    """
+    წინადადების ასოების განლაგება: ბიჯი — სიგანიდან და ასოების
+    რაოდენობიდან, y და შრიფტი — სიმაღლიდან (როგორც კლავიშებისთვის),
+    შრიფტი შეზღუდულია ბიჯით.
+    """
+    spacing = min(SENTENCE_MAX_SPACING, max(SENTENCE_MIN_SPACING, width * 0.75 / max(count, 1)))
+    start_x = width / 2 - spacing * count / 2
+    font_size = round(min(height * SENTENCE_FONT_RATIO, spacing * SENTENCE_FONT_PER_SPACING))
+    return SentenceGeometry(
+        start_x, spacing, height * SENTENCE_Y_RATIO, max(SENTENCE_MIN_FONT, font_size)
+    )
+
+
+def passage_geometry(width: float, height: float, lines: int = PASSAGE_LINES) -> PassageGeometry:
+    """
+    გრძელი ტექსტის ფანჯარა კლავიატურის ზემოთ: `lines` სტრიქონი,
+    სიგანე — ეკრანის 85% (სვეტები მონოსიგანის შრიფტით).
+    """
+    top = 40.0
+    bottom = height / 3 - 30
+    line_h = max(12.0, (bottom - top) / max(lines, 1))
+    font_size = max(8, int(line_h * 0.55))
+    text_w = width * 0.85
+    cols = max(10, int(text_w / (font_size * PASSAGE_CHAR_ASPECT)))
+    return PassageGeometry((width - text_w) / 2, top, line_h, cols, font_size)
@@ -2,6 +2,10 @@
 # KLAVA — Menu Bar (UI)
 
 import tkinter as tk
+from typing import Callable, Optional, Sequence, Tuple, Union
+
+# (name, title) სია, ან ფუნქცია, რომელიც მას აბრუნებს (იძახება მენიუს პირველ გახსნაზე)
+Layouts = Union[Sequence[Tuple[str, str]], Callable[[], Sequence[Tuple[str, str]]]]
 
 
 class AppMenu:
@@ -10,18 +14,33 @@ class AppMenu:
     Trainer გადასცემს callback-ებს და მენიუს ჩართვა/გამორთვა შეუძლია.
     """
 
-    def __init__(self, root: tk.Tk, on_start, on_exit, on_about):
+    def __init__(
+        self,
+        root: tk.Tk,
+        on_start,
+        on_exit,
+        on_about,
+        layouts: Layouts = (),
+        on_layout: Optional[Callable[[str], object]] = None,
+        current_layout: str = "",
+    ):
         """
         :param root: Tk root ფანჯარა
         :param on_start: Start პუნქტის callback
         :param on_exit: Exit პუნქტის callback
         :param on_about: About პუნქტის callback
+        :param layouts: განლაგებები (name, title) — Layout მენიუსთვის; ფუნქციის
+                        შემთხვევაში იძახება მხოლოდ მენიუს პირველ გახსნაზე
+        :param on_layout: განლაგების არჩევის callback (იღებს name-ს)
+        :param current_layout: მიმდინარე განლაგების name
         """
         self.root = root
         self.menu = tk.Menu(root)
-        self._build(on_start, on_exit, on_about)
+        self.layout_var = tk.StringVar(root, value=current_layout)
+        self._current_layout = current_layout
+        self._build(on_start, on_exit, on_about, layouts, on_layout)
 
-    def _build(self, on_start, on_exit, on_about):
+    def _build(self, on_start, on_exit, on_about, layouts=(), on_layout=None):
         """მენიუს სტრუქტურის აგება"""
         file_menu = tk.Menu(self.menu, tearoff=0)
         file_menu.add_command(label="Start", command=on_start)
@@ -32,8 +51,43 @@ class AppMenu:
         help_menu.add_command(label="About", command=on_about)
 
         self.menu.add_cascade(label="File", menu=file_menu)
+
+        # განლაგებები — radio პუნქტი თითოეულზე (ფუნქციის შემთხვევაში — გახსნისას)
+        if layouts and on_layout is not None:
+            layout_menu = tk.Menu(self.menu, tearoff=0)
+            if callable(layouts):
+                source = layouts
+                filled = []
+
+                def fill():
+                    if not filled:
+                        filled.append(True)
+                        self._fill_layouts(layout_menu, source(), on_layout)
+
+                layout_menu.configure(postcommand=fill)
+            else:
+                self._fill_layouts(layout_menu, layouts, on_layout)
+            self.menu.add_cascade(label="Layout", menu=layout_menu)
+
         self.menu.add_cascade(label="Help", menu=help_menu)
 
+    def _fill_layouts(self, layout_menu, layouts, on_layout):
+        """radio პუნქტები განლაგებებისთვის"""
+        for name, title in layouts:
+            layout_menu.add_radiobutton(
+                label=title,
+                value=name,
+                variable=self.layout_var,
+                command=lambda n=name: self._select_layout(n, on_layout),
+            )
+
+    def _select_layout(self, name, on_layout):
+        """განლაგების არჩევა; თუ Trainer უარს იტყვის, radio ბრუნდება წინაზე"""
+        if on_layout(name):
+            self._current_layout = name
+        else:
+            self.layout_var.set(self._current_layout)
+
     def show(self):
         """მენიუს ჩვენება"""
         self.root.config(menu=self.menu)
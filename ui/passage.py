@@ -0,0 +1,125 @@
+# ui/passage.py
+# KLAVA — Windowed passage view (fixed item pool)
+# ხილული სტრიქონების რაოდენობის item-ები; ტექსტის სიგრძე მათ რაოდენობაზე არ მოქმედებს
+
+from __future__ import annotations
+
+import tkinter as tk
+from typing import List, Sequence, Tuple
+
+from ui.layout import PASSAGE_LINES, PassageGeometry, passage_geometry
+from ui.render import RenderScheduler
+
+PALE = "#cccccc"
+DARK = "#000000"
+
+FONT_FAMILY = "Courier"
+
+
+class PassageView:
+    """
+    გრძელი ტექსტის ფანჯარა: თითო ხილულ სტრიქონზე ორი text item —
+    ღია სრული სტრიქონი და მის თავზე მუქი, უკვე აკრეფილი ნაწილი (prefix).
+
+    - item-ები იქმნება ერთხელ და მხოლოდ ტექსტი იცვლება (recycling)
+    - კურსორი — ღია item-ის `underline` ინდექსი (შრიფტის გაზომვა არ სჭირდება)
+    - კლავიშზე იცვლება მხოლოდ მიმდინარე სტრიქონის prefix და underline
+    """
+
+    TAG = "passage"
+
+    def __init__(
+        self,
+        canvas: tk.Canvas,
+        render: RenderScheduler,
+        width: float,
+        height: float,
+        lines: int = PASSAGE_LINES,
+    ) -> None:
+        self.canvas = canvas
+        self.render = render
+        self.lines = lines
+        self.geometry: PassageGeometry = passage_geometry(width, height, lines)
+        self.visible: bool = False
+
+        # (pale, dark) თითო სტრიქონზე
+        self.rows: List[Tuple[int, int]] = []
+        self._cursor_row: int = -1
+
+        font = (FONT_FAMILY, self.geometry.font_size)
+        for i in range(lines):
+            x, y = self._row_xy(i)
+            pale = canvas.create_text(
+                x, y, text="", anchor="nw", font=font, fill=PALE,
+                state="hidden", tags=(self.TAG,),
+            )  # fmt: skip
+            dark = canvas.create_text(
+                x, y, text="", anchor="nw", font=font, fill=DARK,
+                state="hidden", tags=(self.TAG,),
+            )  # fmt: skip
+            render.known(pale, text="", font=font, underline=-1)
+            render.known(dark, text="", font=font)
+            self.rows.append((pale, dark))
+
+    @property
+    def cols(self) -> int:
+        return self.geometry.cols
+
+    def _row_xy(self, i: int) -> Tuple[float, float]:
+        geo = self.geometry
+        return geo.x, geo.y + i * geo.line_h
+
+    # ======================================================
+    #   ხილვადობა / გეომეტრია
+    # ======================================================
+    def show(self) -> None:
+        if not self.visible:
+            self.canvas.itemconfigure(self.TAG, state="normal")
+            self.visible = True
+
+    def hide(self) -> None:
+        if self.visible:
+            self.canvas.itemconfigure(self.TAG, state="hidden")
+            self.visible = False
+
+    def relayout(self, width: float, height: float) -> bool:
+        """
+        ახალი ზომა: item-ები გადაადგილდება, შრიფტი იცვლება.
+        :return: True — თუ სვეტების რაოდენობა შეიცვალა (საჭიროა rewrap)
+        """
+        old_cols = self.geometry.cols
+        self.geometry = passage_geometry(width, height, self.lines)
+        font = (FONT_FAMILY, self.geometry.font_size)
+        for i, (pale, dark) in enumerate(self.rows):
+            x, y = self._row_xy(i)
+            for item in (pale, dark):
+                self.canvas.coords(item, x, y)
+                self.render.set(item, font=font)
+        return self.geometry.cols != old_cols
+
+    # ======================================================
+    #   ტექსტი
+    # ======================================================
+    def draw(self, lines: Sequence[str], cursor_row: int, col: int) -> None:
+        """
+        ფანჯრის სრული განახლება (სტრიქონზე გადასვლისას):
+        კურსორის ზემოთ — აკრეფილი, ქვემოთ — ღია.
+        """
+        for i, (pale, dark) in enumerate(self.rows):
+            line = lines[i] if i < len(lines) else ""
+            self.render.set(pale, text=line, underline=-1)
+            if i < cursor_row:
+                self.render.set(dark, text=line)
+            elif i > cursor_row:
+                self.render.set(dark, text="")
+        self._cursor_row = cursor_row
+        self.set_cursor(lines[cursor_row] if cursor_row < len(lines) else "", col)
+
+    def set_cursor(self, line: str, col: int) -> None:
+        """მიმდინარე სტრიქონში აკრეფილია `col` სიმბოლო; კურსორი — col-ზე."""
+        row = self._cursor_row
+        if not 0 <= row < len(self.rows):
+            return
+        pale, dark = self.rows[row]
+        self.render.set(dark, text=line[:col])
+        self.render.set(pale, underline=col if col < len(line) else -1)
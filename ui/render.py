@@ -0,0 +1,91 @@
+# ui/render.py
+# KLAVA — Frame-coalesced canvas update scheduler
+# item-ების ცვლილებები გროვდება dirty map-ში და Tk-ს ეგზავნება კადრში ერთხელ
+
+from __future__ import annotations
+
+import tkinter as tk
+from typing import Any, Dict, Optional
+
+
+class RenderScheduler:
+    """
+    Canvas-ის item-ების განახლების გამგზავნი (ერთი კადრი — ერთი flush).
+
+    პასუხისმგებლობა:
+    - `set(item, **opts)` მხოლოდ იმახსოვრებს ცვლილებას (dirty map)
+    - flush ხდება `after_idle`-ზე ან ფიქსირებული სიხშირით (`frame_ms`)
+    - ინახება ბოლოს გაგზავნილი მნიშვნელობები; თუ კადრის ბოლოს მნიშვნელობა
+      არ შეცვლილა (მაგ. set → reset ერთ კადრში), itemconfig არ იგზავნება
+
+    შენიშვნა:
+    - item-ის წაშლისას აუცილებელია `forget(item)` გამოძახება.
+    """
+
+    def __init__(self, canvas: tk.Canvas, frame_ms: Optional[int] = None) -> None:
+        self.canvas = canvas
+        self.frame_ms: Optional[int] = frame_ms
+
+        self._dirty: Dict[int, Dict[str, Any]] = {}
+        self._applied: Dict[int, Dict[str, Any]] = {}
+        self._job: Optional[str] = None
+
+    # ======================================================
+    #   API
+    # ======================================================
+    def known(self, item: int, **options: Any) -> None:
+        """
+        item-ის ცნობილი (უკვე დახატული) მდგომარეობის დარეგისტრირება.
+        გამოიძახება create_* -ის შემდეგ.
+        """
+        self._applied.setdefault(item, {}).update(options)
+
+    def set(self, item: int, **options: Any) -> None:
+        """ცვლილების დაგეგმვა მომდევნო კადრისთვის."""
+        pending = self._dirty.get(item)
+        if pending is None:
+            self._dirty[item] = dict(options)
+        else:
+            pending.update(options)
+        self._schedule()
+
+    def forget(self, item: int) -> None:
+        """წაშლილი item-ის ამოღება ყველა რუკიდან."""
+        self._dirty.pop(item, None)
+        self._applied.pop(item, None)
+
+    def flush(self) -> None:
+        """დაგროვებული ცვლილებების გაგზავნა Tk-ში (თითო item-ზე ერთი itemconfig)."""
+        self._job = None
+        if not self._dirty:
+            return
+
+        dirty, self._dirty = self._dirty, {}
+        for item, options in dirty.items():
+            applied = self._applied.setdefault(item, {})
+            changed = {k: v for k, v in options.items() if applied.get(k) != v}
+            if not changed:
+                continue
+            self.canvas.itemconfig(item, **changed)
+            applied.update(changed)
+
+    def cancel(self) -> None:
+        """დაგეგმილი flush-ის გაუქმება (ცვლილებები რჩება dirty map-ში)."""
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+
+    @property
+    def pending(self) -> bool:
+        return bool(self._dirty)
+
+    # ======================================================
+    #   HELPERS
+    # ======================================================
+    def _schedule(self) -> None:
+        if self._job is not None:
+            return
+        if self.frame_ms:
+            self._job = self.canvas.after(self.frame_ms, self.flush)
+        else:
+            self._job = self.canvas.after_idle(self.flush)
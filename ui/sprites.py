@@ -0,0 +1,153 @@
+# ui/sprites.py
+# KLAVA — Pre-rasterized key sprites (PhotoImage atlas)
+# მომრგვალებული მართკუთხედი იხატება პიქსელებად ერთხელ; მდგომარეობის ცვლა = image swap
+
+from __future__ import annotations
+
+import math
+import tkinter as tk
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+SpriteKey = Tuple[int, int, int, str, str, int]
+Blit = Callable[[Any, Any, int, int], None]
+
+
+def tk_blit(dst: tk.PhotoImage, src: tk.PhotoImage, x: int, y: int) -> None:
+    """`src`-ის გადაკოპირება `dst`-ზე (x, y)-ში; გამჭვირვალე პიქსელები dst-ს არ ცვლის."""
+    dst.tk.call(dst.name, "copy", src.name, "-to", x, y)
+
+
+def _row_inset(y: float, h: int, r: float) -> Optional[float]:
+    """
+    მომრგვალებული მართკუთხედის ჰორიზონტალური შეწევა `y` სტრიქონზე
+    (პიქსელის ცენტრით); None — სტრიქონი ფიგურის გარეთაა.
+    """
+    if y < 0 or y > h:
+        return None
+    dy = max(0.0, r - y, y - (h - r))
+    if dy > r:
+        return None
+    return r - math.sqrt(r * r - dy * dy)
+
+
+def rasterize_round_rect(
+    image: Any,
+    w: int,
+    h: int,
+    r: float,
+    fill: str,
+    outline: str,
+    border: int = 2,
+) -> None:
+    """
+    მომრგვალებული მართკუთხედის დახატვა `image`-ზე (PhotoImage.put).
+
+    ფიგურის გარეთ პიქსელები არ იწერება — PhotoImage-ში ისინი გამჭვირვალეა.
+    შუა ზოლი (კუთხეების გარეშე) ერთნაირია, ამიტომ იწერება ერთი სტრიქონით,
+    რომელსაც Tk თვითონ ამრავლებს (`to=(x1, y1, x2, y2)`).
+    """
+    r = min(r, w / 2, h / 2)
+    ri = max(0.0, r - border)
+    hi = h - 2 * border
+
+    def row(y: int) -> Optional[Tuple[int, str]]:
+        yc = y + 0.5
+        outer = _row_inset(yc, h, r)
+        if outer is None:
+            return None
+        x0 = int(round(outer))
+        x1 = w - x0
+        if x1 <= x0:
+            return None
+
+        inner = _row_inset(yc - border, hi, ri)
+        if inner is None:
+            colors = [outline] * (x1 - x0)
+        else:
+            i0 = max(x0, int(round(border + inner)))
+            i1 = min(x1, w - i0)
+            colors = [outline] * (i0 - x0) + [fill] * max(0, i1 - i0) + [outline] * (x1 - max(i0, i1))
+        return x0, "{" + " ".join(colors) + "}"
+
+    # ზედა და ქვედა კუთხეების ზოლები (+ border) — სტრიქონ-სტრიქონ
+    band = int(math.ceil(max(r, border))) + 1
+    band = min(band, (h + 1) // 2)
+    for y in list(range(band)) + list(range(h - band, h)):
+        line = row(y)
+        if line is not None:
+            image.put(line[1], to=(line[0], y))
+
+    # შუა ზოლი — ერთი put
+    if h - band > band:
+        line = row(band)
+        if line is not None:
+            x0, data = line
+            image.put(data, to=(x0, band, w - x0, h - band))
+
+
+class SpriteAtlas:
+    """
+    key-ების sprite-ების ქეში: (ზომა, რადიუსი, ფერები) → PhotoImage.
+
+    - sprite იხატება პირველი მოთხოვნისას და მერე მხოლოდ ქეშიდან მოდის
+    - `begin(geometry)` — ახალი კლავიატურის ზომა; ძველი sprite-ები იშლება
+      (იგივე ზომაზე ატლასი ხელახლა არ იხატება)
+    - `factory(width, height)` და `blit(dst, src, x, y)` — PhotoImage-ის
+      შექმნა/კოპირება (headless-ში ჩანაცვლებადი)
+    """
+
+    def __init__(
+        self,
+        master: Any = None,
+        factory: Optional[Callable[[int, int], Any]] = None,
+        blit: Optional[Blit] = None,
+    ) -> None:
+        self.factory: Callable[[int, int], Any] = factory or (
+            lambda w, h: tk.PhotoImage(master=master, width=w, height=h)
+        )
+        self.blit: Blit = blit or tk_blit
+        self.geometry: Optional[Hashable] = None
+        self.rasterized: int = 0
+
+        self._sprites: Dict[SpriteKey, Any] = {}
+
+    def begin(self, geometry: Hashable) -> bool:
+        """კლავიატურის გეომეტრიის დაფიქსირება; True — ატლასი გასუფთავდა."""
+        if geometry == self.geometry:
+            return False
+        self.geometry = geometry
+        self._sprites.clear()
+        return True
+
+    def get(self, w: float, h: float, r: float, fill: str, outline: str, border: int = 2) -> Any:
+        key: SpriteKey = (int(round(w)), int(round(h)), int(round(r)), fill, outline, border)
+        image = self._sprites.get(key)
+        if image is None:
+            image = self.factory(key[0], key[1])
+            rasterize_round_rect(image, key[0], key[1], key[2], fill, outline, border)
+            self._sprites[key] = image
+            self.rasterized += 1
+        return image
+
+    def compose(self, placements: List[Tuple[float, float, Any]]) -> Tuple[int, int, Any]:
+        """
+        sprite-ების ერთ სურათში გაერთიანება (სტატიკური ფენა).
+
+        :param placements: (x, y, sprite) — canvas-ის კოორდინატებით
+        :return: (x0, y0, image) — სურათი და მისი ზედა-მარცხენა კუთხე
+        """
+        x0 = int(min(x for x, _, _ in placements))
+        y0 = int(min(y for _, y, _ in placements))
+        x1 = int(max(round(x) + img.width() for x, _, img in placements))
+        y1 = int(max(round(y) + img.height() for _, y, img in placements))
+
+        image = self.factory(x1 - x0, y1 - y0)
+        for x, y, sprite in placements:
+            self.blit(image, sprite, int(round(x)) - x0, int(round(y)) - y0)
+        return x0, y0, image
+
+    def __len__(self) -> int:
+        return len(self._sprites)
+
+    def images(self) -> List[Any]:
+        return list(self._sprites.values())